@@ -1,179 +1,400 @@
-"""
-API FastAPI pour la gestion de l'association Madrassa
-Cette API expose les opérations de gestion via des endpoints REST
-"""
-from __future__ import annotations
-from pathlib import Path
-from typing import List, Dict, Any, Optional
-from fastapi import FastAPI, HTTPException, Query
-
-from storage.json_storage import JSONStorage
-from facades.association_facade import AssociationFacade
-from interfaces.storage_interface import StorageInterface
-
-# Initialisation de FastAPI
-app = FastAPI(
-    title="Madrassa Association Management API",
-    description="API REST pour la gestion de l'association Madrassa",
-    version="1.0.0"
-)
-
-# Initialisation du storage et de la Facade (pattern Facade)
-base_dir = Path(__file__).parent
-data_dir = base_dir / "data"
-storage: StorageInterface = JSONStorage(data_dir)
-facade = AssociationFacade(storage)
-
-
-@app.get("/")
-async def root():
-    """Endpoint racine - retourne des informations sur l'API"""
-    return {
-        "message": "Bienvenue sur l'API de gestion de l'association Madrassa",
-        "version": "1.0.0",
-        "endpoints": {
-            "dashboard": "/dashboard",
-            "members": "/members",
-            "students": "/members/students",
-            "teachers": "/members/teachers",
-            "events": "/events",
-            "subscriptions": "/subscriptions",
-            "donations": "/donations",
-            "docs": "/docs"
-        }
-    }
-
-
-@app.get("/dashboard")
-async def get_dashboard() -> Dict[str, Any]:
-    """Récupère toutes les données pour le tableau de bord"""
-    return facade.get_dashboard_data()
-
-
-@app.get("/statistics")
-async def get_statistics() -> Dict[str, Any]:
-    """Récupère les statistiques globales de l'association (utilise la Facade)"""
-    return facade.get_statistics()
-
-
-# ==================== ENDPOINTS POUR LES MEMBRES ====================
-
-@app.get("/members")
-async def get_all_members(
-    sort_by: Optional[str] = Query(None, description="Critère de tri: name, date, group, status"),
-    reverse: bool = Query(False, description="Trier en ordre décroissant")
-) -> List[Dict[str, Any]]:
-    """
-    Récupère tous les membres (étudiants et professeurs).
-    Utilise le pattern Strategy pour le tri.
-    """
-    return facade.get_all_members(sort_by, reverse)
-
-
-@app.get("/members/students")
-async def get_students(
-    sort_by: Optional[str] = Query(None, description="Critère de tri: name, date, group, status"),
-    reverse: bool = Query(False, description="Trier en ordre décroissant")
-) -> List[Dict[str, Any]]:
-    """
-    Récupère uniquement les étudiants.
-    Utilise le pattern Strategy pour le tri.
-    """
-    return facade.get_students(sort_by, reverse)
-
-
-@app.get("/members/teachers")
-async def get_teachers() -> List[Dict[str, Any]]:
-    """Récupère uniquement les professeurs"""
-    return facade.get_teachers()
-
-
-@app.get("/members/student/{student_id}")
-async def get_student_by_id(student_id: int) -> Dict[str, Any]:
-    """Récupère un étudiant par son ID"""
-    student = facade.get_member_by_id(student_id, "student")
-    if student is None:
-        raise HTTPException(status_code=404, detail=f"Étudiant avec ID {student_id} non trouvé")
-    return student
-
-
-@app.get("/members/teacher/{teacher_id}")
-async def get_teacher_by_id(teacher_id: int) -> Dict[str, Any]:
-    """Récupère un professeur par son ID"""
-    teacher = facade.get_member_by_id(teacher_id, "teacher")
-    if teacher is None:
-        raise HTTPException(status_code=404, detail=f"Professeur avec ID {teacher_id} non trouvé")
-    return teacher
-
-
-# ==================== ENDPOINTS POUR LES ÉVÉNEMENTS ====================
-
-@app.get("/events")
-async def get_all_events() -> List[Dict[str, Any]]:
-    """Récupère tous les événements"""
-    return facade.get_all_events()
-
-
-@app.get("/events/{event_name}")
-async def get_event_by_name(event_name: str) -> Dict[str, Any]:
-    """Récupère un événement par son nom"""
-    event = facade.get_event_by_name(event_name)
-    if event is None:
-        raise HTTPException(status_code=404, detail=f"Événement '{event_name}' non trouvé")
-    return event
-
-
-@app.get("/events/date/{date}")
-async def get_events_by_date(date: str) -> List[Dict[str, Any]]:
-    """Récupère les événements pour une date donnée (format: YYYY-MM-DD)"""
-    events = facade.get_events_by_date(date)
-    return events
-
-
-# ==================== ENDPOINTS POUR LES FINANCES ====================
-
-@app.get("/subscriptions")
-async def get_all_subscriptions() -> List[Dict[str, Any]]:
-    """Récupère tous les abonnements"""
-    return facade.get_all_subscriptions()
-
-
-@app.get("/subscriptions/student/{student_id}")
-async def get_subscriptions_by_student(student_id: int) -> List[Dict[str, Any]]:
-    """Récupère les abonnements d'un étudiant spécifique"""
-    subscriptions = facade.get_subscriptions_by_student(student_id)
-    return subscriptions
-
-
-@app.get("/subscriptions/status/{status}")
-async def get_subscriptions_by_status(status: str) -> List[Dict[str, Any]]:
-    """Récupère les abonnements par statut (paid, unpaid, pending)"""
-    subscriptions = facade.get_subscriptions_by_status(status)
-    return subscriptions
-
-
-@app.get("/subscriptions/total")
-async def get_total_subscriptions(status: Optional[str] = Query(None, description="Filtrer par statut: paid, unpaid, pending")) -> Dict[str, float]:
-    """Calcule le total des abonnements, optionnellement filtré par statut"""
-    try:
-        total = facade.calculate_total_subscriptions(status)
-        return {
-            "total": total,
-            "status": status if status else "all"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
-
-
-@app.get("/donations")
-async def get_all_donations() -> List[Dict[str, Any]]:
-    """Récupère tous les dons"""
-    return facade.get_all_donations()
-
-
-@app.get("/donations/total")
-async def get_total_donations() -> Dict[str, float]:
-    """Calcule le total des dons"""
-    total = facade.calculate_total_donations()
-    return {"total": total}
-
+"""
+API FastAPI pour la gestion de l'association Madrassa
+Cette API expose les opérations de gestion via des endpoints REST
+"""
+from __future__ import annotations
+import base64
+import binascii
+import datetime
+from contextlib import asynccontextmanager
+import functools
+import json
+import os
+from pathlib import Path
+from typing import List, Dict, Any, AsyncIterator, Callable, Optional, TypeVar
+import anyio
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+
+from factories.storage_factory import StorageFactory
+from facades.association_facade import AssociationFacade
+from interfaces.storage_interface import StorageInterface
+from models.records import Record, to_dicts
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Démarrage du serveur : migre une fois les anciens liens "[GROUP_LINK]" avant de servir"""
+    await anyio.to_thread.run_sync(facade.migrate_group_links)
+    yield
+
+
+# Initialisation de FastAPI
+app = FastAPI(
+    title="Madrassa Association Management API",
+    description="API REST pour la gestion de l'association Madrassa",
+    version="1.0.0",
+    lifespan=lifespan,
+)
+
+# Initialisation du storage et de la Facade (pattern Facade)
+base_dir = Path(__file__).parent
+data_dir = base_dir / "data"
+# Backend choisi par MADRASSA_STORAGE / MADRASSA_DB (voir StorageFactory)
+storage: StorageInterface = StorageFactory.create(data_dir)
+facade = AssociationFacade(storage)
+
+# La Facade est synchrone (lecture de fichiers, parsing JSON, tri) : ses appels
+# sont exécutés dans un pool de threads borné pour ne jamais bloquer la boucle
+# d'événements. Taille réglable via MADRASSA_API_THREADS.
+T = TypeVar("T")
+facade_limiter = anyio.CapacityLimiter(int(os.environ.get("MADRASSA_API_THREADS", "8")))
+
+
+def _to_json(value: Any) -> Any:
+    """Convertit les enregistrements retournés par la Facade (models/records.py) en dictionnaires JSON"""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return to_dicts(value)
+    if isinstance(value, dict):
+        return {key: _to_json(item) for key, item in value.items()}
+    return value
+
+
+def _call_json(func: Callable[..., T], *args: Any) -> Any:
+    return _to_json(func(*args))
+
+
+async def _run(func: Callable[..., T], *args: Any) -> Any:
+    """
+    Exécute un appel bloquant de la Facade hors de la boucle d'événements.
+
+    Le résultat est converti en dictionnaires JSON dans le même thread.
+    """
+    return await anyio.to_thread.run_sync(functools.partial(_call_json, func, *args), limiter=facade_limiter)
+
+
+# ==================== PAGINATION ====================
+
+MAX_PAGE_SIZE = 1000
+# Paramètres qui ne changent pas la liste parcourue (exclus de l'empreinte du curseur)
+_PAGE_QUERY_PARAMS = {"limit", "offset", "cursor", "fields"}
+
+
+class PageParams:
+    """
+    Paramètres communs des listes : limit/offset, curseur opaque et projection.
+
+    Le curseur est renvoyé dans l'en-tête X-Next-Cursor quand une page
+    suivante existe. Il encode la position et l'empreinte de la requête
+    (chemin, tri) : le réutiliser sur une autre liste renvoie une erreur 400.
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Nombre maximum d'éléments"),
+        offset: int = Query(0, ge=0, description="Nombre d'éléments à sauter"),
+        cursor: Optional[str] = Query(None, description="Curseur X-Next-Cursor de la page précédente"),
+        fields: Optional[str] = Query(None, description="Champs à retourner, séparés par des virgules"),
+    ) -> None:
+        self._fingerprint = request.url.path + "?" + "&".join(
+            f"{key}={value}" for key, value in sorted(request.query_params.items())
+            if key not in _PAGE_QUERY_PARAMS
+        )
+        self.offset = offset
+        self.limit = limit
+        if cursor is not None:
+            position = self._decode(cursor)
+            self.offset = position["offset"]
+            if self.limit is None:
+                self.limit = position["limit"]
+        self.fields = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+
+    @property
+    def fetch_limit(self) -> Optional[int]:
+        """Un élément de plus que la page : sa présence indique qu'une page suivante existe"""
+        return None if self.limit is None else self.limit + 1
+
+    def finish(self, items: List[Dict[str, Any]], response: Response) -> List[Dict[str, Any]]:
+        """Coupe la page à `limit` éléments et ajoute l'en-tête X-Next-Cursor si besoin"""
+        if self.limit is not None and len(items) > self.limit:
+            items = items[:self.limit]
+            response.headers["X-Next-Cursor"] = self._encode(self.offset + self.limit)
+        return items
+
+    def _encode(self, offset: int) -> str:
+        payload = json.dumps({"offset": offset, "limit": self.limit, "query": self._fingerprint})
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    def _decode(self, cursor: str) -> Dict[str, Any]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            offset, limit = int(position["offset"]), int(position["limit"])
+        except (ValueError, TypeError, KeyError, binascii.Error, UnicodeEncodeError):
+            raise HTTPException(status_code=400, detail="Curseur invalide")
+        if position.get("query") != self._fingerprint or offset < 0 or not 1 <= limit <= MAX_PAGE_SIZE:
+            raise HTTPException(status_code=400, detail="Curseur invalide pour cette requête")
+        return {"offset": offset, "limit": limit}
+
+
+class DateRange:
+    """
+    Filtre commun ?from=YYYY-MM-DD&to=YYYY-MM-DD (bornes incluses, chacune facultative).
+
+    Avec au moins une borne, la liste est réduite aux éléments de
+    l'intervalle, servis par date croissante (date d'inscription pour les
+    membres). Les bornes font partie de l'empreinte du curseur de pagination.
+    """
+
+    def __init__(
+        self,
+        start: Optional[datetime.date] = Query(None, alias="from", description="Date de début incluse (YYYY-MM-DD)"),
+        end: Optional[datetime.date] = Query(None, alias="to", description="Date de fin incluse (YYYY-MM-DD)"),
+    ) -> None:
+        if start is not None and end is not None and start > end:
+            raise HTTPException(status_code=400, detail="'from' doit précéder 'to'")
+        self.start = None if start is None else start.isoformat()
+        self.end = None if end is None else end.isoformat()
+
+
+@app.get("/")
+async def root():
+    """Endpoint racine - retourne des informations sur l'API"""
+    return {
+        "message": "Bienvenue sur l'API de gestion de l'association Madrassa",
+        "version": "1.0.0",
+        "endpoints": {
+            "dashboard": "/dashboard",
+            "members": "/members",
+            "students": "/members/students",
+            "teachers": "/members/teachers",
+            "events": "/events",
+            "attendance": "/events/attendance",
+            "subscriptions": "/subscriptions",
+            "donations": "/donations",
+            "groups": "/groups",
+            "integrity": "/integrity",
+            "docs": "/docs"
+        }
+    }
+
+
+@app.get("/dashboard")
+async def get_dashboard() -> Dict[str, Any]:
+    """Récupère toutes les données pour le tableau de bord"""
+    return await _run(facade.get_dashboard_data)
+
+
+@app.get("/statistics")
+async def get_statistics() -> Dict[str, Any]:
+    """Récupère les statistiques globales de l'association (utilise la Facade)"""
+    return await _run(facade.get_statistics)
+
+
+@app.get("/integrity")
+async def check_integrity() -> Dict[str, Any]:
+    """Références vers des membres supprimés (événements, abonnements, groupes)"""
+    return await _run(facade.check_integrity)
+
+
+# ==================== ENDPOINTS POUR LES MEMBRES ====================
+
+@app.get("/members")
+async def get_all_members(
+    response: Response,
+    sort_by: Optional[str] = Query(None, description="Critère de tri: name, date, group, status"),
+    reverse: bool = Query(False, description="Trier en ordre décroissant"),
+    page: PageParams = Depends(),
+    dates: DateRange = Depends()
+) -> List[Dict[str, Any]]:
+    """
+    Récupère tous les membres (étudiants et professeurs).
+    Utilise le pattern Strategy pour le tri.
+    """
+    members = await _run(facade.get_all_members, sort_by, reverse, page.offset, page.fetch_limit, page.fields,
+                         dates.start, dates.end)
+    return page.finish(members, response)
+
+
+@app.get("/members/students")
+async def get_students(
+    response: Response,
+    sort_by: Optional[str] = Query(None, description="Critère de tri: name, date, group, status"),
+    reverse: bool = Query(False, description="Trier en ordre décroissant"),
+    page: PageParams = Depends(),
+    dates: DateRange = Depends()
+) -> List[Dict[str, Any]]:
+    """
+    Récupère uniquement les étudiants.
+    Utilise le pattern Strategy pour le tri.
+    """
+    students = await _run(facade.get_students, sort_by, reverse, page.offset, page.fetch_limit, page.fields,
+                          dates.start, dates.end)
+    return page.finish(students, response)
+
+
+@app.get("/members/teachers")
+async def get_teachers(response: Response, page: PageParams = Depends(),
+                       dates: DateRange = Depends()) -> List[Dict[str, Any]]:
+    """Récupère uniquement les professeurs"""
+    teachers = await _run(facade.get_teachers, None, False, page.offset, page.fetch_limit, page.fields,
+                          dates.start, dates.end)
+    return page.finish(teachers, response)
+
+
+@app.get("/members/student/{student_id}")
+async def get_student_by_id(student_id: int) -> Dict[str, Any]:
+    """Récupère un étudiant par son ID"""
+    student = await _run(facade.get_member_by_id, student_id, "student")
+    if student is None:
+        raise HTTPException(status_code=404, detail=f"Étudiant avec ID {student_id} non trouvé")
+    return student
+
+
+@app.get("/members/teacher/{teacher_id}")
+async def get_teacher_by_id(teacher_id: int) -> Dict[str, Any]:
+    """Récupère un professeur par son ID"""
+    teacher = await _run(facade.get_member_by_id, teacher_id, "teacher")
+    if teacher is None:
+        raise HTTPException(status_code=404, detail=f"Professeur avec ID {teacher_id} non trouvé")
+    return teacher
+
+
+@app.get("/members/student/{student_id}/events")
+async def get_student_events(student_id: int, response: Response,
+                             page: PageParams = Depends()) -> List[Dict[str, Any]]:
+    """Récupère les événements auxquels participe un étudiant"""
+    if await _run(facade.get_member_by_id, student_id, "student") is None:
+        raise HTTPException(status_code=404, detail=f"Étudiant avec ID {student_id} non trouvé")
+    events = await _run(facade.get_member_events, student_id, "student", page.offset, page.fetch_limit, page.fields)
+    return page.finish(events, response)
+
+
+@app.get("/members/teacher/{teacher_id}/events")
+async def get_teacher_events(teacher_id: int, response: Response,
+                             page: PageParams = Depends()) -> List[Dict[str, Any]]:
+    """Récupère les événements organisés par un professeur"""
+    if await _run(facade.get_member_by_id, teacher_id, "teacher") is None:
+        raise HTTPException(status_code=404, detail=f"Professeur avec ID {teacher_id} non trouvé")
+    events = await _run(facade.get_member_events, teacher_id, "teacher", page.offset, page.fetch_limit, page.fields)
+    return page.finish(events, response)
+
+
+# ==================== ENDPOINTS POUR LES GROUPES ====================
+
+@app.get("/groups")
+async def get_groups() -> List[Dict[str, Any]]:
+    """Récupère les groupes avec les IDs de leurs professeurs et étudiants"""
+    return await _run(facade.get_groups)
+
+
+@app.get("/groups/{group_id}")
+async def get_group(group_id: int) -> Dict[str, Any]:
+    """Récupère un groupe par son numéro"""
+    group = await _run(facade.get_group, group_id)
+    if group is None:
+        raise HTTPException(status_code=404, detail=f"Groupe {group_id} non trouvé")
+    return group
+
+
+# ==================== ENDPOINTS POUR LES ÉVÉNEMENTS ====================
+
+@app.get("/events")
+async def get_all_events(response: Response, page: PageParams = Depends(),
+                         dates: DateRange = Depends()) -> List[Dict[str, Any]]:
+    """Récupère tous les événements"""
+    events = await _run(facade.get_all_events, page.offset, page.fetch_limit, page.fields, dates.start, dates.end)
+    return page.finish(events, response)
+
+
+@app.get("/events/attendance")
+async def get_attendance_counts(response: Response, page: PageParams = Depends()) -> List[Dict[str, Any]]:
+    """Nombre d'organisateurs et de participants de chaque événement"""
+    counts = await _run(facade.get_attendance_counts, page.offset, page.fetch_limit)
+    return page.finish(counts, response)
+
+
+@app.get("/events/{event_name}")
+async def get_event_by_name(event_name: str) -> Dict[str, Any]:
+    """Récupère un événement par son nom"""
+    event = await _run(facade.get_event_by_name, event_name)
+    if event is None:
+        raise HTTPException(status_code=404, detail=f"Événement '{event_name}' non trouvé")
+    return event
+
+
+@app.get("/events/{event_name}/attendance")
+async def get_event_attendance(event_name: str) -> Dict[str, Any]:
+    """Nombre d'organisateurs et de participants d'un événement"""
+    attendance = await _run(facade.get_event_attendance, event_name)
+    if attendance is None:
+        raise HTTPException(status_code=404, detail=f"Événement '{event_name}' non trouvé")
+    return attendance
+
+
+@app.get("/events/date/{date}")
+async def get_events_by_date(date: str) -> List[Dict[str, Any]]:
+    """Récupère les événements pour une date donnée (format: YYYY-MM-DD)"""
+    events = await _run(facade.get_events_by_date, date)
+    return events
+
+
+# ==================== ENDPOINTS POUR LES FINANCES ====================
+
+@app.get("/subscriptions")
+async def get_all_subscriptions(response: Response, page: PageParams = Depends(),
+                                dates: DateRange = Depends()) -> List[Dict[str, Any]]:
+    """Récupère tous les abonnements"""
+    subscriptions = await _run(facade.get_all_subscriptions, page.offset, page.fetch_limit, page.fields, dates.start, dates.end)
+    return page.finish(subscriptions, response)
+
+
+@app.get("/subscriptions/student/{student_id}")
+async def get_subscriptions_by_student(student_id: int) -> List[Dict[str, Any]]:
+    """Récupère les abonnements d'un étudiant spécifique"""
+    subscriptions = await _run(facade.get_subscriptions_by_student, student_id)
+    return subscriptions
+
+
+@app.get("/subscriptions/status/{status}")
+async def get_subscriptions_by_status(status: str) -> List[Dict[str, Any]]:
+    """Récupère les abonnements par statut (paid, unpaid, pending)"""
+    subscriptions = await _run(facade.get_subscriptions_by_status, status)
+    return subscriptions
+
+
+@app.get("/subscriptions/total")
+async def get_total_subscriptions(status: Optional[str] = Query(None, description="Filtrer par statut: paid, unpaid, pending")) -> Dict[str, Any]:
+    """Calcule le total des abonnements, optionnellement filtré par statut"""
+    try:
+        total = await _run(facade.calculate_total_subscriptions, status)
+        return {
+            "total": total,
+            "status": status if status else "all"
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul: {str(e)}")
+
+
+@app.get("/donations")
+async def get_all_donations(response: Response, page: PageParams = Depends(),
+                            dates: DateRange = Depends()) -> List[Dict[str, Any]]:
+    """Récupère tous les dons"""
+    donations = await _run(facade.get_all_donations, page.offset, page.fetch_limit, page.fields, dates.start, dates.end)
+    return page.finish(donations, response)
+
+
+@app.get("/donations/date/{date}")
+async def get_donations_by_date(date: str) -> List[Dict[str, Any]]:
+    """Récupère les dons effectués à une date donnée (format: YYYY-MM-DD)"""
+    donations = await _run(facade.get_donations_by_date, date)
+    return donations
+
+
+@app.get("/donations/total")
+async def get_total_donations() -> Dict[str, float]:
+    """Calcule le total des dons"""
+    total = await _run(facade.calculate_total_donations)
+    return {"total": total}
+
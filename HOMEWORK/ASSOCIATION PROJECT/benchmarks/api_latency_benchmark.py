@@ -0,0 +1,148 @@
+"""
+Benchmark de latence de l'API sous charge concurrente.
+
+Des clients « lourds » appellent /statistics en boucle (chargement et parsing
+de toutes les collections) pendant que des clients « légers » appellent des
+endpoints rapides. On compare les percentiles de latence des clients légers :
+
+- inline : les appels à la Facade s'exécutent dans la boucle d'événements
+  (comportement d'avant, simulé en remplaçant api._run)
+- offload : les appels passent par le pool de threads borné (api._run)
+
+Le serveur uvicorn tourne dans un processus séparé et les clients l'interrogent
+en HTTP réel, comme en production.
+
+Usage :
+    python -m benchmarks.api_latency_benchmark [--members 20000] [--heavy 4] [--light 16] [--duration 5]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+import uvicorn
+
+import api
+from benchmarks.synthetic_data import write_dataset
+from facades.association_facade import AssociationFacade
+from storage.json_storage import JSONStorage
+
+
+async def _inline(func: Callable[..., Any], *args: Any) -> Any:
+    """Ancien comportement : appel bloquant directement dans la boucle"""
+    return func(*args)
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _heavy_client(client: httpx.AsyncClient, stop_at: float) -> None:
+    while time.perf_counter() < stop_at:
+        await client.get("/statistics")
+
+
+async def _light_client(client: httpx.AsyncClient, stop_at: float, latencies: List[float]) -> None:
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        await client.get("/")
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.005)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _run_clients(base_url: str, heavy: int, light: int, duration: float) -> List[float]:
+    latencies: List[float] = []
+    limits = httpx.Limits(max_connections=heavy + light)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        stop_at = time.perf_counter() + duration
+        await asyncio.gather(
+            *(_heavy_client(client, stop_at) for _ in range(heavy)),
+            *(_light_client(client, stop_at, latencies) for _ in range(light)),
+        )
+    return latencies
+
+
+def _serve(data_dir: str, port: int, offload: bool) -> None:
+    """Processus serveur : Facade sur le jeu de données, appels inline ou déportés"""
+    api.facade = AssociationFacade(JSONStorage(Path(data_dir)))
+    if not offload:
+        api._run = _inline
+    uvicorn.run(api.app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def _wait_until_up(port: int) -> None:
+    deadline = time.perf_counter() + 30
+    while time.perf_counter() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/")
+            return
+        except httpx.TransportError:
+            time.sleep(0.05)
+    raise RuntimeError("le serveur de benchmark n'a pas démarré")
+
+
+def _run_scenario(data_dir: Path, offload: bool, heavy: int, light: int, duration: float) -> List[float]:
+    """Démarre uvicorn dans un processus séparé, lance les clients puis arrête le serveur"""
+    port = _free_port()
+    server = multiprocessing.Process(target=_serve, args=(str(data_dir), port, offload), daemon=True)
+    server.start()
+    try:
+        _wait_until_up(port)
+        return asyncio.run(_run_clients(f"http://127.0.0.1:{port}", heavy, light, duration))
+    finally:
+        server.terminate()
+        server.join()
+
+
+def _report(name: str, latencies: List[float]) -> Dict[str, float]:
+    result = {
+        "requests": len(latencies),
+        "p50": _percentile(latencies, 0.50),
+        "p99": _percentile(latencies, 0.99),
+        "mean": statistics.fmean(latencies),
+    }
+    print(f"{name:<8} n={result['requests']:<6} p50={result['p50']:8.1f} ms  "
+          f"p99={result['p99']:8.1f} ms  moyenne={result['mean']:8.1f} ms")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--members", type=int, default=20000)
+    parser.add_argument("--heavy", type=int, default=4)
+    parser.add_argument("--light", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        write_dataset(data_dir, args.members)
+        results = {}
+        for name, offload in (("inline", False), ("offload", True)):
+            latencies = _run_scenario(data_dir, offload, args.heavy, args.light, args.duration)
+            results[name] = _report(name, latencies)
+
+        gain = results["inline"]["p99"] / results["offload"]["p99"]
+        print(f"p99 : {gain:.1f}x plus faible avec le pool de threads")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark du démarrage à froid : fichiers JSON contre instantanés binaires.
+
+Pour chaque taille, écrit `members.json` et `subscriptions.json` (indent=2,
+comme JSONStorage) puis mesure le premier chargement d'une collection par
+une instance neuve de CachedJSONStorage :
+
+- json : sans instantané (parsing du JSON)
+- snapshot : avec un instantané à jour dans .snapshots (storage/snapshot.py)
+
+Usage :
+    python -m benchmarks.snapshot_benchmark [--sizes 10000,100000,1000000] [--repeat 3]
+"""
+from __future__ import annotations
+import argparse
+import gc
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.synthetic_data import make_members, make_subscriptions  # noqa: E402
+from storage.cached_json_storage import CachedJSONStorage  # noqa: E402
+
+
+def _cold_load(factory: Callable[[], CachedJSONStorage], collection: str, repeat: int) -> float:
+    """Médiane (ms) du premier chargement de `collection` par une instance neuve"""
+    timings: List[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        storage = factory()
+        start = time.perf_counter()
+        records = getattr(storage, f"load_{collection}")()
+        timings.append((time.perf_counter() - start) * 1000)
+        del records, storage
+    return statistics.median(timings)
+
+
+def run(size: int, repeat: int) -> List[Dict[str, float]]:
+    data_dir = Path(tempfile.mkdtemp(prefix="madrassa-snapshot-bench-"))
+    snapshot_dir = data_dir / ".snapshots"
+    try:
+        # Une collection à la fois : à 1M d'enregistrements, garder les deux
+        # en mémoire pendant la génération n'apporte rien au benchmark.
+        members = make_members(size)
+        students = sum(1 for m in members if "student_id" in m)
+        (data_dir / "members.json").write_text(json.dumps(members, indent=2, ensure_ascii=False), encoding="utf-8")
+        del members
+        subscriptions = make_subscriptions(size, students)
+        (data_dir / "subscriptions.json").write_text(json.dumps(subscriptions, indent=2, ensure_ascii=False),
+                                                     encoding="utf-8")
+        del subscriptions
+
+        results: List[Dict[str, float]] = []
+        for collection in ("members", "subscriptions"):
+            json_ms = _cold_load(lambda: CachedJSONStorage(data_dir), collection, repeat)
+            # Premier chargement avec instantanés : parsing JSON + génération
+            build_ms = _cold_load(lambda: CachedJSONStorage(data_dir, snapshot_dir=snapshot_dir), collection, 1)
+            snapshot_ms = _cold_load(lambda: CachedJSONStorage(data_dir, snapshot_dir=snapshot_dir), collection, repeat)
+            results.append({
+                "collection": collection,
+                "json_ms": json_ms,
+                "build_ms": build_ms,
+                "snapshot_ms": snapshot_ms,
+                "json_mb": (data_dir / f"{collection}.json").stat().st_size / 1e6,
+                "snapshot_mb": (snapshot_dir / f"{collection}.json.snap").stat().st_size / 1e6,
+            })
+        return results
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,1000000",
+                        help="Nombres d'enregistrements par collection, séparés par des virgules")
+    parser.add_argument("--repeat", type=int, default=3, help="Chargements mesurés par configuration (médiane)")
+    args = parser.parse_args()
+
+    print(f"{'records':>9} {'collection':<14} {'json':>10} {'snapshot':>10} {'gain':>6} "
+          f"{'1re gén.':>10} {'json MB':>8} {'snap MB':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        for r in run(size, args.repeat):
+            print(f"{size:>9} {r['collection']:<14} {r['json_ms']:>8.1f}ms {r['snapshot_ms']:>8.1f}ms "
+                  f"{r['json_ms'] / r['snapshot_ms']:>5.1f}x {r['build_ms']:>8.1f}ms "
+                  f"{r['json_mb']:>8.1f} {r['snapshot_mb']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
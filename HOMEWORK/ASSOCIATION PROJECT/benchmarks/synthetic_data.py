@@ -0,0 +1,114 @@
+"""Génération de jeux de données synthétiques pour les benchmarks"""
+from __future__ import annotations
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, List
+
+STATUSES = ["Paid", "Pending", "Unpaid"]
+SKILLS = ["Hifz", "Tajwid", "Makharij", "Lecture", "Fiqh", "Arabe"]
+INTERESTS = ["Tafsir", "Hadith", "Memorisation", "Sira", "Tajwid"]
+PURPOSES = ["Zakat", "Library", "Sadaqa", "Ramadan"]
+SOURCES = ["Student", "External", "Parent"]
+
+
+def _date(rng: random.Random) -> str:
+    return f"{rng.randint(2019, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+
+
+def make_members(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Crée `count` membres, dont environ 5 % d'enseignants"""
+    rng = random.Random(seed)
+    members: List[Dict[str, Any]] = []
+    teacher_count = max(1, count // 20)
+    for i in range(1, count - teacher_count + 1):
+        members.append({
+            "student_id": i,
+            "full_name": f"Student {i:06d}",
+            "email": f"student{i}@example.com",
+            "phone": f"0551{i:06d}",
+            "address": f"Rue {rng.randint(1, 300)}",
+            "join_date": _date(rng),
+            "groupe": rng.choice([None, 1, 2, 3, 4, 5, 6]),
+            "subscription_status": rng.choice(STATUSES),
+            "skills": rng.sample(SKILLS, 2),
+            "interests": rng.sample(INTERESTS, 2),
+        })
+    for i in range(1, teacher_count + 1):
+        members.append({
+            "teacher_id": i,
+            "full_name": f"Teacher {i:04d}",
+            "email": f"teacher{i}@example.com",
+            "phone": f"0661{i:06d}",
+            "address": f"Rue {rng.randint(1, 300)}",
+            "join_date": _date(rng),
+            "skills": rng.sample(SKILLS, 2),
+            "interests": rng.sample(INTERESTS, 1),
+        })
+    return members
+
+
+def make_subscriptions(count: int, student_count: int, seed: int = 43) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    subscriptions: List[Dict[str, Any]] = []
+    for _ in range(count):
+        kind = rng.choice(["monthly", "annual"])
+        sub: Dict[str, Any] = {
+            "student_id": rng.randint(1, max(1, student_count)),
+            "amount": rng.choice([1800, 2000, 15000]),
+            "date": _date(rng),
+            "status": rng.choice(["paid", "unpaid", "pending"]),
+            "kind": kind,
+        }
+        if kind == "monthly":
+            sub["months"] = 1
+        else:
+            sub["year"] = int(sub["date"][:4])
+            sub["discount_rate"] = 0.1
+        subscriptions.append(sub)
+    return subscriptions
+
+
+def make_donations(count: int, seed: int = 44) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "donor_name": f"Donor {rng.randint(1, 5000)}",
+            "source": rng.choice(SOURCES),
+            "amount": float(rng.randint(10, 20000)),
+            "date": _date(rng),
+            "purpose": rng.choice(PURPOSES),
+            "note": "",
+        }
+        for _ in range(count)
+    ]
+
+
+def make_events(count: int, student_count: int, teacher_count: int, seed: int = 45) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "event_name": f"Event {i}",
+            "description": "Synthetic event",
+            "event_date": _date(rng),
+            "organizer_ids": rng.sample(range(1, teacher_count + 1), min(2, teacher_count)),
+            "participant_ids": rng.sample(range(1, student_count + 1), min(20, student_count)),
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def write_dataset(data_dir: Path, members: int, subscriptions: int | None = None) -> None:
+    """Écrit les quatre fichiers JSON (indent=2, comme JSONStorage) dans `data_dir`"""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    member_rows = make_members(members)
+    student_count = sum(1 for m in member_rows if "student_id" in m)
+    teacher_count = len(member_rows) - student_count
+    collections = {
+        "members.json": member_rows,
+        "events.json": make_events(max(1, members // 100), student_count, teacher_count),
+        "subscriptions.json": make_subscriptions(subscriptions if subscriptions is not None else members, student_count),
+        "donations.json": make_donations(max(1, members // 10)),
+    }
+    for filename, rows in collections.items():
+        (data_dir / filename).write_text(json.dumps(rows, indent=2, ensure_ascii=False), encoding="utf-8")
@@ -1,2 +1,2 @@
-# Controllers package
-
+# Controllers package
+
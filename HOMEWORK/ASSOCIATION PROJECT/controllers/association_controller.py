@@ -1,44 +1,121 @@
-from __future__ import annotations
-from typing import Any, Dict
-from interfaces.storage_interface import StorageInterface
-from controllers.member_controller import MemberController
-from controllers.event_controller import EventController
-from controllers.finance_controller import FinanceController
-from observers.data_observer import Observer
-
-
-class AssociationController:
-    """Contrôleur principal qui coordonne toutes les opérations de l'association"""
-    
-    def __init__(self, storage: StorageInterface) -> None:
-        self._storage = storage
-        self._member_controller = MemberController(storage)
-        self._event_controller = EventController(storage)
-        self._finance_controller = FinanceController(storage)
-
-    def attach_observer(self, observer: Observer) -> None:
-        self._member_controller.attach(observer)
-        self._event_controller.attach(observer)
-        self._finance_controller.attach(observer)
-    
-    def get_dashboard_data(self) -> Dict[str, Any]:
-        """Récupère toutes les données pour le tableau de bord"""
-        return {
-            "members": self._member_controller.get_all_members(),
-            "events": self._event_controller.get_all_events(),
-            "subscriptions": self._finance_controller.get_all_subscriptions(),
-            "donations": self._finance_controller.get_all_donations(),
-        }
-    
-    def get_member_controller(self) -> MemberController:
-        """Retourne le contrôleur des membres"""
-        return self._member_controller
-    
-    def get_event_controller(self) -> EventController:
-        """Retourne le contrôleur des événements"""
-        return self._event_controller
-    
-    def get_finance_controller(self) -> FinanceController:
-        """Retourne le contrôleur des finances"""
-        return self._finance_controller
-
+from __future__ import annotations
+from typing import Any, Dict
+from interfaces.storage_interface import StorageInterface
+from controllers.member_controller import MemberController
+from controllers.event_controller import EventController
+from controllers.finance_controller import FinanceController
+from controllers.group_controller import GroupController
+from observers.data_observer import Observer
+from storage.unit_of_work import UnitOfWork
+
+
+class AssociationController:
+    """Contrôleur principal qui coordonne toutes les opérations de l'association"""
+    
+    def __init__(self, storage: StorageInterface) -> None:
+        self._storage = storage
+        self._member_controller = MemberController(storage)
+        self._event_controller = EventController(storage)
+        self._finance_controller = FinanceController(storage)
+        self._group_controller = GroupController(storage, self._member_controller)
+
+    def attach_observer(self, observer: Observer) -> None:
+        self._member_controller.attach(observer)
+        self._event_controller.attach(observer)
+        self._finance_controller.attach(observer)
+        self._group_controller.attach(observer)
+    
+    def migrate_group_links(self) -> int:
+        """
+        Migre les anciens liens enseignant-groupe stockés en événements "[GROUP_LINK]".
+
+        Étape explicite, appelée une fois au lancement (run_gui.py, run_api.py) :
+        construire le contrôleur ne modifie jamais les données.
+
+        Returns:
+            Nombre d'événements migrés
+        """
+        return self._group_controller.migrate_group_links()
+
+    def get_dashboard_data(self) -> Dict[str, Any]:
+        """Récupère toutes les données pour le tableau de bord"""
+        return {
+            "members": self._member_controller.get_all_members(),
+            "events": self._event_controller.get_all_events(),
+            "subscriptions": self._finance_controller.get_all_subscriptions(),
+            "donations": self._finance_controller.get_all_donations(),
+            "groups": self._group_controller.get_groups(),
+        }
+    
+    def move_group(self, old_group: int, new_group: int) -> Dict[str, int]:
+        """
+        Déplace toute une classe : ses étudiants et ses liens enseignant-groupe.
+        
+        Membres et groupes sont modifiés dans une même unité de travail :
+        une écriture par fichier, et rien n'est écrit en cas d'erreur.
+        
+        Returns:
+            Nombre d'étudiants déplacés et de liens enseignant-groupe modifiés
+        """
+        with UnitOfWork(self._storage, "members", "groups") as uow:
+            student_ids = [
+                m["student_id"] for m in uow.records("members")
+                if "student_id" in m and m.get("groupe") == old_group
+            ]
+            students = self._member_controller.regroup_students(student_ids, new_group, uow)
+            links = self._group_controller.move_group(old_group, new_group, uow)
+        return {"students": students, "links": links}
+    
+    def delete_member(self, member_id: int, member_type: str = "student", cascade: bool = False) -> Dict[str, int] | None:
+        """
+        Supprime un membre, et avec `cascade` les références qui le citent.
+        
+        En cascade, l'étudiant est retiré des participants des événements et
+        ses abonnements sont supprimés ; l'enseignant est retiré des
+        organisateurs et de ses groupes. Les enregistrements concernés sont
+        trouvés par les index (participation, abonnements par étudiant,
+        groupes) : seules les collections qui le citent sont chargées et
+        réécrites, avec les membres, dans une même unité de travail.
+        
+        Returns:
+            Nombre de membres, d'événements, d'abonnements et de liens de
+            groupe modifiés ; None si le membre n'existe pas
+        """
+        if not cascade or member_type not in ("student", "teacher"):
+            if not self._member_controller.delete_member(member_id, member_type):
+                return None
+            return {"members": 1, "events": 0, "subscriptions": 0, "groups": 0}
+        
+        if self._member_controller.get_member_by_id(member_id, member_type) is None:
+            return None
+        with UnitOfWork(self._storage, "members", "events", "subscriptions", "groups") as uow:
+            events = self._event_controller.remove_member_references(member_id, member_type, uow)
+            if member_type == "student":
+                subscriptions = self._finance_controller.delete_student_subscriptions(member_id, uow)
+                groups = 0
+            else:
+                subscriptions = 0
+                groups = self._group_controller.remove_teacher_references(member_id, uow)
+            # Membre supprimé en dernier : à sa notification, les références sont déjà à jour
+            # dans les caches des autres contrôleurs
+            if not self._member_controller.delete_member(member_id, member_type, uow):
+                uow.rollback()
+                return None
+        return {"members": 1, "events": events, "subscriptions": subscriptions, "groups": groups}
+    
+    def get_member_controller(self) -> MemberController:
+        """Retourne le contrôleur des membres"""
+        return self._member_controller
+    
+    def get_event_controller(self) -> EventController:
+        """Retourne le contrôleur des événements"""
+        return self._event_controller
+    
+    def get_finance_controller(self) -> FinanceController:
+        """Retourne le contrôleur des finances"""
+        return self._finance_controller
+    
+    def get_group_controller(self) -> GroupController:
+        """Retourne le contrôleur des groupes"""
+        return self._group_controller
+
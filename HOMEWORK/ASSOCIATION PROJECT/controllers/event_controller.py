@@ -1,49 +1,174 @@
-from __future__ import annotations
-from typing import List, Dict, Any
-from interfaces.storage_interface import StorageInterface
-from observers.data_observer import Subject
-
-
-class EventController(Subject):
-    """Controller pour gérer les opérations sur les événements"""
-    
-    def __init__(self, storage: StorageInterface) -> None:
-        super().__init__()
-        self._storage = storage
-        
-    def get_all_events(self) -> List[Dict[str, Any]]:
-        """Récupère tous les événements depuis le storage"""
-        return self._storage.load_events()
-    
-    def get_event_by_name(self, event_name: str) -> Dict[str, Any] | None:
-        """Récupère un événement par son nom"""
-        events = self.get_all_events()
-        for event in events:
-            if event.get("event_name") == event_name:
-                return event
-        return None
-    
-    def get_events_by_date(self, date: str) -> List[Dict[str, Any]]:
-        """Récupère les événements pour une date donnée"""
-        events = self.get_all_events()
-        return [e for e in events if e.get("event_date") == date]
-    
-    def add_event(self, event: Dict[str, Any]) -> None:
-        """Ajoute un nouvel événement"""
-        events = self.get_all_events()
-        events.append(event)
-        self._storage.save_events(events)
-        self.notify("event_added", event)
-    
-    def delete_event(self, event_name: str) -> bool:
-        """Supprime un événement par son nom"""
-        events = self.get_all_events()
-        original_count = len(events)
-        events = [e for e in events if e.get("event_name") != event_name]
-        
-        if len(events) < original_count:
-            self._storage.save_events(events)
-            self.notify("event_deleted", {"event_name": event_name})
-            return True
-        return False
-
+from __future__ import annotations
+import threading
+from typing import Callable, List, Dict, Any
+from interfaces.storage_interface import StorageInterface
+from interfaces.queryable_storage import QueryableStorage
+from managers.participation_index import ParticipationIndex, member_key
+from managers.record_cache import RecordCache
+from models.records import EventRecord, decode_event
+from observers.data_observer import Subject
+from storage.unit_of_work import UnitOfWork
+from utils.pagination import paginate, project
+
+
+class EventController(Subject):
+    """Controller pour gérer les opérations sur les événements"""
+    
+    def __init__(self, storage: StorageInterface) -> None:
+        super().__init__()
+        self._storage = storage
+        # Événements décodés en EventRecord, une fois par version
+        self._records = RecordCache(storage, "events")
+        # Participation (membre -> événements, effectifs) et version des événements indexés
+        self._participation: ParticipationIndex | None = None
+        self._participation_version = 0
+        self._participation_lock = threading.Lock()
+        
+    def get_all_events(self, offset: int = 0, limit: int | None = None, fields: List[str] | None = None,
+                       start: str | None = None, end: str | None = None) -> List[EventRecord]:
+        """
+        Récupère les événements (tous, ou une page réduite aux champs demandés).
+        
+        Avec au moins une borne start / end (ISO, incluses), seuls les
+        événements de l'intervalle sont retournés, par date croissante.
+        """
+        if start is not None or end is not None:
+            events = paginate(self._records.between(start, end), offset, limit)
+        elif offset or limit is not None:
+            events = self._records.decode(self._storage.load_page("events", offset, limit))
+        else:
+            events = list(self._records.records())
+        return project(events, fields)
+    
+    def get_event_by_name(self, event_name: str) -> EventRecord | None:
+        """Récupère un événement par son nom"""
+        for event in self._records.records():
+            if event.event_name == event_name:
+                return event
+        return None
+    
+    def get_events_by_date(self, date: str) -> List[EventRecord]:
+        """Récupère les événements pour une date donnée"""
+        if isinstance(self._storage, QueryableStorage):
+            return self._records.decode(self._storage.find_events_by_date(date))
+        return self._records.between(date, date)
+    
+    def get_events_for_student(self, student_id: Any, offset: int = 0, limit: int | None = None,
+                               fields: List[str] | None = None) -> List[EventRecord]:
+        """Événements auxquels participe un étudiant (participant_ids), sans parcourir les événements"""
+        return project(paginate(self._participation_index().events_for_student(student_id), offset, limit), fields)
+    
+    def get_events_for_teacher(self, teacher_id: Any, offset: int = 0, limit: int | None = None,
+                               fields: List[str] | None = None) -> List[EventRecord]:
+        """Événements organisés par un enseignant (organizer_ids), sans parcourir les événements"""
+        return project(paginate(self._participation_index().events_for_teacher(teacher_id), offset, limit), fields)
+    
+    def get_attendance(self, event_name: str) -> Dict[str, Any] | None:
+        """Nombre d'organisateurs et de participants d'un événement (None s'il n'existe pas)"""
+        return self._participation_index().attendance(event_name)
+    
+    def get_attendance_counts(self, offset: int = 0, limit: int | None = None) -> List[Dict[str, Any]]:
+        """Effectifs (organisateurs, participants) de tous les événements"""
+        return paginate(self._participation_index().attendance_counts(), offset, limit)
+    
+    def add_event(self, event: Dict[str, Any]) -> None:
+        """Ajoute un nouvel événement"""
+        record = decode_event(event)
+        self._storage.append_event(event)
+        self._records.append(record)
+        self._update_participation(lambda index: index.add(record))
+        self.notify("event_added", event)
+    
+    def delete_event(self, event_name: str) -> bool:
+        """Supprime un événement par son nom"""
+        def delete() -> bool:
+            events = self._storage.load_events()
+            original_count = len(events)
+            # Même nom que EventRecord.event_name (anciens événements à "name" compris)
+            events = [e for e in events if e.get("event_name", e.get("name", "")) != event_name]
+            if len(events) == original_count:
+                return False
+            self._storage.save_events(events)
+            return True
+
+        if self._storage.run_locked("events", delete):
+            self._records.remove(lambda event: event.event_name == event_name)
+            self._update_participation(lambda index: index.remove(event_name))
+            self.notify("event_deleted", {"event_name": event_name})
+            return True
+        return False
+    
+    def remove_member_references(self, member_id: Any, member_type: str, uow: UnitOfWork) -> int:
+        """
+        Retire un membre supprimé des événements qui le citent (suppression en cascade).
+        
+        Les événements concernés sont trouvés par l'index de participation :
+        seuls ceux-là sont remplacés, et sans événement concerné la
+        collection n'est ni chargée ni réécrite.
+        
+        Args:
+            member_type: "student" (participant_ids) ou "teacher" (organizer_ids)
+            uow: Unité de travail en cours, déclarant "events"
+        
+        Returns:
+            Nombre d'événements modifiés
+        """
+        index = self._participation_index()
+        if member_type == "student":
+            ids, fields = "participant_ids", ("participant_ids", "participants_ids")
+            names = {event.event_name for event in index.events_for_student(member_id)}
+        else:
+            ids, fields = "organizer_ids", ("organizer_ids",)
+            names = {event.event_name for event in index.events_for_teacher(member_id)}
+        if not names:
+            return 0
+        key = member_key(member_id)
+
+        def cites(event: Any) -> bool:
+            # Nom d'abord (test d'ensemble) : seuls les événements indexés sont décodés
+            return (event.get("event_name", event.get("name", "")) in names
+                    and key in map(member_key, getattr(decode_event(event), ids)))
+
+        def without_member(event: Dict[str, Any]) -> Dict[str, Any]:
+            # Ancien champ "participants_ids" compris : il sert de repli quand participant_ids est vide
+            return {f: [i for i in event[f] if member_key(i) != key] for f in fields if event.get(f)}
+
+        updated = [decode_event(event) for event in uow.update("events", cites, without_member)]
+        if updated:
+            def after_commit() -> None:
+                replaced = self._records.replace(cites, updated)
+                self._update_participation(
+                    lambda index: all(index.replace(old, new) for old, new in replaced) if replaced else False
+                )
+                self.notify("event_updated", {"member_id": member_id, "member_type": member_type,
+                                              "count": len(updated)})
+            uow.on_commit(after_commit)
+        return len(updated)
+    
+    # ==================== INDEX DE PARTICIPATION ====================
+    
+    def _participation_index(self) -> ParticipationIndex:
+        """Index de participation, reconstruit si la collection a changé (voir MemberController._member_index)"""
+        with self._participation_lock:
+            if self._participation is not None and self._participation_version == self._storage.get_version("events"):
+                return self._participation
+        with self._storage.lock("events"):
+            version = self._storage.get_version("events")
+            index = ParticipationIndex(self._records.records())
+        with self._participation_lock:
+            self._participation, self._participation_version = index, version
+        return index
+    
+    def _update_participation(self, apply: Callable[[ParticipationIndex], None] | None) -> None:
+        """Reporte sur l'index une écriture de ce contrôleur, ou l'invalide (voir MemberController._update_index)"""
+        with self._participation_lock:
+            if self._participation is None:
+                return
+            current = self._storage.get_version("events")
+            # apply retourne False quand il ne peut pas reporter l'écriture : l'index est alors invalidé
+            if apply is not None and (current == self._participation_version + 1
+                                      or current == self._participation_version == 0) \
+                    and apply(self._participation) is not False:
+                self._participation_version = current
+            else:
+                self._participation = None
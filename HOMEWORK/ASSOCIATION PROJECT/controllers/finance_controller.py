@@ -1,94 +1,257 @@
-from __future__ import annotations
-from typing import List, Dict, Any
-from interfaces.storage_interface import StorageInterface
-from managers.finance_manager import FinanceManager
-from observers.data_observer import Subject
-
-
-class FinanceController(Subject):
-    """Controller pour gérer les opérations financières (abonnements, dons)"""
-    
-    def __init__(self, storage: StorageInterface) -> None:
-        super().__init__()
-        self._storage = storage
-        self._finance_manager = FinanceManager()
-        
-    def get_all_subscriptions(self) -> List[Dict[str, Any]]:
-        """Récupère tous les abonnements"""
-        return self._storage.load_subscriptions()
-    
-    def get_all_donations(self) -> List[Dict[str, Any]]:
-        """Récupère tous les dons"""
-        return self._storage.load_donations()
-    
-    def get_subscriptions_by_student(self, student_id: int) -> List[Dict[str, Any]]:
-        """Récupère les abonnements d'un étudiant"""
-        subscriptions = self.get_all_subscriptions()
-        return [s for s in subscriptions if s.get("student_id") == student_id]
-    
-    def get_subscriptions_by_status(self, status: str) -> List[Dict[str, Any]]:
-        """Récupère les abonnements par statut (paid, unpaid, pending)"""
-        subscriptions = self.get_all_subscriptions()
-        return [s for s in subscriptions if s.get("status", "").lower() == status.lower()]
-    
-    def calculate_total_donations(self) -> float:
-        """Calcule le total des dons"""
-        donations = self.get_all_donations()
-        total = 0.0
-        for donation in donations:
-            total += float(donation.get("amount", 0.0))
-        return total
-    
-    def calculate_total_subscriptions(self, status: str | None = None) -> float:
-        """Calcule le total des abonnements, optionnellement filtré par statut"""
-        subscriptions = self.get_all_subscriptions()
-        if status:
-            subscriptions = [s for s in subscriptions if s.get("status", "").lower() == status.lower()]
-        
-        total = 0.0
-        for subscription in subscriptions:
-            total += float(subscription.get("amount", 0.0))
-        return total
-    
-    def add_subscription(self, subscription: Dict[str, Any]) -> None:
-        """Ajoute un nouvel abonnement"""
-        subscriptions = self.get_all_subscriptions()
-        subscriptions.append(subscription)
-        self._storage.save_subscriptions(subscriptions)
-        self.notify("subscription_added", subscription)
-    
-    def delete_subscription(self, student_id: int, date: str) -> bool:
-        """Supprime un abonnement par student_id et date"""
-        subscriptions = self.get_all_subscriptions()
-        original_count = len(subscriptions)
-        subscriptions = [s for s in subscriptions 
-                        if not (s.get("student_id") == student_id and s.get("date") == date)]
-        
-        if len(subscriptions) < original_count:
-            self._storage.save_subscriptions(subscriptions)
-            self.notify("subscription_deleted", {"student_id": student_id, "date": date})
-            return True
-        return False
-    
-    def add_donation(self, donation: Dict[str, Any]) -> None:
-        """Ajoute un nouveau don"""
-        donations = self.get_all_donations()
-        donations.append(donation)
-        self._storage.save_donations(donations)
-        self.notify("donation_added", donation)
-    
-    def delete_donation(self, donor_name: str, date: str, amount: float) -> bool:
-        """Supprime un don par nom du donateur, date et montant"""
-        donations = self.get_all_donations()
-        original_count = len(donations)
-        donations = [d for d in donations 
-                    if not (d.get("donor_name") == donor_name 
-                           and d.get("date") == date 
-                           and float(d.get("amount", 0)) == amount)]
-        
-        if len(donations) < original_count:
-            self._storage.save_donations(donations)
-            self.notify("donation_deleted", {"donor_name": donor_name, "date": date, "amount": amount})
-            return True
-        return False
-
+from __future__ import annotations
+import threading
+from operator import attrgetter
+from typing import Callable, List, Dict, Any
+from interfaces.storage_interface import StorageInterface
+from interfaces.queryable_storage import QueryableStorage
+from managers.finance_columns import FinanceColumns
+from managers.finance_manager import FinanceManager
+from managers.participation_index import member_key
+from managers.record_cache import RecordCache
+from models.records import DonationRecord, SubscriptionRecord, amount_of, iso_day
+from observers.data_observer import Subject
+from storage.unit_of_work import UnitOfWork
+from utils.pagination import paginate, project
+
+
+class FinanceController(Subject):
+    """Controller pour gérer les opérations financières (abonnements, dons)"""
+    
+    def __init__(self, storage: StorageInterface) -> None:
+        super().__init__()
+        self._storage = storage
+        self._finance_manager = FinanceManager()
+        # Abonnements et dons décodés (SubscriptionRecord / DonationRecord), une fois par version ;
+        # abonnements indexés par étudiant
+        self._records: Dict[str, RecordCache] = {
+            "subscriptions": RecordCache(storage, "subscriptions", keys={"student": _student_key}),
+            "donations": RecordCache(storage, "donations"),
+        }
+        # Colonnes (montants, dates, statuts...) par collection et version du storage correspondante
+        self._columns: Dict[str, FinanceColumns] = {}
+        self._columns_versions: Dict[str, int] = {}
+        self._columns_lock = threading.Lock()
+        
+    def get_all_subscriptions(self, offset: int = 0, limit: int | None = None,
+                              fields: List[str] | None = None, start: str | None = None,
+                              end: str | None = None) -> List[SubscriptionRecord]:
+        """Récupère les abonnements (tous, une page, ou ceux datés entre start et end), réduits aux champs demandés"""
+        return project(self._load("subscriptions", offset, limit, start, end), fields)
+    
+    def get_all_donations(self, offset: int = 0, limit: int | None = None,
+                          fields: List[str] | None = None, start: str | None = None,
+                          end: str | None = None) -> List[DonationRecord]:
+        """Récupère les dons (tous, une page, ou ceux datés entre start et end), réduits aux champs demandés"""
+        return project(self._load("donations", offset, limit, start, end), fields)
+    
+    def _load(self, collection: str, offset: int, limit: int | None,
+              start: str | None = None, end: str | None = None) -> List[Any]:
+        """Collection décodée complète (copie du cache), une page, ou un intervalle de dates par date croissante"""
+        if start is not None or end is not None:
+            return paginate(self._between(collection, start, end), offset, limit)
+        if offset or limit is not None:
+            return self._records[collection].decode(self._storage.load_page(collection, offset, limit))
+        return list(self._records[collection].records())
+    
+    def get_subscriptions_by_student(self, student_id: int) -> List[SubscriptionRecord]:
+        """Récupère les abonnements d'un étudiant"""
+        records = self._records["subscriptions"]
+        if isinstance(self._storage, QueryableStorage):
+            return records.decode(self._storage.find_subscriptions_by_student(student_id))
+        return records.find("student", member_key(student_id))
+    
+    def get_subscriptions_by_status(self, status: str) -> List[SubscriptionRecord]:
+        """Récupère les abonnements par statut (paid, unpaid, pending)"""
+        records = self._records["subscriptions"]
+        if isinstance(self._storage, QueryableStorage):
+            return records.decode(self._storage.find_subscriptions_by_status(status))
+        status = status.lower()
+        return [s for s in records.records() if str(s.status).lower() == status]
+    
+    def get_donations_by_date(self, date: str) -> List[DonationRecord]:
+        """Récupère les dons effectués à une date donnée"""
+        if isinstance(self._storage, QueryableStorage):
+            return self._records["donations"].decode(self._storage.find_donations_by_date(date))
+        return self._records["donations"].between(date, date)
+    
+    def get_subscriptions_between(self, start: str | None = None, end: str | None = None) -> List[SubscriptionRecord]:
+        """Récupère les abonnements datés entre start et end (ISO, bornes incluses)"""
+        return self._between("subscriptions", start, end)
+    
+    def get_donations_between(self, start: str | None = None, end: str | None = None) -> List[DonationRecord]:
+        """Récupère les dons datés entre start et end (ISO, bornes incluses)"""
+        return self._between("donations", start, end)
+    
+    def _between(self, collection: str, start: str | None, end: str | None) -> List[Any]:
+        """
+        Enregistrements datés entre start et end, par date croissante.
+        
+        Un storage requêtable filtre lui-même (index SQL sur la date) ; sinon
+        l'intervalle est trouvé par bisection dans l'index des dates du cache.
+        """
+        if isinstance(self._storage, QueryableStorage):
+            load = getattr(self._storage, f"load_{collection}_between")
+            return sorted(self._records[collection].decode(load(start, end)), key=attrgetter("ordinal"))
+        return self._records[collection].between(start, end)
+    
+    def calculate_total_donations(self) -> float:
+        """Calcule le total des dons"""
+        return self._sum_columns("donations")
+    
+    def calculate_total_subscriptions(self, status: str | None = None) -> float:
+        """Calcule le total des abonnements, optionnellement filtré par statut"""
+        return self._sum_columns("subscriptions", status=status) if status else self._sum_columns("subscriptions")
+    
+    def add_subscription(self, subscription: Dict[str, Any]) -> None:
+        """Ajoute un nouvel abonnement (ValueError sans rien écrire si le montant est invalide)"""
+        amount_of(subscription)
+        self._storage.append_subscription(subscription)
+        record = self._records["subscriptions"].decode([subscription])[0]
+        self._update_columns("subscriptions", lambda columns: columns.append(record))
+        self._records["subscriptions"].append(record)
+        self.notify("subscription_added", subscription)
+    
+    def delete_subscription(self, student_id: int, date: str) -> bool:
+        """
+        Supprime un abonnement par student_id et date (date comparée telle quelle).
+
+        Pour un jour "YYYY-MM-DD", seule la période de cette date est relue et
+        réécrite ; toute autre date (heure, mois non complété...) passe par un
+        parcours complet de la collection.
+        """
+        def delete() -> bool:
+            ranged = _is_day(date)
+            if ranged:
+                subscriptions = self._storage.load_subscriptions_between(date, date)
+            else:
+                subscriptions = self._storage.load_subscriptions()
+            original_count = len(subscriptions)
+            subscriptions = [s for s in subscriptions
+                            if not (s.get("student_id") == student_id and s.get("date") == date)]
+            if len(subscriptions) == original_count:
+                return False
+            if ranged:
+                self._storage.save_subscriptions_between(date, date, subscriptions)
+            else:
+                self._storage.save_subscriptions(subscriptions)
+            return True
+
+        if self._storage.run_locked("subscriptions", delete):
+            self._update_columns("subscriptions", None)
+            self._records["subscriptions"].update(None)
+            self.notify("subscription_deleted", {"student_id": student_id, "date": date})
+            return True
+        return False
+    
+    def delete_student_subscriptions(self, student_id: int, uow: UnitOfWork) -> int:
+        """
+        Supprime les abonnements d'un étudiant (suppression en cascade d'un membre).
+        
+        Les abonnements concernés sont trouvés par l'index par étudiant (ou
+        l'index SQL) : sans abonnement, la collection n'est ni chargée ni
+        réécrite.
+        
+        Args:
+            uow: Unité de travail en cours, déclarant "subscriptions"
+        
+        Returns:
+            Nombre d'abonnements supprimés
+        """
+        if not self.get_subscriptions_by_student(student_id):
+            return 0
+        key = member_key(student_id)
+        removed = uow.remove("subscriptions", lambda s: member_key(s.get("student_id")) == key)
+        if removed:
+            def after_commit() -> None:
+                self._update_columns("subscriptions", None)
+                self._records["subscriptions"].update(None)
+                self.notify("subscription_deleted", {"student_id": student_id, "count": removed})
+            uow.on_commit(after_commit)
+        return removed
+    
+    def add_donation(self, donation: Dict[str, Any]) -> None:
+        """Ajoute un nouveau don (ValueError sans rien écrire si le montant est invalide)"""
+        amount_of(donation)
+        self._storage.append_donation(donation)
+        record = self._records["donations"].decode([donation])[0]
+        self._update_columns("donations", lambda columns: columns.append(record))
+        self._records["donations"].append(record)
+        self.notify("donation_added", donation)
+    
+    def delete_donation(self, donor_name: str, date: str, amount: float) -> bool:
+        """Supprime un don par nom du donateur, date et montant (même lecture que delete_subscription)"""
+        def delete() -> bool:
+            ranged = _is_day(date)
+            donations = self._storage.load_donations_between(date, date) if ranged else self._storage.load_donations()
+            original_count = len(donations)
+            donations = [d for d in donations
+                        if not (d.get("donor_name") == donor_name
+                               and d.get("date") == date
+                               and float(d.get("amount", 0)) == amount)]
+            if len(donations) == original_count:
+                return False
+            if ranged:
+                self._storage.save_donations_between(date, date, donations)
+            else:
+                self._storage.save_donations(donations)
+            return True
+
+        if self._storage.run_locked("donations", delete):
+            self._update_columns("donations", None)
+            self._records["donations"].update(None)
+            self.notify("donation_deleted", {"donor_name": donor_name, "date": date, "amount": amount})
+            return True
+        return False
+
+    # ==================== COLONNES FINANCIÈRES ====================
+    
+    def _finance_columns(self, collection: str) -> FinanceColumns:
+        """
+        Retourne les colonnes d'une collection, reconstruites si elle a changé.
+        
+        Comme l'index des membres (MemberController._member_index), une
+        version du storage inattendue provoque une reconstruction en un
+        seul parcours, sous le verrou de la collection.
+        """
+        with self._columns_lock:
+            columns = self._columns.get(collection)
+            if columns is not None and self._columns_versions[collection] == self._storage.get_version(collection):
+                return columns
+        build = FinanceColumns.for_subscriptions if collection == "subscriptions" else FinanceColumns.for_donations
+        records = self._storage.iter_subscriptions if collection == "subscriptions" else self._storage.iter_donations
+        with self._storage.lock(collection):
+            version = self._storage.get_version(collection)
+            columns = build(records())
+        with self._columns_lock:
+            self._columns[collection] = columns
+            self._columns_versions[collection] = version
+        return columns
+    
+    def _sum_columns(self, collection: str, **filters: str) -> float:
+        """Somme filtrée des montants (voir FinanceColumns.sum), à l'abri des ajouts concurrents"""
+        columns = self._finance_columns(collection)
+        with self._columns_lock:
+            return columns.sum(**filters)
+    
+    def _update_columns(self, collection: str, apply: Callable[[FinanceColumns], None] | None) -> None:
+        """Reporte une écriture de ce contrôleur sur les colonnes, ou les invalide (voir MemberController._update_index)"""
+        with self._columns_lock:
+            columns = self._columns.get(collection)
+            if columns is None:
+                return
+            known = self._columns_versions[collection]
+            current = self._storage.get_version(collection)
+            if apply is not None and (current == known + 1 or current == known == 0):
+                apply(columns)
+                self._columns_versions[collection] = current
+            else:
+                del self._columns[collection]
+
+
+def _student_key(subscription: SubscriptionRecord) -> Any:
+    return member_key(subscription.student_id)
+
+
+def _is_day(value: Any) -> bool:
+    """Vrai pour un jour "YYYY-MM-DD" complet (sans heure) : il délimite exactement une période"""
+    return isinstance(value, str) and iso_day(value) == value
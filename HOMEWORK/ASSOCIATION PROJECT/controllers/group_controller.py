@@ -0,0 +1,331 @@
+from __future__ import annotations
+import logging
+import re
+import threading
+from typing import Callable, List, Dict, Any
+from interfaces.storage_interface import StorageInterface
+from controllers.member_controller import MemberController
+from managers.group_index import GroupIndex, group_key
+from managers.participation_index import member_key
+from models.records import decode_event
+from observers.data_observer import Subject
+from storage.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+# Anciens événements techniques liant un enseignant à un groupe : "[GROUP_LINK] <nom> -> Group <n>"
+GROUP_LINK_PREFIX = "[GROUP_LINK]"
+_GROUP_LINK_TARGET = re.compile(r"->\s*Group\s+(\d+)\s*$")
+
+
+class GroupController(Subject):
+    """
+    Controller pour gérer les groupes (classes).
+
+    Les liens enseignant-groupe sont stockés dans la collection "groups"
+    ({"group_id": 3, "teacher_ids": [5]}) et indexés par GroupIndex ;
+    l'inscription d'un étudiant reste son champ `groupe`, indexé par
+    MemberController. Pages et validations des groupes sont donc des
+    recherches dans ces deux index, sans parcourir les événements.
+    """
+
+    def __init__(self, storage: StorageInterface, member_controller: MemberController) -> None:
+        super().__init__()
+        self._storage = storage
+        self._members = member_controller
+        # Index des liens enseignant-groupe et version des groupes indexés
+        self._index: GroupIndex | None = None
+        self._index_version = 0
+        self._index_lock = threading.Lock()
+
+    # ==================== LECTURE ====================
+
+    def get_groups(self) -> List[Dict[str, Any]]:
+        """
+        Récupère les groupes par numéro croissant : ceux de la collection et
+        ceux où au moins un étudiant est inscrit.
+
+        Returns:
+            Liste de {"group_id", "teacher_ids", "student_ids"}
+        """
+        index = self._group_index()
+        students = self._students_by_group()
+        return [
+            {"group_id": group_id, "teacher_ids": index.teachers(group_id), "student_ids": students.get(group_id, [])}
+            for group_id in sorted(set(index.group_ids()) | set(students))
+        ]
+
+    def get_group(self, group_id: int) -> Dict[str, Any] | None:
+        """Récupère un groupe ({"group_id", "teacher_ids", "student_ids"}), None s'il n'existe pas"""
+        group = group_key(group_id)
+        if group is None:
+            return None
+        index = self._group_index()
+        student_ids = self.get_student_ids(group)
+        if group not in index.teachers_by_group and not student_ids:
+            return None
+        return {"group_id": group, "teacher_ids": index.teachers(group), "student_ids": student_ids}
+
+    def get_teacher_ids(self, group_id: int) -> List[Any]:
+        """IDs des enseignants liés au groupe"""
+        return self._group_index().teachers(group_id)
+
+    def get_student_ids(self, group_id: int) -> List[Any]:
+        """IDs des étudiants inscrits dans le groupe (champ `groupe`)"""
+        return self._students_by_group().get(group_key(group_id), [])
+
+    def get_groups_of_teacher(self, teacher_id: int) -> List[int]:
+        """Groupes auxquels un enseignant est lié"""
+        return self._group_index().groups_of(teacher_id)
+
+    def has_teachers(self, group_id: int) -> bool:
+        """Vrai si au moins un enseignant est lié au groupe (condition pour y inscrire un étudiant)"""
+        return bool(self._group_index().teachers_by_group.get(group_key(group_id)))
+
+    def _students_by_group(self) -> Dict[int, List[Any]]:
+        # Le champ `groupe` peut valoir 3 ou "3" : les deux désignent le groupe 3
+        students: Dict[int, List[Any]] = {}
+        for raw_group in self._members.get_student_groups():
+            group = group_key(raw_group)
+            if group is not None:
+                students.setdefault(group, []).extend(
+                    s.student_id for s in self._members.get_students_by_group(raw_group)
+                )
+        return students
+
+    # ==================== LIENS ENSEIGNANT-GROUPE ====================
+
+    def link_teacher(self, group_id: int, teacher_id: int) -> bool:
+        """
+        Lie un enseignant à un groupe (créé s'il n'existe pas encore).
+
+        Raises:
+            ValueError: Si le numéro de groupe est invalide ou l'enseignant inconnu
+
+        Returns:
+            False si l'enseignant était déjà lié au groupe
+        """
+        group = group_key(group_id)
+        if group is None:
+            raise ValueError(f"Numéro de groupe invalide : {group_id}")
+        if self._members.get_member_by_id(teacher_id, "teacher") is None:
+            raise ValueError(f"Enseignant avec ID {teacher_id} non trouvé")
+        teacher = member_key(teacher_id)
+
+        def link() -> bool:
+            groups = self._storage.load_groups()
+            for index, record in enumerate(groups):
+                if group_key(record.get("group_id")) == group:
+                    teacher_ids = list(record.get("teacher_ids") or [])
+                    if teacher in map(member_key, teacher_ids):
+                        return False
+                    # Copie : les dictionnaires chargés peuvent être partagés avec un cache
+                    groups[index] = {**record, "teacher_ids": teacher_ids + [teacher_id]}
+                    break
+            else:
+                groups.append({"group_id": group, "teacher_ids": [teacher_id]})
+            self._storage.save_groups(groups)
+            return True
+
+        if self._storage.run_locked("groups", link):
+            self._update_index(lambda index: index.link(group, teacher_id))
+            self.notify("group_updated", {"group_id": group, "teacher_id": teacher_id, "linked": True})
+            return True
+        return False
+
+    def unlink_teacher(self, group_id: int, teacher_id: int) -> bool:
+        """
+        Retire le lien entre un enseignant et un groupe.
+
+        Returns:
+            False si l'enseignant n'était pas lié au groupe
+        """
+        group = group_key(group_id)
+        teacher = member_key(teacher_id)
+
+        def unlink() -> bool:
+            groups = self._storage.load_groups()
+            changed = False
+            for index, record in enumerate(groups):
+                teacher_ids = record.get("teacher_ids") or []
+                if group_key(record.get("group_id")) == group and teacher in map(member_key, teacher_ids):
+                    groups[index] = {**record, "teacher_ids": [t for t in teacher_ids if member_key(t) != teacher]}
+                    changed = True
+            if changed:
+                self._storage.save_groups(groups)
+            return changed
+
+        if group is not None and self._storage.run_locked("groups", unlink):
+            self._update_index(lambda index: index.unlink(group, teacher_id))
+            self.notify("group_updated", {"group_id": group, "teacher_id": teacher_id, "linked": False})
+            return True
+        return False
+
+    def move_group(self, old_group: int, new_group: int, uow: UnitOfWork | None = None) -> int:
+        """
+        Rattache au groupe `new_group` les enseignants de `old_group`, qui disparaît.
+
+        Args:
+            uow: Unité de travail en cours (déclarant "groups") ; sans elle,
+                une unité de travail propre est ouverte et validée
+
+        Returns:
+            Nombre de liens enseignant-groupe déplacés
+        """
+        if uow is None:
+            with UnitOfWork(self._storage, "groups") as own:
+                return self.move_group(old_group, new_group, own)
+
+        old, new = group_key(old_group), group_key(new_group)
+        if old is None or new is None or old == new:
+            return 0
+        teacher_ids: List[Any] = []
+        for record in uow.records("groups"):
+            if group_key(record.get("group_id")) == old:
+                teacher_ids = _merge_ids(teacher_ids, record.get("teacher_ids") or [])
+        if not uow.remove("groups", lambda record: group_key(record.get("group_id")) == old):
+            return 0
+        merged = uow.update(
+            "groups",
+            lambda record: group_key(record.get("group_id")) == new,
+            lambda record: {"teacher_ids": _merge_ids(record.get("teacher_ids") or [], teacher_ids)},
+        )
+        if not merged and teacher_ids:
+            uow.append("groups", {"group_id": new, "teacher_ids": teacher_ids})
+
+        def after_commit() -> None:
+            self._update_index(lambda index: index.move(old, new))
+            self.notify("group_updated", {"old_group": old, "new_group": new})
+        uow.on_commit(after_commit)
+        return len(teacher_ids)
+
+    def remove_teacher_references(self, teacher_id: int, uow: UnitOfWork) -> int:
+        """
+        Retire un enseignant supprimé de ses groupes (suppression en cascade).
+
+        Les groupes concernés sont trouvés par l'index des groupes : sans
+        groupe lié, la collection n'est ni chargée ni réécrite.
+
+        Args:
+            uow: Unité de travail en cours, déclarant "groups"
+
+        Returns:
+            Nombre de liens enseignant-groupe retirés
+        """
+        groups = set(self.get_groups_of_teacher(teacher_id))
+        if not groups:
+            return 0
+        teacher = member_key(teacher_id)
+        updated = uow.update(
+            "groups",
+            lambda record: group_key(record.get("group_id")) in groups
+            and teacher in map(member_key, record.get("teacher_ids") or ()),
+            lambda record: {"teacher_ids": [t for t in record["teacher_ids"] if member_key(t) != teacher]},
+        )
+        if updated:
+            def after_commit() -> None:
+                self._update_index(lambda index: [index.unlink(group, teacher_id) for group in groups])
+                self.notify("group_updated", {"teacher_id": teacher_id, "linked": False})
+            uow.on_commit(after_commit)
+        return len(groups) if updated else 0
+
+    # ==================== MIGRATION ====================
+
+    def migrate_group_links(self) -> int:
+        """
+        Convertit les anciens événements "[GROUP_LINK] <nom> -> Group <n>" en liens de groupe.
+
+        Chaque événement technique est remplacé par le lien entre ses
+        organisateurs et le groupe <n>, dans une même unité de travail
+        (événements et groupes écrits ensemble, ou rien). Un événement
+        technique sans numéro de groupe ni organisateur est laissé en place.
+        Sans événement technique exploitable, seule une lecture en flux des
+        événements est faite : la migration peut être appelée à chaque démarrage.
+
+        Returns:
+            Nombre d'événements migrés
+        """
+        if not any(_group_link_target(event) is not None for event in self._storage.iter_events()):
+            return 0
+
+        with UnitOfWork(self._storage, "events", "groups") as uow:
+            links: Dict[int, List[Any]] = {}
+            for event in uow.records("events"):
+                target = _group_link_target(event)
+                if target is not None:
+                    group, teacher_ids = target
+                    links[group] = _merge_ids(links.get(group, []), teacher_ids)
+                elif _is_group_link(event):
+                    logger.warning("Lien de groupe illisible conservé : %s", event.get("event_name", event.get("name")))
+            migrated = uow.remove("events", lambda event: _group_link_target(event) is not None)
+            if not migrated:
+                return 0
+            for group, teacher_ids in links.items():
+                merged = uow.update(
+                    "groups",
+                    lambda record, group=group: group_key(record.get("group_id")) == group,
+                    lambda record, ids=teacher_ids: {"teacher_ids": _merge_ids(record.get("teacher_ids") or [], ids)},
+                )
+                if not merged:
+                    uow.append("groups", {"group_id": group, "teacher_ids": teacher_ids})
+
+            def after_commit() -> None:
+                self._update_index(None)
+                self.notify("group_updated", {"migrated": migrated})
+            uow.on_commit(after_commit)
+        logger.info("%d lien(s) enseignant-groupe migré(s) depuis les événements", migrated)
+        return migrated
+
+    # ==================== INDEX DES GROUPES ====================
+
+    def _group_index(self) -> GroupIndex:
+        """Index des groupes, reconstruit si la collection a changé (voir MemberController._member_index)"""
+        with self._index_lock:
+            if self._index is not None and self._index_version == self._storage.get_version("groups"):
+                return self._index
+        with self._storage.lock("groups"):
+            version = self._storage.get_version("groups")
+            index = GroupIndex(self._storage.iter_groups())
+        with self._index_lock:
+            self._index, self._index_version = index, version
+        return index
+
+    def _update_index(self, apply: Callable[[GroupIndex], None] | None) -> None:
+        """Reporte sur l'index une écriture de ce contrôleur, ou l'invalide (voir MemberController._update_index)"""
+        with self._index_lock:
+            if self._index is None:
+                return
+            current = self._storage.get_version("groups")
+            if apply is not None and (current == self._index_version + 1 or current == self._index_version == 0):
+                apply(self._index)
+                self._index_version = current
+            else:
+                self._index = None
+
+
+def _merge_ids(ids: List[Any], extra: List[Any]) -> List[Any]:
+    """`ids` suivis des IDs de `extra` qui n'y figurent pas encore (comparés par member_key)"""
+    merged = list(ids)
+    seen = set(map(member_key, ids))
+    for member_id in extra:
+        key = member_key(member_id)
+        if key not in seen:
+            seen.add(key)
+            merged.append(member_id)
+    return merged
+
+
+def _is_group_link(event: Dict[str, Any]) -> bool:
+    return str(event.get("event_name", event.get("name", ""))).startswith(GROUP_LINK_PREFIX)
+
+
+def _group_link_target(event: Dict[str, Any]) -> tuple[int, List[Any]] | None:
+    """(groupe, organisateurs) d'un événement "[GROUP_LINK]" exploitable, sinon None"""
+    if not _is_group_link(event):
+        return None
+    record = decode_event(event)
+    match = _GROUP_LINK_TARGET.search(str(record.event_name))
+    group = group_key(match.group(1)) if match else None
+    if group is None or not record.organizer_ids:
+        return None
+    return group, list(record.organizer_ids)
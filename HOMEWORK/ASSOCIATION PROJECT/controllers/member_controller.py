@@ -1,196 +1,423 @@
-from __future__ import annotations
-from typing import List, Dict, Any
-from interfaces.storage_interface import StorageInterface
-from observers.data_observer import Subject
-from factories.member_factory import MemberFactory
-from strategies.member_sorter import MemberSorter
-from strategies.sort_strategy import SortStrategy
-from strategies.sort_by_name_strategy import SortByNameStrategy
-from strategies.sort_by_date_strategy import SortByDateStrategy
-from strategies.sort_by_group_strategy import SortByGroupStrategy
-from strategies.sort_by_status_strategy import SortByStatusStrategy
-
-
-class MemberController(Subject):
-    """Controller pour gérer les opérations sur les membres (étudiants, professeurs)"""
-    
-    def __init__(self, storage: StorageInterface) -> None:
-        super().__init__()
-        self._storage = storage
-        self._sorter = MemberSorter()  # Utilise le pattern Strategy pour le tri
-        
-    def get_all_members(self) -> List[Dict[str, Any]]:
-        """Récupère tous les membres depuis le storage"""
-        return self._storage.load_members()
-    
-    def get_students(self) -> List[Dict[str, Any]]:
-        """Récupère uniquement les étudiants"""
-        members = self.get_all_members()
-        return [m for m in members if "student_id" in m]
-    
-    def get_teachers(self) -> List[Dict[str, Any]]:
-        """Récupère uniquement les professeurs"""
-        members = self.get_all_members()
-        return [m for m in members if "teacher_id" in m]
-    
-    def get_teachers_sorted(self, sort_by: str = "name", reverse: bool = False) -> List[Dict[str, Any]]:
-        """
-        Récupère les professeurs triés selon une stratégie.
-        
-        Utilise le pattern Strategy pour permettre différents types de tri.
-        Note: Les stratégies "group" et "status" ne sont pas applicables aux teachers.
-        
-        Args:
-            sort_by: Critère de tri ("name", "date")
-            reverse: Si True, trie en ordre décroissant
-            
-        Returns:
-            Liste des professeurs triés
-        """
-        teachers = self.get_teachers()
-        # Pour les teachers, seules les stratégies "name" et "date" sont valides
-        if sort_by not in ["name", "date"]:
-            sort_by = "name"
-        
-        strategy = self._get_sort_strategy(sort_by)
-        self._sorter.set_strategy(strategy)
-        return self._sorter.sort(teachers, reverse)
-    
-    def get_member_by_id(self, member_id: int, member_type: str = "student") -> Dict[str, Any] | None:
-        """Récupère un membre par son ID"""
-        members = self.get_all_members()
-        id_key = f"{member_type}_id" if member_type in ["student", "teacher"] else "id"
-        
-        for member in members:
-            if member.get(id_key) == member_id:
-                return member
-        return None
-    
-    def add_member(self, member: Dict[str, Any]) -> None:
-        """Ajoute un nouveau membre"""
-        members = self.get_all_members()
-        members.append(member)
-        self._storage.save_members(members)
-        member_type = "student" if "student_id" in member else "teacher"
-        self.notify(f"member_added_{member_type}", member)
-    
-    def delete_member(self, member_id: int, member_type: str = "student") -> bool:
-        """Supprime un membre par son ID"""
-        members = self.get_all_members()
-        id_key = f"{member_type}_id" if member_type in ["student", "teacher"] else "id"
-        
-        original_count = len(members)
-        members = [m for m in members if m.get(id_key) != member_id]
-        
-        if len(members) < original_count:
-            self._storage.save_members(members)
-            self.notify(f"member_deleted_{member_type}", {"id": member_id})
-            return True
-        return False
-    
-    def get_next_student_id(self) -> int:
-        """Retourne le prochain ID disponible pour un étudiant"""
-        students = self.get_students()
-        if not students:
-            return 1
-        ids = [s.get("student_id", 0) for s in students if s.get("student_id") is not None]
-        return max(ids, default=0) + 1
-    
-    def get_next_teacher_id(self) -> int:
-        """Retourne le prochain ID disponible pour un enseignant"""
-        teachers = self.get_teachers()
-        if not teachers:
-            return 1
-        ids = [t.get("teacher_id", 0) for t in teachers if t.get("teacher_id") is not None]
-        return max(ids, default=0) + 1
-
-    def update_student_group(self, student_id: int, group: int | None) -> bool:
-        """Met à jour le champ 'groupe' d'un étudiant et sauvegarde.
-
-        Retourne True si l'étudiant a été trouvé et mis à jour.
-        """
-        members = self.get_all_members()
-        updated = False
-        for member in members:
-            if member.get("student_id") == student_id:
-                member["groupe"] = group
-                updated = True
-                break
-        if updated:
-            self._storage.save_members(members)
-            self.notify("member_updated", {"student_id": student_id, "group": group})
-        return updated
-
-    def create_student(self, **kwargs) -> Dict[str, Any]:
-        """Crée un étudiant en utilisant la Factory"""
-        return MemberFactory.create_student(**kwargs)
-
-    def create_teacher(self, **kwargs) -> Dict[str, Any]:
-        """Crée un professeur en utilisant la Factory"""
-        return MemberFactory.create_teacher(**kwargs)
-    
-    # ==================== MÉTHODES UTILISANT LE PATTERN STRATEGY ====================
-    
-    def get_students_sorted(self, sort_by: str = "name", reverse: bool = False) -> List[Dict[str, Any]]:
-        """
-        Récupère les étudiants triés selon une stratégie.
-        
-        Utilise le pattern Strategy pour permettre différents types de tri.
-        
-        Args:
-            sort_by: Critère de tri ("name", "date", "group", "status")
-            reverse: Si True, trie en ordre décroissant
-            
-        Returns:
-            Liste des étudiants triés
-        """
-        students = self.get_students()
-        strategy = self._get_sort_strategy(sort_by)
-        self._sorter.set_strategy(strategy)
-        return self._sorter.sort(students, reverse)
-    
-    def get_all_members_sorted(self, sort_by: str = "name", reverse: bool = False) -> List[Dict[str, Any]]:
-        """
-        Récupère tous les membres triés selon une stratégie.
-        
-        Utilise le pattern Strategy pour permettre différents types de tri.
-        
-        Args:
-            sort_by: Critère de tri ("name", "date", "group", "status")
-            reverse: Si True, trie en ordre décroissant
-            
-        Returns:
-            Liste des membres triés
-        """
-        members = self.get_all_members()
-        strategy = self._get_sort_strategy(sort_by)
-        self._sorter.set_strategy(strategy)
-        return self._sorter.sort(members, reverse)
-    
-    def _get_sort_strategy(self, sort_by: str) -> SortStrategy:
-        """
-        Retourne la stratégie de tri correspondante.
-        
-        Args:
-            sort_by: Nom de la stratégie ("name", "date", "group", "status")
-            
-        Returns:
-            Instance de SortStrategy
-        """
-        strategies = {
-            "name": SortByNameStrategy(),
-            "date": SortByDateStrategy(),
-            "group": SortByGroupStrategy(),
-            "status": SortByStatusStrategy(),
-        }
-        return strategies.get(sort_by.lower(), SortByNameStrategy())
-    
-    def set_sort_strategy(self, strategy: SortStrategy) -> None:
-        """
-        Définit la stratégie de tri à utiliser.
-        
-        Args:
-            strategy: Instance de SortStrategy à utiliser
-        """
-        self._sorter.set_strategy(strategy)
-
+from __future__ import annotations
+import threading
+from typing import Callable, Iterable, List, Dict, Any, Tuple
+from interfaces.storage_interface import StorageInterface
+from interfaces.queryable_storage import QueryableStorage
+from observers.data_observer import Subject
+from factories.member_factory import MemberFactory
+from managers.member_index import MemberIndex, normalize_email
+from managers.record_cache import RecordCache
+from models.records import MemberRecord, StudentRecord, TeacherRecord
+from storage.unit_of_work import UnitOfWork
+from strategies.member_sorter import MemberSorter
+from strategies.sort_strategy import SortStrategy
+from strategies.sort_by_name_strategy import SortByNameStrategy
+from strategies.sort_by_date_strategy import SortByDateStrategy
+from strategies.sort_by_group_strategy import SortByGroupStrategy
+from strategies.sort_by_status_strategy import SortByStatusStrategy
+from utils.pagination import paginate, project
+
+
+class MemberController(Subject):
+    """Controller pour gérer les opérations sur les membres (étudiants, professeurs)"""
+    
+    def __init__(self, storage: StorageInterface) -> None:
+        super().__init__()
+        self._storage = storage
+        self._sorter = MemberSorter()  # Utilise le pattern Strategy pour le tri
+        # Membres décodés en StudentRecord / TeacherRecord, une fois par version
+        self._records = RecordCache(storage, "members")
+        # Index secondaires (id, email, groupe, statut) et version des membres indexés
+        self._index: MemberIndex | None = None
+        self._index_version = 0
+        self._index_lock = threading.Lock()
+        # Stratégies de tri (sans état) : instanciées une seule fois
+        self._strategies: Dict[str, SortStrategy] = {
+            "name": SortByNameStrategy(),
+            "date": SortByDateStrategy(),
+            "group": SortByGroupStrategy(),
+            "status": SortByStatusStrategy(),
+        }
+        # Vues triées : (portée, stratégie, reverse) -> membres déjà triés.
+        # La génération change à chaque écriture des membres et invalide les vues.
+        self._sorted_views: Dict[Tuple[str, str, bool], List[MemberRecord]] = {}
+        self._views_version = 0
+        self._views_generation = 0
+        self._views_lock = threading.Lock()
+        
+    def get_all_members(self, offset: int = 0, limit: int | None = None, fields: List[str] | None = None,
+                        start: str | None = None, end: str | None = None) -> List[MemberRecord]:
+        """
+        Récupère les membres (StudentRecord / TeacherRecord, voir models/records.py).
+        
+        Args:
+            offset: Nombre de membres à sauter
+            limit: Nombre maximum de membres retournés (None = tous)
+            fields: Champs à conserver dans chaque membre (None = tous) ;
+                le résultat est alors une liste de dictionnaires
+            start, end: Bornes incluses sur la date d'inscription (ISO) ; avec
+                au moins une borne, les membres inscrits dans l'intervalle
+                sont servis par date croissante
+        """
+        if start is not None or end is not None:
+            members = paginate(self._members_between("all", start, end), offset, limit)
+        elif offset or limit is not None:
+            members = self._records.decode(self._storage.load_page("members", offset, limit))
+        else:
+            members = list(self._records.records())
+        return project(members, fields)
+    
+    def get_students(self, offset: int = 0, limit: int | None = None, fields: List[str] | None = None,
+                     start: str | None = None, end: str | None = None) -> List[StudentRecord]:
+        """Récupère uniquement les étudiants (optionnellement une page, ou un intervalle de dates d'inscription)"""
+        return project(paginate(self._members_between("students", start, end), offset, limit), fields)
+    
+    def get_teachers(self, offset: int = 0, limit: int | None = None, fields: List[str] | None = None,
+                     start: str | None = None, end: str | None = None) -> List[TeacherRecord]:
+        """Récupère uniquement les professeurs (optionnellement une page, ou un intervalle de dates d'inscription)"""
+        return project(paginate(self._members_between("teachers", start, end), offset, limit), fields)
+    
+    def _members_between(self, scope: str, start: str | None, end: str | None) -> Iterable[MemberRecord]:
+        """
+        Membres de `scope` ("all", "students", "teachers").
+        
+        Sans borne : dans l'ordre du storage. Avec au moins une borne : ceux
+        inscrits entre start et end, par date croissante, trouvés par
+        bisection dans l'index des dates (voir RecordCache.between).
+        """
+        if start is None and end is None:
+            members = self._records.records()
+        else:
+            members = self._records.between(start, end)
+        if scope == "students":
+            return (m for m in members if isinstance(m, StudentRecord))
+        if scope == "teachers":
+            return (m for m in members if isinstance(m, TeacherRecord))
+        return members
+    
+    def get_teachers_sorted(self, sort_by: str = "name", reverse: bool = False, offset: int = 0,
+                            limit: int | None = None, fields: List[str] | None = None,
+                            start: str | None = None, end: str | None = None) -> List[TeacherRecord]:
+        """
+        Récupère les professeurs triés selon une stratégie.
+        
+        Utilise le pattern Strategy pour permettre différents types de tri.
+        Note: Les stratégies "group" et "status" ne sont pas applicables aux teachers.
+        
+        Args:
+            sort_by: Critère de tri ("name", "date")
+            reverse: Si True, trie en ordre décroissant
+            offset, limit, fields, start, end: Pagination, projection et
+                intervalle de dates d'inscription (voir get_all_members)
+            
+        Returns:
+            Liste des professeurs triés
+        """
+        # Pour les teachers, seules les stratégies "name" et "date" sont valides
+        if sort_by not in ["name", "date"]:
+            sort_by = "name"
+        
+        return project(paginate(self._sorted_members("teachers", sort_by, reverse, start, end), offset, limit), fields)
+    
+    def get_member_by_id(self, member_id: int, member_type: str = "student") -> MemberRecord | Dict[str, Any] | None:
+        """Récupère un membre par son ID"""
+        if isinstance(self._storage, QueryableStorage):
+            member = self._storage.find_member_by_id(member_id, member_type)
+            return None if member is None else self._records.decode([member])[0]
+
+        if member_type in ["student", "teacher"]:
+            return self._member_index().find(member_id, member_type)
+
+        for member in self._records.records():
+            if member.get("id") == member_id:
+                return member
+        return None
+    
+    def get_member_by_email(self, email: str) -> MemberRecord | None:
+        """Récupère le membre utilisant cet email (insensible à la casse)"""
+        return self._member_index().find_by_email(email)
+    
+    def get_students_by_group(self, group: int | None) -> List[StudentRecord]:
+        """Récupère les étudiants d'un groupe (None = sans groupe)"""
+        return self._member_index().students_in_group(group)
+    
+    def get_student_groups(self) -> List[Any]:
+        """Valeurs du champ `groupe` portées par au moins un étudiant (None = sans groupe)"""
+        return list(self._member_index().students_by_group)
+    
+    def get_students_by_status(self, status: str) -> List[StudentRecord]:
+        """Récupère les étudiants par statut d'abonnement (insensible à la casse)"""
+        return self._member_index().students_with_status(status)
+    
+    def add_member(self, member: Dict[str, Any]) -> None:
+        """
+        Ajoute un nouveau membre.
+        
+        Raises:
+            ValueError: Si l'email est déjà utilisé par un autre membre
+        """
+        email = normalize_email(member.get("email"))
+        with self._storage.lock("members"):
+            if email and self._member_index().find_by_email(email) is not None:
+                raise ValueError(f"L'email {member.get('email')} est déjà utilisé par un autre membre")
+            self._storage.append_member(member)
+            record = self._records.decode([member])[0]
+            self._records.append(record)
+            self._update_index(lambda index: index.add(record))
+            self._invalidate_sorted_views()
+        member_type = "student" if "student_id" in member else "teacher"
+        self.notify(f"member_added_{member_type}", member)
+    
+    def delete_member(self, member_id: int, member_type: str = "student", uow: UnitOfWork | None = None) -> bool:
+        """
+        Supprime un membre par son ID
+        
+        Args:
+            uow: Unité de travail en cours (déclarant "members"), utilisée par
+                la suppression en cascade (AssociationController.delete_member)
+        """
+        id_key = f"{member_type}_id" if member_type in ["student", "teacher"] else "id"
+
+        def after_delete() -> None:
+            self._invalidate_sorted_views()
+            self._records.update(None)
+            if member_type in ["student", "teacher"]:
+                self._update_index(lambda index: index.remove(member_id, member_type))
+            else:
+                self._update_index(None)
+            self.notify(f"member_deleted_{member_type}", {"id": member_id})
+
+        if uow is not None:
+            if not uow.remove("members", lambda m: m.get(id_key) == member_id):
+                return False
+            uow.on_commit(after_delete)
+            return True
+
+        def delete() -> bool:
+            members = self._storage.load_members()
+            original_count = len(members)
+            members = [m for m in members if m.get(id_key) != member_id]
+            if len(members) == original_count:
+                return False
+            self._storage.save_members(members)
+            return True
+
+        if self._storage.run_locked("members", delete):
+            after_delete()
+            return True
+        return False
+    
+    def get_next_student_id(self) -> int:
+        """Retourne le prochain ID disponible pour un étudiant"""
+        return self._member_index().next_student_id()
+    
+    def get_next_teacher_id(self) -> int:
+        """Retourne le prochain ID disponible pour un enseignant"""
+        return self._member_index().next_teacher_id()
+
+    def update_student_group(self, student_id: int, group: int | None) -> bool:
+        """Met à jour le champ 'groupe' d'un étudiant et sauvegarde.
+
+        Retourne True si l'étudiant a été trouvé et mis à jour.
+        """
+        def update() -> bool:
+            members = self._storage.load_members()
+            for index, member in enumerate(members):
+                if member.get("student_id") == student_id:
+                    # Copie : les dictionnaires chargés peuvent être partagés avec un cache
+                    members[index] = {**member, "groupe": group}
+                    self._storage.save_members(members)
+                    return True
+            return False
+
+        updated = self._storage.run_locked("members", update)
+        if updated:
+            self._invalidate_sorted_views()
+            self._records.update(None)
+            self._update_index(lambda index: index.set_group(student_id, group))
+            self.notify("member_updated", {"student_id": student_id, "group": group})
+        return updated
+
+    def regroup_students(self, student_ids: Iterable[int], group: int | None,
+                         uow: UnitOfWork | None = None) -> int:
+        """
+        Affecte plusieurs étudiants à un groupe en une seule écriture des membres.
+        
+        Args:
+            student_ids: IDs des étudiants à déplacer
+            group: Nouveau groupe (None = sans groupe)
+            uow: Unité de travail en cours (déclarant "members") ; sans elle,
+                une unité de travail propre est ouverte et validée
+        
+        Returns:
+            Nombre d'étudiants mis à jour
+        """
+        if uow is None:
+            with UnitOfWork(self._storage, "members") as own:
+                return self.regroup_students(student_ids, group, own)
+
+        ids = set(student_ids)
+        updated = uow.update("members", lambda m: "student_id" in m and m["student_id"] in ids, {"groupe": group})
+        moved = [m["student_id"] for m in updated]
+        if moved:
+            def after_commit() -> None:
+                self._invalidate_sorted_views()
+                self._records.update(None)
+                self._update_index(lambda index: [index.set_group(student_id, group) for student_id in moved])
+                self.notify("member_updated", {"student_ids": moved, "group": group})
+            uow.on_commit(after_commit)
+        return len(moved)
+
+    # ==================== INDEX DES MEMBRES ====================
+    
+    def _member_index(self) -> MemberIndex:
+        """
+        Retourne l'index des membres, reconstruit si la collection a changé.
+        
+        Une version du storage différente de celle de l'index signale une
+        écriture qui ne vient pas de ce contrôleur (autre processus, save_*
+        direct) : l'index est alors reconstruit en un seul parcours.
+        """
+        with self._index_lock:
+            if self._index is not None and self._index_version == self._storage.get_version("members"):
+                return self._index
+        # Chargement hors de self._index_lock : l'ordre des verrous reste
+        # toujours collection -> index (voir add_member)
+        with self._storage.lock("members"):
+            version = self._storage.get_version("members")
+            index = MemberIndex(self._records.records())
+        with self._index_lock:
+            self._index, self._index_version = index, version
+        return index
+    
+    def _update_index(self, apply: Callable[[MemberIndex], None] | None) -> None:
+        """
+        Reporte sur l'index une écriture que ce contrôleur vient de faire.
+        
+        Si d'autres écritures ont eu lieu entre-temps (la version a avancé de
+        plus d'un cran), ou si `apply` est None, l'index est simplement
+        invalidé et sera reconstruit à la prochaine lecture.
+        """
+        with self._index_lock:
+            if self._index is None:
+                return
+            current = self._storage.get_version("members")
+            if apply is not None and (current == self._index_version + 1 or current == self._index_version == 0):
+                apply(self._index)
+                self._index_version = current
+            else:
+                self._index = None
+    
+    def create_student(self, **kwargs) -> Dict[str, Any]:
+        """Crée un étudiant en utilisant la Factory"""
+        return MemberFactory.create_student(**kwargs)
+
+    def create_teacher(self, **kwargs) -> Dict[str, Any]:
+        """Crée un professeur en utilisant la Factory"""
+        return MemberFactory.create_teacher(**kwargs)
+    
+    # ==================== MÉTHODES UTILISANT LE PATTERN STRATEGY ====================
+    
+    def get_students_sorted(self, sort_by: str = "name", reverse: bool = False, offset: int = 0,
+                            limit: int | None = None, fields: List[str] | None = None,
+                            start: str | None = None, end: str | None = None) -> List[StudentRecord]:
+        """
+        Récupère les étudiants triés selon une stratégie.
+        
+        Utilise le pattern Strategy pour permettre différents types de tri.
+        
+        Args:
+            sort_by: Critère de tri ("name", "date", "group", "status")
+            reverse: Si True, trie en ordre décroissant
+            offset, limit, fields, start, end: Pagination, projection et
+                intervalle de dates d'inscription (voir get_all_members)
+            
+        Returns:
+            Liste des étudiants triés
+        """
+        return project(paginate(self._sorted_members("students", sort_by, reverse, start, end), offset, limit), fields)
+    
+    def get_all_members_sorted(self, sort_by: str = "name", reverse: bool = False, offset: int = 0,
+                               limit: int | None = None, fields: List[str] | None = None,
+                               start: str | None = None, end: str | None = None) -> List[MemberRecord]:
+        """
+        Récupère tous les membres triés selon une stratégie.
+        
+        Utilise le pattern Strategy pour permettre différents types de tri.
+        
+        Args:
+            sort_by: Critère de tri ("name", "date", "group", "status")
+            reverse: Si True, trie en ordre décroissant
+            offset, limit, fields, start, end: Pagination, projection et
+                intervalle de dates d'inscription (voir get_all_members)
+            
+        Returns:
+            Liste des membres triés
+        """
+        return project(paginate(self._sorted_members("all", sort_by, reverse, start, end), offset, limit), fields)
+    
+    def _sorted_members(self, scope: str, sort_by: str, reverse: bool,
+                        start: str | None, end: str | None) -> List[MemberRecord]:
+        """Vue triée de `scope`, ou tri des seuls membres de l'intervalle [start, end]"""
+        if start is None and end is None:
+            return self._sorted_view(scope, sort_by, reverse)
+        strategy = self._get_sort_strategy(sort_by)
+        return MemberSorter(strategy).sort(list(self._members_between(scope, start, end)), reverse)
+    
+    def _sorted_view(self, scope: str, sort_by: str, reverse: bool) -> List[MemberRecord]:
+        """
+        Retourne les membres de `scope` ("all", "students", "teachers") triés.
+        
+        Le résultat d'un tri est conservé par (portée, stratégie, reverse) :
+        les appels suivants le servent sans retrier, jusqu'à la prochaine
+        écriture des membres (par ce contrôleur ou, via la version du
+        storage, par un autre processus). La liste retournée est partagée
+        avec le cache : l'appelant doit la copier avant de la modifier.
+        """
+        strategy = self._get_sort_strategy(sort_by)
+        key = (scope, strategy.get_name(), reverse)
+        version = self._storage.get_version("members")
+        with self._views_lock:
+            if version != self._views_version:
+                self._sorted_views.clear()
+                self._views_version = version
+                self._views_generation += 1
+            generation = self._views_generation
+            view = self._sorted_views.get(key)
+        if view is not None:
+            return view
+
+        view = MemberSorter(strategy).sort(list(self._members_between(scope, None, None)), reverse)
+        with self._views_lock:
+            # Une écriture pendant le tri rend ce résultat douteux : il n'est pas conservé
+            if generation == self._views_generation:
+                self._sorted_views[key] = view
+        return view
+    
+    def _invalidate_sorted_views(self) -> None:
+        """Oublie toutes les vues triées après une écriture des membres"""
+        with self._views_lock:
+            self._sorted_views.clear()
+            self._views_generation += 1
+    
+    def _get_sort_strategy(self, sort_by: str) -> SortStrategy:
+        """
+        Retourne la stratégie de tri correspondante.
+        
+        Args:
+            sort_by: Nom de la stratégie ("name", "date", "group", "status")
+            
+        Returns:
+            Instance de SortStrategy
+        """
+        return self._strategies.get(sort_by.lower(), self._strategies["name"])
+    
+    def set_sort_strategy(self, strategy: SortStrategy) -> None:
+        """
+        Définit la stratégie de tri à utiliser.
+        
+        Args:
+            strategy: Instance de SortStrategy à utiliser
+        """
+        self._sorter.set_strategy(strategy)
+
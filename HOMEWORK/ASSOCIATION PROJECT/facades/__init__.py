@@ -1,6 +1,6 @@
-"""Facade pattern pour simplifier l'accès aux services de l'association"""
-
-from .association_facade import AssociationFacade
-
-__all__ = ["AssociationFacade"]
-
+"""Facade pattern pour simplifier l'accès aux services de l'association"""
+
+from .association_facade import AssociationFacade
+
+__all__ = ["AssociationFacade"]
+
@@ -1,234 +1,330 @@
-"""
-Facade Pattern - AssociationFacade
-
-Cette classe fournit une interface simplifiée et unifiée pour accéder
-aux différents services de l'association (membres, événements, finances).
-
-Problème résolu :
-- Avant : Le code devait accéder à plusieurs contrôleurs séparément (MemberController,
-  EventController, FinanceController), ce qui créait de la complexité et du couplage.
-- Après : Une seule interface Facade permet d'accéder à toutes les fonctionnalités
-  principales de manière simplifiée et cohérente.
-
-Bénéfices :
-- Simplifie l'utilisation pour les clients (UI, API)
-- Réduit le couplage entre les composants
-- Centralise les opérations courantes
-- Facilite la maintenance et les tests
-"""
-
-from __future__ import annotations
-from typing import Any, Dict, List, Optional
-from controllers.association_controller import AssociationController
-from interfaces.storage_interface import StorageInterface
-
-
-class AssociationFacade:
-    """
-    Facade qui simplifie l'accès aux services de l'association.
-    
-    Cette classe encapsule les interactions avec les différents contrôleurs
-    et fournit des méthodes de haut niveau pour les opérations courantes.
-    """
-    
-    def __init__(self, storage: StorageInterface) -> None:
-        """
-        Initialise la Facade avec le storage.
-        
-        Args:
-            storage: Interface de stockage des données
-        """
-        self._controller = AssociationController(storage)
-    
-    # ==================== MÉTHODES DASHBOARD ET STATISTIQUES ====================
-    
-    def get_dashboard_data(self) -> Dict[str, Any]:
-        """
-        Récupère toutes les données nécessaires pour le tableau de bord.
-        
-        Returns:
-            Dictionnaire contenant membres, événements, abonnements et dons
-        """
-        return self._controller.get_dashboard_data()
-    
-    def get_statistics(self) -> Dict[str, Any]:
-        """
-        Récupère les statistiques globales de l'association.
-        
-        Returns:
-            Dictionnaire avec les statistiques (nombre de membres, total finances, etc.)
-        """
-        members = self._controller.get_member_controller().get_all_members()
-        students = self._controller.get_member_controller().get_students()
-        teachers = self._controller.get_member_controller().get_teachers()
-        events = self._controller.get_event_controller().get_all_events()
-        
-        finance_controller = self._controller.get_finance_controller()
-        total_donations = finance_controller.calculate_total_donations()
-        total_subscriptions = finance_controller.calculate_total_subscriptions()
-        paid_subscriptions = finance_controller.calculate_total_subscriptions("paid")
-        
-        return {
-            "total_members": len(members),
-            "total_students": len(students),
-            "total_teachers": len(teachers),
-            "total_events": len(events),
-            "total_donations": total_donations,
-            "total_subscriptions": total_subscriptions,
-            "paid_subscriptions": paid_subscriptions,
-            "pending_subscriptions": total_subscriptions - paid_subscriptions,
-        }
-    
-    # ==================== MÉTHODES MEMBRES ====================
-    
-    def get_all_members(self, sort_by: Optional[str] = None, reverse: bool = False) -> List[Dict[str, Any]]:
-        """
-        Récupère tous les membres (étudiants et professeurs).
-        
-        Args:
-            sort_by: Critère de tri ("name", "date", "group", "status") ou None pour pas de tri
-            reverse: Si True, trie en ordre décroissant
-            
-        Returns:
-            Liste des membres, optionnellement triés
-        """
-        if sort_by:
-            return self._controller.get_member_controller().get_all_members_sorted(sort_by, reverse)
-        return self._controller.get_member_controller().get_all_members()
-    
-    def get_students(self, sort_by: Optional[str] = None, reverse: bool = False) -> List[Dict[str, Any]]:
-        """
-        Récupère uniquement les étudiants.
-        
-        Args:
-            sort_by: Critère de tri ("name", "date", "group", "status") ou None pour pas de tri
-            reverse: Si True, trie en ordre décroissant
-            
-        Returns:
-            Liste des étudiants, optionnellement triés
-        """
-        if sort_by:
-            return self._controller.get_member_controller().get_students_sorted(sort_by, reverse)
-        return self._controller.get_member_controller().get_students()
-    
-    def get_teachers(self, sort_by: Optional[str] = None, reverse: bool = False) -> List[Dict[str, Any]]:
-        """
-        Récupère uniquement les professeurs.
-        
-        Args:
-            sort_by: Critère de tri ("name", "date") ou None pour pas de tri
-            reverse: Si True, trie en ordre décroissant
-            
-        Returns:
-            Liste des professeurs, optionnellement triés
-        """
-        if sort_by:
-            return self._controller.get_member_controller().get_teachers_sorted(sort_by, reverse)
-        return self._controller.get_member_controller().get_teachers()
-    
-    def get_member_by_id(self, member_id: int, member_type: str = "student") -> Optional[Dict[str, Any]]:
-        """Récupère un membre par son ID"""
-        return self._controller.get_member_controller().get_member_by_id(member_id, member_type)
-    
-    def add_member(self, member: Dict[str, Any]) -> None:
-        """Ajoute un nouveau membre"""
-        self._controller.get_member_controller().add_member(member)
-    
-    def delete_member(self, member_id: int, member_type: str = "student") -> bool:
-        """Supprime un membre par son ID"""
-        return self._controller.get_member_controller().delete_member(member_id, member_type)
-    
-    def create_student(self, **kwargs) -> Dict[str, Any]:
-        """Crée un étudiant en utilisant la Factory"""
-        return self._controller.get_member_controller().create_student(**kwargs)
-    
-    def create_teacher(self, **kwargs) -> Dict[str, Any]:
-        """Crée un professeur en utilisant la Factory"""
-        return self._controller.get_member_controller().create_teacher(**kwargs)
-    
-    # ==================== MÉTHODES ÉVÉNEMENTS ====================
-    
-    def get_all_events(self) -> List[Dict[str, Any]]:
-        """Récupère tous les événements"""
-        return self._controller.get_event_controller().get_all_events()
-    
-    def get_event_by_name(self, event_name: str) -> Optional[Dict[str, Any]]:
-        """Récupère un événement par son nom"""
-        return self._controller.get_event_controller().get_event_by_name(event_name)
-    
-    def get_events_by_date(self, date: str) -> List[Dict[str, Any]]:
-        """Récupère les événements pour une date donnée"""
-        return self._controller.get_event_controller().get_events_by_date(date)
-    
-    def add_event(self, event: Dict[str, Any]) -> None:
-        """Ajoute un nouvel événement"""
-        self._controller.get_event_controller().add_event(event)
-    
-    def delete_event(self, event_name: str) -> bool:
-        """Supprime un événement par son nom"""
-        return self._controller.get_event_controller().delete_event(event_name)
-    
-    # ==================== MÉTHODES FINANCES ====================
-    
-    def get_all_subscriptions(self) -> List[Dict[str, Any]]:
-        """Récupère tous les abonnements"""
-        return self._controller.get_finance_controller().get_all_subscriptions()
-    
-    def get_all_donations(self) -> List[Dict[str, Any]]:
-        """Récupère tous les dons"""
-        return self._controller.get_finance_controller().get_all_donations()
-    
-    def get_subscriptions_by_student(self, student_id: int) -> List[Dict[str, Any]]:
-        """Récupère les abonnements d'un étudiant"""
-        return self._controller.get_finance_controller().get_subscriptions_by_student(student_id)
-    
-    def get_subscriptions_by_status(self, status: str) -> List[Dict[str, Any]]:
-        """Récupère les abonnements par statut"""
-        return self._controller.get_finance_controller().get_subscriptions_by_status(status)
-    
-    def calculate_total_donations(self) -> float:
-        """Calcule le total des dons"""
-        return self._controller.get_finance_controller().calculate_total_donations()
-    
-    def calculate_total_subscriptions(self, status: Optional[str] = None) -> float:
-        """Calcule le total des abonnements, optionnellement filtré par statut"""
-        return self._controller.get_finance_controller().calculate_total_subscriptions(status)
-    
-    def add_subscription(self, subscription: Dict[str, Any]) -> None:
-        """Ajoute un nouvel abonnement"""
-        self._controller.get_finance_controller().add_subscription(subscription)
-    
-    def delete_subscription(self, student_id: int, date: str) -> bool:
-        """Supprime un abonnement"""
-        return self._controller.get_finance_controller().delete_subscription(student_id, date)
-    
-    def add_donation(self, donation: Dict[str, Any]) -> None:
-        """Ajoute un nouveau don"""
-        self._controller.get_finance_controller().add_donation(donation)
-    
-    def delete_donation(self, donor_name: str, date: str, amount: float) -> bool:
-        """Supprime un don"""
-        return self._controller.get_finance_controller().delete_donation(donor_name, date, amount)
-    
-    # ==================== MÉTHODES OBSERVER ====================
-    
-    def attach_observer(self, observer) -> None:
-        """
-        Attache un observer pour être notifié des changements.
-        
-        Args:
-            observer: Instance d'Observer à attacher
-        """
-        self._controller.attach_observer(observer)
-    
-    # ==================== MÉTHODES UTILITAIRES ====================
-    
-    def get_controller(self) -> AssociationController:
-        """
-        Retourne le contrôleur principal (pour accès avancé si nécessaire).
-        
-        Returns:
-            Le contrôleur AssociationController
-        """
-        return self._controller
-
+"""
+Facade Pattern - AssociationFacade
+
+Cette classe fournit une interface simplifiée et unifiée pour accéder
+aux différents services de l'association (membres, événements, finances).
+
+Problème résolu :
+- Avant : Le code devait accéder à plusieurs contrôleurs séparément (MemberController,
+  EventController, FinanceController), ce qui créait de la complexité et du couplage.
+- Après : Une seule interface Facade permet d'accéder à toutes les fonctionnalités
+  principales de manière simplifiée et cohérente.
+
+Bénéfices :
+- Simplifie l'utilisation pour les clients (UI, API)
+- Réduit le couplage entre les composants
+- Centralise les opérations courantes
+- Facilite la maintenance et les tests
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional
+from controllers.association_controller import AssociationController
+from interfaces.storage_interface import StorageInterface
+from services.integrity_checker import IntegrityChecker
+from services.statistics_engine import StatisticsEngine
+
+
+class AssociationFacade:
+    """
+    Facade qui simplifie l'accès aux services de l'association.
+    
+    Cette classe encapsule les interactions avec les différents contrôleurs
+    et fournit des méthodes de haut niveau pour les opérations courantes.
+    """
+    
+    def __init__(self, storage: StorageInterface) -> None:
+        """
+        Initialise la Facade avec le storage.
+        
+        Args:
+            storage: Interface de stockage des données
+        """
+        self._controller = AssociationController(storage)
+        # Statistiques tenues à jour par les notifications des contrôleurs
+        self._statistics = StatisticsEngine(storage)
+        self._controller.attach_observer(self._statistics)
+        self._integrity = IntegrityChecker(storage)
+    
+    # ==================== MÉTHODES DASHBOARD ET STATISTIQUES ====================
+    
+    def get_dashboard_data(self) -> Dict[str, Any]:
+        """
+        Récupère toutes les données nécessaires pour le tableau de bord.
+        
+        Returns:
+            Dictionnaire contenant membres, événements, abonnements, dons et groupes
+        """
+        return self._controller.get_dashboard_data()
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Récupère les statistiques globales de l'association.
+        
+        Les compteurs sont calculés en une passe par collection puis tenus à
+        jour par les notifications (Observer) : entre deux écritures, aucun
+        fichier n'est relu.
+        
+        Returns:
+            Dictionnaire avec les statistiques (nombre de membres, total finances, etc.)
+            et leurs ventilations par groupe, statut et mois
+        """
+        return self._statistics.get_statistics()
+    
+    def check_integrity(self) -> Dict[str, Any]:
+        """
+        Recherche les références vers des membres supprimés (événements, abonnements, groupes).
+        
+        Returns:
+            {"ok", "dangling", "events", "subscriptions", "groups"} (voir IntegrityChecker.check)
+        """
+        return self._integrity.check()
+    
+    # ==================== MÉTHODES MEMBRES ====================
+    
+    def get_all_members(self, sort_by: Optional[str] = None, reverse: bool = False, offset: int = 0,
+                        limit: Optional[int] = None, fields: Optional[List[str]] = None,
+                        start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère tous les membres (étudiants et professeurs).
+        
+        Args:
+            sort_by: Critère de tri ("name", "date", "group", "status") ou None pour pas de tri
+            reverse: Si True, trie en ordre décroissant
+            offset: Nombre d'éléments à sauter
+            limit: Nombre maximum d'éléments retournés (None = tous)
+            fields: Champs à conserver dans chaque élément (None = tous)
+            start, end: Bornes incluses sur la date d'inscription (ISO) ;
+                sans tri, les membres de l'intervalle sont servis par date croissante
+            
+        Returns:
+            Liste des membres, optionnellement triés
+        """
+        member_controller = self._controller.get_member_controller()
+        if sort_by:
+            return member_controller.get_all_members_sorted(sort_by, reverse, offset, limit, fields, start, end)
+        return member_controller.get_all_members(offset, limit, fields, start, end)
+    
+    def get_students(self, sort_by: Optional[str] = None, reverse: bool = False, offset: int = 0,
+                     limit: Optional[int] = None, fields: Optional[List[str]] = None,
+                     start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère uniquement les étudiants.
+        
+        Args:
+            sort_by: Critère de tri ("name", "date", "group", "status") ou None pour pas de tri
+            reverse: Si True, trie en ordre décroissant
+            offset: Nombre d'éléments à sauter
+            limit: Nombre maximum d'éléments retournés (None = tous)
+            fields: Champs à conserver dans chaque élément (None = tous)
+            start, end: Bornes incluses sur la date d'inscription (ISO) ;
+                sans tri, les membres de l'intervalle sont servis par date croissante
+            
+        Returns:
+            Liste des étudiants, optionnellement triés
+        """
+        member_controller = self._controller.get_member_controller()
+        if sort_by:
+            return member_controller.get_students_sorted(sort_by, reverse, offset, limit, fields, start, end)
+        return member_controller.get_students(offset, limit, fields, start, end)
+    
+    def get_teachers(self, sort_by: Optional[str] = None, reverse: bool = False, offset: int = 0,
+                     limit: Optional[int] = None, fields: Optional[List[str]] = None,
+                     start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère uniquement les professeurs.
+        
+        Args:
+            sort_by: Critère de tri ("name", "date") ou None pour pas de tri
+            reverse: Si True, trie en ordre décroissant
+            offset: Nombre d'éléments à sauter
+            limit: Nombre maximum d'éléments retournés (None = tous)
+            fields: Champs à conserver dans chaque élément (None = tous)
+            start, end: Bornes incluses sur la date d'inscription (ISO) ;
+                sans tri, les membres de l'intervalle sont servis par date croissante
+            
+        Returns:
+            Liste des professeurs, optionnellement triés
+        """
+        member_controller = self._controller.get_member_controller()
+        if sort_by:
+            return member_controller.get_teachers_sorted(sort_by, reverse, offset, limit, fields, start, end)
+        return member_controller.get_teachers(offset, limit, fields, start, end)
+    
+    def get_member_by_id(self, member_id: int, member_type: str = "student") -> Optional[Dict[str, Any]]:
+        """Récupère un membre par son ID"""
+        return self._controller.get_member_controller().get_member_by_id(member_id, member_type)
+    
+    def add_member(self, member: Dict[str, Any]) -> None:
+        """Ajoute un nouveau membre"""
+        self._controller.get_member_controller().add_member(member)
+    
+    def delete_member(self, member_id: int, member_type: str = "student", cascade: bool = False) -> bool:
+        """Supprime un membre par son ID ; avec cascade, aussi les références qui le citent"""
+        return self._controller.delete_member(member_id, member_type, cascade) is not None
+    
+    def create_student(self, **kwargs) -> Dict[str, Any]:
+        """Crée un étudiant en utilisant la Factory"""
+        return self._controller.get_member_controller().create_student(**kwargs)
+    
+    def create_teacher(self, **kwargs) -> Dict[str, Any]:
+        """Crée un professeur en utilisant la Factory"""
+        return self._controller.get_member_controller().create_teacher(**kwargs)
+    
+    def regroup_students(self, student_ids: List[int], group: Optional[int]) -> int:
+        """Affecte plusieurs étudiants à un groupe en une seule écriture"""
+        return self._controller.get_member_controller().regroup_students(student_ids, group)
+    
+    def move_group(self, old_group: int, new_group: int) -> Dict[str, int]:
+        """Déplace une classe entière (étudiants et liens enseignants) d'un groupe à un autre"""
+        return self._controller.move_group(old_group, new_group)
+    
+    # ==================== MÉTHODES GROUPES ====================
+    
+    def get_groups(self) -> List[Dict[str, Any]]:
+        """Récupère les groupes avec leurs enseignants et étudiants ({"group_id", "teacher_ids", "student_ids"})"""
+        return self._controller.get_group_controller().get_groups()
+    
+    def get_group(self, group_id: int) -> Optional[Dict[str, Any]]:
+        """Récupère un groupe par son numéro"""
+        return self._controller.get_group_controller().get_group(group_id)
+    
+    def link_teacher_to_group(self, group_id: int, teacher_id: int) -> bool:
+        """Lie un professeur à un groupe"""
+        return self._controller.get_group_controller().link_teacher(group_id, teacher_id)
+    
+    def unlink_teacher_from_group(self, group_id: int, teacher_id: int) -> bool:
+        """Retire le lien entre un professeur et un groupe"""
+        return self._controller.get_group_controller().unlink_teacher(group_id, teacher_id)
+    
+    def migrate_group_links(self) -> int:
+        """Migre les anciens liens "[GROUP_LINK]" stockés en événements (à appeler une fois au lancement)"""
+        return self._controller.migrate_group_links()
+    
+    # ==================== MÉTHODES ÉVÉNEMENTS ====================
+    
+    def get_all_events(self, offset: int = 0, limit: Optional[int] = None, fields: Optional[List[str]] = None,
+                       start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Récupère tous les événements (optionnellement une page, un intervalle de dates, réduits aux champs demandés)"""
+        return self._controller.get_event_controller().get_all_events(offset, limit, fields, start, end)
+    
+    def get_event_by_name(self, event_name: str) -> Optional[Dict[str, Any]]:
+        """Récupère un événement par son nom"""
+        return self._controller.get_event_controller().get_event_by_name(event_name)
+    
+    def get_events_by_date(self, date: str) -> List[Dict[str, Any]]:
+        """Récupère les événements pour une date donnée"""
+        return self._controller.get_event_controller().get_events_by_date(date)
+    
+    def add_event(self, event: Dict[str, Any]) -> None:
+        """Ajoute un nouvel événement"""
+        self._controller.get_event_controller().add_event(event)
+    
+    def delete_event(self, event_name: str) -> bool:
+        """Supprime un événement par son nom"""
+        return self._controller.get_event_controller().delete_event(event_name)
+    
+    def get_member_events(self, member_id: int, member_type: str = "student", offset: int = 0,
+                          limit: Optional[int] = None, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Récupère les événements d'un membre, via l'index de participation.
+        
+        Args:
+            member_id: ID de l'étudiant ou du professeur
+            member_type: "student" (événements où il participe) ou
+                "teacher" (événements qu'il organise)
+            offset, limit, fields: Pagination et projection, comme get_all_events
+        """
+        event_controller = self._controller.get_event_controller()
+        if member_type == "teacher":
+            return event_controller.get_events_for_teacher(member_id, offset, limit, fields)
+        return event_controller.get_events_for_student(member_id, offset, limit, fields)
+    
+    def get_event_attendance(self, event_name: str) -> Optional[Dict[str, Any]]:
+        """Nombre d'organisateurs et de participants d'un événement"""
+        return self._controller.get_event_controller().get_attendance(event_name)
+    
+    def get_attendance_counts(self, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Effectifs (organisateurs, participants) de tous les événements"""
+        return self._controller.get_event_controller().get_attendance_counts(offset, limit)
+    
+    # ==================== MÉTHODES FINANCES ====================
+    
+    def get_all_subscriptions(self, offset: int = 0, limit: Optional[int] = None,
+                              fields: Optional[List[str]] = None, start: Optional[str] = None,
+                              end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Récupère tous les abonnements (optionnellement une page, un intervalle de dates, réduits aux champs demandés)"""
+        return self._controller.get_finance_controller().get_all_subscriptions(offset, limit, fields, start, end)
+    
+    def get_all_donations(self, offset: int = 0, limit: Optional[int] = None,
+                          fields: Optional[List[str]] = None, start: Optional[str] = None,
+                          end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Récupère tous les dons (optionnellement une page, un intervalle de dates, réduits aux champs demandés)"""
+        return self._controller.get_finance_controller().get_all_donations(offset, limit, fields, start, end)
+    
+    def get_subscriptions_by_student(self, student_id: int) -> List[Dict[str, Any]]:
+        """Récupère les abonnements d'un étudiant"""
+        return self._controller.get_finance_controller().get_subscriptions_by_student(student_id)
+    
+    def get_subscriptions_by_status(self, status: str) -> List[Dict[str, Any]]:
+        """Récupère les abonnements par statut"""
+        return self._controller.get_finance_controller().get_subscriptions_by_status(status)
+    
+    def get_donations_by_date(self, date: str) -> List[Dict[str, Any]]:
+        """Récupère les dons effectués à une date donnée"""
+        return self._controller.get_finance_controller().get_donations_by_date(date)
+    
+    def get_subscriptions_between(self, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Récupère les abonnements d'une période (dates ISO incluses)"""
+        return self._controller.get_finance_controller().get_subscriptions_between(start, end)
+    
+    def get_donations_between(self, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Récupère les dons d'une période (dates ISO incluses)"""
+        return self._controller.get_finance_controller().get_donations_between(start, end)
+    
+    def calculate_total_donations(self) -> float:
+        """Calcule le total des dons"""
+        return self._controller.get_finance_controller().calculate_total_donations()
+    
+    def calculate_total_subscriptions(self, status: Optional[str] = None) -> float:
+        """Calcule le total des abonnements, optionnellement filtré par statut"""
+        return self._controller.get_finance_controller().calculate_total_subscriptions(status)
+    
+    def add_subscription(self, subscription: Dict[str, Any]) -> None:
+        """Ajoute un nouvel abonnement"""
+        self._controller.get_finance_controller().add_subscription(subscription)
+    
+    def delete_subscription(self, student_id: int, date: str) -> bool:
+        """Supprime un abonnement"""
+        return self._controller.get_finance_controller().delete_subscription(student_id, date)
+    
+    def add_donation(self, donation: Dict[str, Any]) -> None:
+        """Ajoute un nouveau don"""
+        self._controller.get_finance_controller().add_donation(donation)
+    
+    def delete_donation(self, donor_name: str, date: str, amount: float) -> bool:
+        """Supprime un don"""
+        return self._controller.get_finance_controller().delete_donation(donor_name, date, amount)
+    
+    # ==================== MÉTHODES OBSERVER ====================
+    
+    def attach_observer(self, observer) -> None:
+        """
+        Attache un observer pour être notifié des changements.
+        
+        Args:
+            observer: Instance d'Observer à attacher
+        """
+        self._controller.attach_observer(observer)
+    
+    # ==================== MÉTHODES UTILITAIRES ====================
+    
+    def get_controller(self) -> AssociationController:
+        """
+        Retourne le contrôleur principal (pour accès avancé si nécessaire).
+        
+        Returns:
+            Le contrôleur AssociationController
+        """
+        return self._controller
+
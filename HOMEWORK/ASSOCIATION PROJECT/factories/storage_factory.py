@@ -0,0 +1,43 @@
+from __future__ import annotations
+import os
+from pathlib import Path
+
+from interfaces.storage_interface import StorageInterface
+from storage.json_storage import JSONStorage
+from storage.cached_json_storage import CachedJSONStorage
+from storage.journaled_json_storage import JournaledJSONStorage
+from storage.partitioned_json_storage import PartitionedJSONStorage
+from storage.sqlite_storage import SQLiteStorage
+
+
+class StorageFactory:
+    """
+    Choisit le backend de stockage à partir de la variable MADRASSA_STORAGE :
+
+    - "cached" (défaut) : fichiers JSON avec cache mémoire
+    - "journal" : fichiers JSON + journal d'ajouts (JSON-lines)
+    - "json" : fichiers JSON relus à chaque accès
+    - "partitioned" : comme "cached", abonnements et dons découpés en un
+      fichier par mois (MADRASSA_PARTITION=year pour un fichier par année)
+    - "sqlite" : base SQLite (MADRASSA_DB, par défaut data/madrassa.db)
+
+    Les backends "cached", "journal" et "partitioned" gardent des instantanés binaires des
+    fichiers JSON dans data/.snapshots pour accélérer le démarrage
+    (MADRASSA_SNAPSHOTS=0 pour les désactiver).
+    """
+
+    @staticmethod
+    def create(data_dir: Path) -> StorageInterface:
+        mode = os.environ.get("MADRASSA_STORAGE", "cached").lower()
+        db_path = os.environ.get("MADRASSA_DB")
+        if mode == "sqlite" or db_path:
+            return SQLiteStorage(Path(db_path) if db_path else data_dir / "madrassa.db")
+        snapshot_dir = None if os.environ.get("MADRASSA_SNAPSHOTS") == "0" else data_dir / ".snapshots"
+        if mode == "journal":
+            return JournaledJSONStorage(data_dir, snapshot_dir=snapshot_dir)
+        if mode == "partitioned":
+            granularity = os.environ.get("MADRASSA_PARTITION", "month").lower()
+            return PartitionedJSONStorage(data_dir, granularity, snapshot_dir=snapshot_dir)
+        if mode == "json":
+            return JSONStorage(data_dir)
+        return CachedJSONStorage(data_dir, snapshot_dir=snapshot_dir)
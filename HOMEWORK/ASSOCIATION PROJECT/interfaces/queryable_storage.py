@@ -0,0 +1,34 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+
+class QueryableStorage(ABC):
+    """
+    Capacité optionnelle d'un storage : recherches ciblées sans tout charger.
+
+    Un backend qui implémente cette interface (en plus de StorageInterface)
+    sait répondre aux requêtes courantes via ses propres index. Les
+    contrôleurs l'utilisent quand elle est disponible et se rabattent sinon
+    sur un parcours de la collection complète.
+    """
+
+    @abstractmethod
+    def find_member_by_id(self, member_id: int, member_type: str = "student") -> Dict[str, Any] | None:
+        ...
+
+    @abstractmethod
+    def find_subscriptions_by_student(self, student_id: int) -> List[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def find_subscriptions_by_status(self, status: str) -> List[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def find_events_by_date(self, event_date: str) -> List[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def find_donations_by_date(self, date: str) -> List[Dict[str, Any]]:
+        ...
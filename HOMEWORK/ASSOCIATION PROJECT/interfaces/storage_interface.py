@@ -1,37 +1,255 @@
-from __future__ import annotations
-from abc import ABC, abstractmethod
-from typing import Any, List, Dict
-
-
-class StorageInterface(ABC):
-    @abstractmethod
-    def load_members(self) -> List[Dict[str, Any]]:
-        ...
-
-    @abstractmethod
-    def load_events(self) -> List[Dict[str, Any]]:
-        ...
-
-    @abstractmethod
-    def load_subscriptions(self) -> List[Dict[str, Any]]:
-        ...
-
-    @abstractmethod
-    def load_donations(self) -> List[Dict[str, Any]]:
-        ...
-    
-    @abstractmethod
-    def save_members(self, members: List[Dict[str, Any]]) -> None:
-        ...
-    
-    @abstractmethod
-    def save_events(self, events: List[Dict[str, Any]]) -> None:
-        ...
-    
-    @abstractmethod
-    def save_subscriptions(self, subscriptions: List[Dict[str, Any]]) -> None:
-        ...
-    
-    @abstractmethod
-    def save_donations(self, donations: List[Dict[str, Any]]) -> None:
-        ...
\ No newline at end of file
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from contextlib import ExitStack, nullcontext
+from typing import Any, Callable, ContextManager, Iterator, List, Dict, TypeVar
+
+from models.records import iso_day
+
+T = TypeVar("T")
+
+
+class VersionConflictError(RuntimeError):
+    """Une collection a été modifiée par un autre écrivain depuis son chargement"""
+
+
+def date_in_range(record: Dict[str, Any], start: str | None, end: str | None, field: str = "date") -> bool:
+    """
+    Vrai si la date ISO du champ `field` est dans [start, end] (bornes incluses).
+
+    Seul le jour "YYYY-MM-DD" est comparé, complété de zéros ("2025-5-2" est
+    le 2025-05-02) ; une borne None est ouverte. Un enregistrement sans date
+    valide n'est dans aucun intervalle borné.
+    """
+    if start is None and end is None:
+        return True
+    day = iso_day(record.get(field))
+    if day is None:
+        return False
+    return (start is None or (iso_day(start) or start) <= day) and (end is None or day <= (iso_day(end) or end))
+
+
+def replace_in_range(records: List[Dict[str, Any]], start: str | None, end: str | None,
+                     replacement: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Remplace les enregistrements datés dans [start, end] par `replacement`.
+
+    Les enregistrements hors intervalle gardent leur position ; ceux de
+    `replacement` occupent dans l'ordre les places libérées, le surplus est
+    ajouté en fin de liste.
+    """
+    pending = iter(replacement)
+    result: List[Dict[str, Any]] = []
+    for record in records:
+        if not date_in_range(record, start, end):
+            result.append(record)
+            continue
+        substitute = next(pending, None)
+        if substitute is not None:
+            result.append(substitute)
+    result.extend(pending)
+    return result
+
+
+def check_in_range(records: List[Dict[str, Any]], start: str | None, end: str | None) -> None:
+    """Lève ValueError si un enregistrement n'est pas daté dans [start, end]"""
+    outside = [r for r in records if not date_in_range(r, start, end)]
+    if outside:
+        raise ValueError(f"{len(outside)} enregistrement(s) hors de l'intervalle [{start}, {end}]")
+
+
+class StorageInterface(ABC):
+    @abstractmethod
+    def load_members(self) -> List[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def load_events(self) -> List[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def load_subscriptions(self) -> List[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def load_donations(self) -> List[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def load_groups(self) -> List[Dict[str, Any]]:
+        ...
+    
+    @abstractmethod
+    def save_members(self, members: List[Dict[str, Any]]) -> None:
+        ...
+    
+    @abstractmethod
+    def save_events(self, events: List[Dict[str, Any]]) -> None:
+        ...
+    
+    @abstractmethod
+    def save_subscriptions(self, subscriptions: List[Dict[str, Any]]) -> None:
+        ...
+    
+    @abstractmethod
+    def save_donations(self, donations: List[Dict[str, Any]]) -> None:
+        ...
+
+    @abstractmethod
+    def save_groups(self, groups: List[Dict[str, Any]]) -> None:
+        ...
+
+    # Ajouts unitaires : par défaut chargement + ajout + sauvegarde complète.
+    # Les backends capables d'écrire un seul enregistrement les surchargent.
+
+    def append_member(self, member: Dict[str, Any]) -> None:
+        with self.lock("members"):
+            members = self.load_members()
+            members.append(member)
+            self.save_members(members)
+
+    def append_event(self, event: Dict[str, Any]) -> None:
+        with self.lock("events"):
+            events = self.load_events()
+            events.append(event)
+            self.save_events(events)
+
+    def append_subscription(self, subscription: Dict[str, Any]) -> None:
+        with self.lock("subscriptions"):
+            subscriptions = self.load_subscriptions()
+            subscriptions.append(subscription)
+            self.save_subscriptions(subscriptions)
+
+    def append_donation(self, donation: Dict[str, Any]) -> None:
+        with self.lock("donations"):
+            donations = self.load_donations()
+            donations.append(donation)
+            self.save_donations(donations)
+
+    # Lecture en flux : par défaut itération sur la collection chargée. Les
+    # backends capables de lire enregistrement par enregistrement (fichiers
+    # JSON, curseur SQLite) les surchargent pour travailler en mémoire constante.
+
+    def iter_members(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.load_members())
+
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.load_events())
+
+    def iter_subscriptions(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.load_subscriptions())
+
+    def iter_donations(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.load_donations())
+
+    def iter_groups(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.load_groups())
+
+    # Lecture et écriture par intervalle de dates (champ "date", ISO, bornes
+    # incluses) pour les collections financières. Par défaut filtrage de la
+    # collection complète ; les backends partitionnés ou indexés par date ne
+    # lisent et n'écrivent que la partie concernée.
+
+    def load_subscriptions_between(self, start: str | None = None, end: str | None = None) -> List[Dict[str, Any]]:
+        return [s for s in self.iter_subscriptions() if date_in_range(s, start, end)]
+
+    def load_donations_between(self, start: str | None = None, end: str | None = None) -> List[Dict[str, Any]]:
+        return [d for d in self.iter_donations() if date_in_range(d, start, end)]
+
+    def save_subscriptions_between(self, start: str | None, end: str | None,
+                                   subscriptions: List[Dict[str, Any]]) -> None:
+        """Remplace les abonnements datés dans [start, end] par `subscriptions` (voir replace_in_range)"""
+        check_in_range(subscriptions, start, end)
+        with self.lock("subscriptions"):
+            self.save_subscriptions(replace_in_range(self.load_subscriptions(), start, end, subscriptions))
+
+    def save_donations_between(self, start: str | None, end: str | None,
+                               donations: List[Dict[str, Any]]) -> None:
+        """Remplace les dons datés dans [start, end] par `donations` (voir replace_in_range)"""
+        check_in_range(donations, start, end)
+        with self.lock("donations"):
+            self.save_donations(replace_in_range(self.load_donations(), start, end, donations))
+
+    # Accès par nom de collection ("members", "events", "subscriptions", "donations", "groups")
+
+    def load_collection(self, collection: str) -> List[Dict[str, Any]]:
+        loaders = {
+            "members": self.load_members,
+            "events": self.load_events,
+            "subscriptions": self.load_subscriptions,
+            "donations": self.load_donations,
+            "groups": self.load_groups,
+        }
+        if collection not in loaders:
+            raise ValueError(f"Collection inconnue : {collection}")
+        return loaders[collection]()
+
+    def save_collection(self, collection: str, records: List[Dict[str, Any]]) -> None:
+        savers = {
+            "members": self.save_members,
+            "events": self.save_events,
+            "subscriptions": self.save_subscriptions,
+            "donations": self.save_donations,
+            "groups": self.save_groups,
+        }
+        if collection not in savers:
+            raise ValueError(f"Collection inconnue : {collection}")
+        savers[collection](records)
+
+    def save_collections(self, changes: Dict[str, List[Dict[str, Any]]]) -> None:
+        """
+        Écrit plusieurs collections d'un bloc : tout ou rien.
+
+        Par défaut, une sauvegarde par collection sous leurs verrous ; si
+        l'une échoue, les collections déjà écrites sont restaurées dans leur
+        état d'origine avant de relever l'erreur. SQLiteStorage écrit tout
+        dans une seule transaction.
+        """
+        with ExitStack() as locks:
+            for collection in sorted(changes):
+                locks.enter_context(self.lock(collection))
+            originals = {collection: self.load_collection(collection) for collection in changes}
+            written: List[str] = []
+            try:
+                for collection in sorted(changes):
+                    self.save_collection(collection, changes[collection])
+                    written.append(collection)
+            except BaseException:
+                for collection in reversed(written):
+                    self.save_collection(collection, originals[collection])
+                raise
+
+    # Lecture d'une tranche : par défaut chargement complet puis découpage.
+    # Les backends capables de ne lire que la tranche (SQLite) la surchargent.
+
+    def load_page(self, collection: str, offset: int = 0, limit: int | None = None) -> List[Dict[str, Any]]:
+        """Tranche [offset, offset + limit) d'une collection, dans l'ordre d'insertion"""
+        records = self.load_collection(collection)
+        return records[offset:] if limit is None else records[offset:offset + limit]
+
+    # Concurrence : verrou par collection et numéro de version. Par défaut
+    # aucun verrou (backend mono-thread) ; JSONStorage et SQLiteStorage
+    # les implémentent.
+
+    def lock(self, collection: str) -> ContextManager[Any]:
+        """Verrou exclusif d'une collection ("members", "events", ...)"""
+        return nullcontext()
+
+    def get_version(self, collection: str) -> int:
+        """Version courante d'une collection, incrémentée à chaque écriture"""
+        return 0
+
+    def run_locked(self, collection: str, operation: Callable[[], T], retries: int = 3) -> T:
+        """
+        Exécute une séquence lecture-modification-écriture sous le verrou de la collection.
+
+        Si une écriture concurrente est détectée (VersionConflictError),
+        l'opération est rejouée depuis le début, au plus `retries` fois.
+        """
+        for attempt in range(retries):
+            try:
+                with self.lock(collection):
+                    return operation()
+            except VersionConflictError:
+                if attempt == retries - 1:
+                    raise
+        raise VersionConflictError(collection)
\ No newline at end of file
@@ -10,6 +10,8 @@ from facades.association_facade import AssociationFacade
 def run_application(storage: StorageInterface, ui: UIInterface) -> None:
     # Utilisation du pattern Facade : interface simplifiée pour accéder aux services
     facade = AssociationFacade(storage)
+    # Anciens liens "[GROUP_LINK]" migrés avant la lecture des groupes et des événements
+    facade.migrate_group_links()
     
     # La Facade récupère toutes les données nécessaires de manière simplifiée
     project = facade.get_dashboard_data()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import Any, Callable, Iterable, List
+
+from models.records import NO_DATE, Record, day_ordinal
+
+_ORDINAL = attrgetter("ordinal")
+
+
+class DateIndex:
+    """
+    Enregistrements triés par ordinal de date (voir Record.ordinal).
+
+    Un intervalle [start, end] est deux bisections sur la liste des
+    ordinaux suivies d'une tranche : O(log n + taille du résultat) au lieu
+    d'un parcours de la collection. Le tri est stable : à date égale, les
+    enregistrements gardent l'ordre du storage. Les enregistrements sans
+    date valide (NO_DATE) sont en tête et n'appartiennent à aucun intervalle,
+    pas plus que les membres restés en dictionnaires (voir decode_member).
+    """
+
+    def __init__(self, records: Iterable[Any] = ()) -> None:
+        self._records: List[Record] = sorted((r for r in records if isinstance(r, Record)), key=_ORDINAL)
+        self._ordinals: List[int] = [record.ordinal for record in self._records]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, record: Any) -> None:
+        """Insère un enregistrement ajouté en fin de collection (après ceux de même date)"""
+        if not isinstance(record, Record):
+            return
+        position = bisect_right(self._ordinals, record.ordinal)
+        self._ordinals.insert(position, record.ordinal)
+        self._records.insert(position, record)
+
+    def remove(self, predicate: Callable[[Record], bool]) -> None:
+        """Retire les enregistrements retenus par predicate (l'ordre des autres est conservé)"""
+        kept = [record for record in self._records if not predicate(record)]
+        if len(kept) != len(self._records):
+            self._records = kept
+            self._ordinals = [record.ordinal for record in kept]
+
+    def between(self, start: Any = None, end: Any = None) -> List[Record]:
+        """
+        Enregistrements datés entre start et end, bornes incluses, par date croissante.
+
+        Args:
+            start, end: Dates ISO (ou date) ; None = sans borne. Une borne
+                invalide ne correspond à aucun enregistrement.
+        """
+        first = NO_DATE + 1
+        if start is not None:
+            first = day_ordinal(start)
+            if first == NO_DATE:
+                return []
+        low = bisect_left(self._ordinals, first)
+        if end is None:
+            return self._records[low:]
+        last = day_ordinal(end)
+        if last == NO_DATE:
+            return []
+        return self._records[low:bisect_right(self._ordinals, last, low)]
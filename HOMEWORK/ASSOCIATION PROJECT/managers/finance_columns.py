@@ -0,0 +1,131 @@
+from __future__ import annotations
+from array import array
+from itertools import compress
+from operator import and_
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+from models.records import NO_DATE, Record, amount_of, day_ordinal
+
+try:
+    import numpy as np
+except ImportError:  # NumPy facultatif : réductions en Python pur (array + itertools)
+    np = None
+
+# Colonnes codées (valeurs répétées -> entier) de chaque collection financière
+SUBSCRIPTION_CODED_FIELDS = ("status", "kind")
+DONATION_CODED_FIELDS = ("source", "purpose")
+
+
+class FinanceColumns:
+    """
+    Représentation en colonnes d'une collection financière (abonnements ou dons).
+
+    - `amounts` : array('d') des montants
+    - `dates` : array('q') des dates en numéros de jour (NO_DATE si absente)
+    - une colonne array('i') par champ codé (statut, type, source, ...) :
+      chaque valeur distincte, en minuscules, reçoit un code entier
+
+    Les totaux et sommes filtrées sont des réductions masquées sur ces
+    colonnes, vectorisées avec NumPy lorsqu'il est installé.
+    FinanceController les construit en parcourant le storage et les
+    maintient comme MemberController maintient MemberIndex. Un
+    enregistrement décodé (models/records.py) fournit directement son
+    ordinal de date.
+    """
+
+    def __init__(self, coded_fields: Sequence[str], records: Iterable[Dict[str, Any]] = ()) -> None:
+        self.amounts = array("d")
+        self.dates = array("q")
+        self._codes: Dict[str, array] = {field: array("i") for field in coded_fields}
+        self._code_of: Dict[str, Dict[str, int]] = {field: {} for field in coded_fields}
+        self._ordinals: Dict[Any, int] = {}
+        for record in records:
+            self.append(record)
+
+    @classmethod
+    def for_subscriptions(cls, records: Iterable[Dict[str, Any]] = ()) -> FinanceColumns:
+        return cls(SUBSCRIPTION_CODED_FIELDS, records)
+
+    @classmethod
+    def for_donations(cls, records: Iterable[Dict[str, Any]] = ()) -> FinanceColumns:
+        return cls(DONATION_CODED_FIELDS, records)
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    # ==================== MISE À JOUR ====================
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Ajoute un enregistrement en fin de colonnes"""
+        # Lève ValueError sur un montant invalide (voir amount_of)
+        self.amounts.append(amount_of(record))
+        if isinstance(record, Record):
+            # Enregistrement décodé : la date est déjà convertie
+            ordinal = record.ordinal
+        else:
+            raw_date = record.get("date")
+            ordinal = self._ordinals.get(raw_date) if isinstance(raw_date, str) else None
+            if ordinal is None:
+                ordinal = day_ordinal(raw_date)
+                if isinstance(raw_date, str):
+                    self._ordinals[raw_date] = ordinal
+        self.dates.append(ordinal)
+        for field, codes in self._codes.items():
+            code_of = self._code_of[field]
+            value = str(record.get(field, "")).lower()
+            codes.append(code_of.setdefault(value, len(code_of)))
+
+    # ==================== RÉDUCTIONS ====================
+
+    def values(self, field: str) -> List[str]:
+        """Valeurs distinctes (en minuscules) d'un champ codé"""
+        return list(self._code_of[field])
+
+    def sum(self, start: Any = None, end: Any = None, **filters: str) -> float:
+        """
+        Somme des montants des enregistrements retenus.
+
+        Args:
+            start, end: Bornes incluses sur la date (ISO ou date) ; None = sans borne
+            **filters: Valeur attendue par champ codé, insensible à la casse
+                (ex. status="paid")
+        """
+        codes = []
+        for field, value in filters.items():
+            code = self._code_of[field].get(str(value).lower())
+            if code is None:
+                return 0.0
+            codes.append((self._codes[field], code))
+        first = NO_DATE + 1 if start is None else day_ordinal(start)
+        last = None if end is None else day_ordinal(end)
+        by_date = start is not None or end is not None
+
+        if np is not None:
+            return self._sum_numpy(codes, first, last, by_date)
+
+        masks: List[Iterator[bool]] = [map(code.__eq__, column) for column, code in codes]
+        if by_date:
+            masks.append(map(first.__le__, self.dates))
+            if last is not None:
+                masks.append(map(last.__ge__, self.dates))
+        if not masks:
+            return sum(self.amounts, 0.0)
+        mask = masks[0]
+        for other in masks[1:]:
+            mask = map(and_, mask, other)
+        return sum(compress(self.amounts, mask), 0.0)
+
+    def _sum_numpy(self, codes: List[tuple[array, int]], first: int, last: int | None, by_date: bool) -> float:
+        # Vues sans copie sur les tampons des arrays, libérées avant tout append
+        amounts = np.frombuffer(self.amounts, dtype=np.float64)
+        mask = None
+        for column, code in codes:
+            condition = np.frombuffer(column, dtype=np.intc) == code
+            mask = condition if mask is None else mask & condition
+        if by_date:
+            dates = np.frombuffer(self.dates, dtype=np.int64)
+            condition = dates >= first
+            if last is not None:
+                condition &= dates <= last
+            mask = condition if mask is None else mask & condition
+        return float(amounts.sum() if mask is None else amounts[mask].sum())
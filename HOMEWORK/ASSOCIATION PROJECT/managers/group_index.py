@@ -0,0 +1,82 @@
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List
+
+from managers.participation_index import member_key
+
+
+def group_key(group: Any) -> int | None:
+    """Numéro de groupe normalisé (3, "3", " 3 ") ; None = sans groupe (None, "", 0 ou invalide)"""
+    if type(group) is not int:
+        try:
+            group = int(str(group).strip())
+        except (TypeError, ValueError):
+            return None
+    return group or None
+
+
+class GroupIndex:
+    """
+    Liens enseignant-groupe de la collection des groupes.
+
+    - enseignants par groupe (IDs normalisés par member_key, dans l'ordre des liens)
+    - groupes par enseignant
+
+    Un enregistrement de groupe a la forme {"group_id": 3, "teacher_ids": [5, 7]}.
+    Plusieurs enregistrements du même groupe sont fusionnés.
+
+    Comme MemberIndex, l'index ne lit pas le storage : GroupController le
+    construit à partir de la collection et le maintient à chaque écriture.
+    """
+
+    def __init__(self, groups: Iterable[Dict[str, Any]] = ()) -> None:
+        self.teachers_by_group: Dict[int, List[Any]] = {}
+        self.groups_by_teacher: Dict[Any, List[int]] = {}
+        for group in groups:
+            self.add(group)
+
+    # ==================== MISE À JOUR ====================
+
+    def add(self, group: Dict[str, Any]) -> None:
+        """Indexe un enregistrement de groupe (sans numéro valide, il est ignoré)"""
+        group_id = group_key(group.get("group_id"))
+        if group_id is None:
+            return
+        self.teachers_by_group.setdefault(group_id, [])
+        for teacher_id in group.get("teacher_ids") or []:
+            self.link(group_id, teacher_id)
+
+    def link(self, group_id: int, teacher_id: Any) -> None:
+        teacher = member_key(teacher_id)
+        teachers = self.teachers_by_group.setdefault(group_id, [])
+        if teacher not in teachers:
+            teachers.append(teacher)
+            self.groups_by_teacher.setdefault(teacher, []).append(group_id)
+
+    def unlink(self, group_id: int, teacher_id: Any) -> None:
+        teacher = member_key(teacher_id)
+        teachers = self.teachers_by_group.get(group_id)
+        if teachers is None or teacher not in teachers:
+            return
+        teachers.remove(teacher)
+        groups = self.groups_by_teacher[teacher]
+        groups.remove(group_id)
+        if not groups:
+            del self.groups_by_teacher[teacher]
+
+    def move(self, old_group: int, new_group: int) -> None:
+        """Rattache au groupe `new_group` les enseignants de `old_group` (voir GroupController.move_group)"""
+        for teacher in list(self.teachers_by_group.get(old_group, ())):
+            self.unlink(old_group, teacher)
+            self.link(new_group, teacher)
+        self.teachers_by_group.pop(old_group, None)
+
+    # ==================== RECHERCHES ====================
+
+    def teachers(self, group_id: Any) -> List[Any]:
+        return list(self.teachers_by_group.get(group_key(group_id), ()))
+
+    def groups_of(self, teacher_id: Any) -> List[int]:
+        return list(self.groups_by_teacher.get(member_key(teacher_id), ()))
+
+    def group_ids(self) -> List[int]:
+        return list(self.teachers_by_group)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, List
+
+
+class KeyIndex:
+    """
+    Enregistrements regroupés par clé (ex. l'étudiant d'un abonnement).
+
+    Une recherche par clé est une lecture de dictionnaire au lieu d'un
+    parcours de la collection ; les enregistrements d'une même clé gardent
+    l'ordre du storage. Comme DateIndex, l'index est construit et maintenu
+    par RecordCache.
+    """
+
+    def __init__(self, key: Callable[[Any], Any], records: Iterable[Any] = ()) -> None:
+        self._key = key
+        self._groups: Dict[Any, List[Any]] = {}
+        for record in records:
+            self.add(record)
+
+    def add(self, record: Any) -> None:
+        """Indexe un enregistrement ajouté en fin de collection"""
+        key = self._key(record)
+        records = self._groups.get(key)
+        if records is None:
+            self._groups[key] = [record]
+        else:
+            records.append(record)
+
+    def remove(self, predicate: Callable[[Any], bool]) -> None:
+        """Retire les enregistrements retenus par predicate"""
+        for key in list(self._groups):
+            kept = [record for record in self._groups[key] if not predicate(record)]
+            if kept:
+                self._groups[key] = kept
+            else:
+                del self._groups[key]
+
+    def find(self, key: Any) -> List[Any]:
+        return list(self._groups.get(key, ()))
@@ -0,0 +1,140 @@
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List
+
+from models.records import MemberRecord, StudentRecord
+
+
+def normalize_email(email: Any) -> str:
+    """Clé d'index d'un email : sans espaces, en minuscules ("" si absent)"""
+    return str(email or "").strip().lower()
+
+
+class MemberIndex:
+    """
+    Index secondaires de la collection des membres.
+
+    - par student_id / teacher_id (premier membre portant l'ID, comme un
+      parcours de la liste)
+    - par email normalisé (liste : d'anciens fichiers peuvent contenir des doublons)
+    - étudiants par `groupe` et par `subscription_status` (en minuscules)
+    - plus grand student_id / teacher_id, pour allouer l'ID suivant en O(1)
+
+    L'index ne lit pas le storage : MemberController le reconstruit à partir
+    des membres décodés (StudentRecord / TeacherRecord) et le maintient à
+    chaque ajout, suppression ou changement de groupe. Les membres indexés
+    sont partagés avec le cache des enregistrements et ne doivent pas être
+    modifiés.
+    """
+
+    def __init__(self, members: Iterable[MemberRecord] = ()) -> None:
+        self.by_student_id: Dict[Any, MemberRecord] = {}
+        self.by_teacher_id: Dict[Any, MemberRecord] = {}
+        self.by_email: Dict[str, List[MemberRecord]] = {}
+        self.students_by_group: Dict[Any, Dict[Any, StudentRecord]] = {}
+        self.students_by_status: Dict[str, Dict[Any, StudentRecord]] = {}
+        self._max_student_id = 0
+        self._max_teacher_id = 0
+        for member in members:
+            self.add(member)
+
+    # ==================== MISE À JOUR ====================
+
+    def add(self, member: MemberRecord) -> None:
+        """Indexe un membre ajouté en fin de collection"""
+        email = normalize_email(member.get("email"))
+        if email:
+            self.by_email.setdefault(email, []).append(member)
+
+        if "student_id" in member:
+            student_id = member["student_id"]
+            self.by_student_id.setdefault(student_id, member)
+            self._max_student_id = max(self._max_student_id, self._as_int(student_id))
+            self._index_student(member)
+        if "teacher_id" in member:
+            teacher_id = member["teacher_id"]
+            self.by_teacher_id.setdefault(teacher_id, member)
+            self._max_teacher_id = max(self._max_teacher_id, self._as_int(teacher_id))
+
+    def remove(self, member_id: Any, member_type: str = "student") -> None:
+        """Retire tous les membres portant cet ID (comme MemberController.delete_member)"""
+        id_key = f"{member_type}_id"
+        by_id = self.by_student_id if member_type == "student" else self.by_teacher_id
+        member = by_id.pop(member_id, None)
+        if member is None:
+            return
+        if member_type == "student":
+            self._unindex_student(member)
+            if self._as_int(member_id) == self._max_student_id:
+                self._max_student_id = max(map(self._as_int, self.by_student_id), default=0)
+        elif self._as_int(member_id) == self._max_teacher_id:
+            self._max_teacher_id = max(map(self._as_int, self.by_teacher_id), default=0)
+
+        email = normalize_email(member.get("email"))
+        same_email = self.by_email.get(email)
+        if same_email is not None:
+            same_email[:] = [m for m in same_email if m.get(id_key) != member_id]
+            if not same_email:
+                del self.by_email[email]
+
+    def set_group(self, student_id: Any, group: Any) -> None:
+        """Met à jour le groupe d'un étudiant indexé (comme MemberController.update_student_group)"""
+        old = self.by_student_id.get(student_id)
+        if old is None:
+            return
+        new = old.replace(groupe=group)
+        self._unindex_student(old)
+        self.by_student_id[student_id] = new
+        self._index_student(new)
+        same_email = self.by_email.get(normalize_email(old.get("email")), [])
+        for position, member in enumerate(same_email):
+            if member is old:
+                same_email[position] = new
+
+    def _index_student(self, member: StudentRecord) -> None:
+        student_id = member["student_id"]
+        if self.by_student_id.get(student_id) is not member:
+            return  # ID en double : seul le premier membre est indexé
+        self.students_by_group.setdefault(member.get("groupe"), {})[student_id] = member
+        status = str(member.get("subscription_status", "")).lower()
+        self.students_by_status.setdefault(status, {})[student_id] = member
+
+    def _unindex_student(self, member: StudentRecord) -> None:
+        student_id = member["student_id"]
+        for bucket, key in ((self.students_by_group, member.get("groupe")),
+                            (self.students_by_status, str(member.get("subscription_status", "")).lower())):
+            members = bucket.get(key)
+            if members is not None and members.get(student_id) is member:
+                del members[student_id]
+                if not members:
+                    del bucket[key]
+
+    @staticmethod
+    def _as_int(value: Any) -> int:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return 0
+
+    # ==================== RECHERCHES ====================
+
+    def find(self, member_id: Any, member_type: str = "student") -> MemberRecord | None:
+        """Membre par student_id ou teacher_id"""
+        by_id = self.by_student_id if member_type == "student" else self.by_teacher_id
+        return by_id.get(member_id)
+
+    def find_by_email(self, email: str) -> MemberRecord | None:
+        """Premier membre utilisant cet email (comparaison insensible à la casse)"""
+        same_email = self.by_email.get(normalize_email(email))
+        return same_email[0] if same_email else None
+
+    def students_in_group(self, group: Any) -> List[StudentRecord]:
+        return list(self.students_by_group.get(group, {}).values())
+
+    def students_with_status(self, status: str) -> List[StudentRecord]:
+        return list(self.students_by_status.get(str(status).lower(), {}).values())
+
+    def next_student_id(self) -> int:
+        return self._max_student_id + 1
+
+    def next_teacher_id(self) -> int:
+        return self._max_teacher_id + 1
@@ -1,5 +1,10 @@
+from dataclasses import asdict, fields
+from datetime import date
 from typing import List
 from models.member import Member
+from models.records import StudentRecord, TeacherRecord, decode_member
+from models.student import Student
+from models.teacher import Teacher
 from interfaces.storage import Storage
 
 class MemberRepository:
@@ -7,9 +12,26 @@ class MemberRepository:
         self._storage = storage
 
     def save_all(self, members: List[Member]) -> None:
-        data = [m.__dict__ for m in members]
+        data = []
+        for m in members:
+            record = asdict(m)
+            if isinstance(record.get("join_date"), date):
+                record["join_date"] = record["join_date"].isoformat()
+            data.append(record)
         self._storage.save_members(data)
 
     def load_all(self) -> List[Member]:
-        records = self._storage.load_members()
-        return [Member(**r) for r in records]
+        # Les enregistrements sont décodés (dates parsées, valeurs par défaut)
+        # puis convertis en Student / Teacher ; les membres sans student_id
+        # ni teacher_id ne correspondent à aucun modèle et sont ignorés
+        members: List[Member] = []
+        for raw in self._storage.load_members():
+            record = decode_member(raw)
+            if isinstance(record, StudentRecord):
+                model = Student
+            elif isinstance(record, TeacherRecord):
+                model = Teacher
+            else:
+                continue
+            members.append(model(**{f.name: getattr(record, f.name) for f in fields(model)}))
+        return members
@@ -0,0 +1,130 @@
+from __future__ import annotations
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
+
+from models.records import EventRecord
+
+
+def member_key(member_id: Any) -> Any:
+    """Clé d'index d'un ID de membre : entier si possible (1, "1" et " 1 " désignent le même membre)"""
+    if type(member_id) is int:
+        return member_id
+    try:
+        return int(member_id)
+    except (TypeError, ValueError):
+        return str(member_id).strip()
+
+
+class ParticipationIndex:
+    """
+    Index inversé de la participation aux événements.
+
+    - événements par étudiant (participant_ids) et par enseignant (organizer_ids)
+    - nombre d'organisateurs et de participants de chaque événement
+
+    Un membre cité plusieurs fois dans un même événement n'est compté qu'une
+    fois. Les listes d'un membre suivent l'ordre de la collection.
+
+    Comme MemberIndex, l'index ne lit pas le storage : EventController le
+    construit à partir des événements décodés (EventRecord) et le maintient
+    à chaque ajout ou suppression.
+    """
+
+    def __init__(self, events: Iterable[EventRecord] = ()) -> None:
+        self.events_by_student: Dict[Any, List[EventRecord]] = {}
+        self.events_by_teacher: Dict[Any, List[EventRecord]] = {}
+        # Nom -> [(événement, organisateurs, participants)] ; noms dans l'ordre de première apparition
+        self._by_name: Dict[str, List[Tuple[EventRecord, FrozenSet[Any], FrozenSet[Any]]]] = {}
+        for event in events:
+            self.add(event)
+
+    # ==================== MISE À JOUR ====================
+
+    def add(self, event: EventRecord) -> None:
+        """Indexe un événement ajouté en fin de collection"""
+        organizers = frozenset(map(member_key, event.organizer_ids))
+        participants = frozenset(map(member_key, event.participant_ids))
+        self._by_name.setdefault(event.event_name, []).append((event, organizers, participants))
+        for bucket, keys in ((self.events_by_teacher, organizers), (self.events_by_student, participants)):
+            for key in keys:
+                events = bucket.get(key)
+                if events is None:
+                    bucket[key] = [event]
+                else:
+                    events.append(event)
+
+    def remove(self, event_name: str) -> None:
+        """Retire tous les événements portant ce nom (comme EventController.delete_event)"""
+        for event, organizers, participants in self._by_name.pop(event_name, []):
+            self._unindex(self.events_by_teacher, organizers, event)
+            self._unindex(self.events_by_student, participants, event)
+
+    def replace(self, old: EventRecord, new: EventRecord) -> bool:
+        """
+        Remplace un événement indexé par sa version modifiée, à la même place.
+
+        Les membres retirés de l'événement ne le voient plus dans leurs
+        listes ; les autres gardent leur ordre.
+
+        Returns:
+            False si `old` n'est pas indexé (index à reconstruire)
+        """
+        entries = self._by_name.get(old.event_name, [])
+        for position, (event, organizers, participants) in enumerate(entries):
+            if event is old:
+                break
+        else:
+            return False
+        new_organizers = frozenset(map(member_key, new.organizer_ids))
+        new_participants = frozenset(map(member_key, new.participant_ids))
+        if new.event_name == old.event_name:
+            entries[position] = (new, new_organizers, new_participants)
+        else:
+            del entries[position]
+            if not entries:
+                del self._by_name[old.event_name]
+            self._by_name.setdefault(new.event_name, []).append((new, new_organizers, new_participants))
+        for bucket, before, after in ((self.events_by_teacher, organizers, new_organizers),
+                                      (self.events_by_student, participants, new_participants)):
+            self._unindex(bucket, before - after, old)
+            for key in before & after:
+                events = bucket[key]
+                events[next(i for i, e in enumerate(events) if e is old)] = new
+            for key in after - before:
+                bucket.setdefault(key, []).append(new)
+        return True
+
+    @staticmethod
+    def _unindex(bucket: Dict[Any, List[EventRecord]], keys: FrozenSet[Any], event: EventRecord) -> None:
+        for key in keys:
+            events = bucket.get(key)
+            if events is None:
+                continue
+            events[:] = [e for e in events if e is not event]
+            if not events:
+                del bucket[key]
+
+    # ==================== RECHERCHES ====================
+
+    def events_for_student(self, student_id: Any) -> List[EventRecord]:
+        return list(self.events_by_student.get(member_key(student_id), ()))
+
+    def events_for_teacher(self, teacher_id: Any) -> List[EventRecord]:
+        return list(self.events_by_teacher.get(member_key(teacher_id), ()))
+
+    def attendance(self, event_name: str) -> Dict[str, Any] | None:
+        """Effectifs du premier événement portant ce nom (comme get_event_by_name)"""
+        entries = self._by_name.get(event_name)
+        return self._counts(*entries[0]) if entries else None
+
+    def attendance_counts(self) -> List[Dict[str, Any]]:
+        """Effectifs de tous les événements indexés"""
+        return [self._counts(*entry) for entries in self._by_name.values() for entry in entries]
+
+    @staticmethod
+    def _counts(event: EventRecord, organizers: FrozenSet[Any], participants: FrozenSet[Any]) -> Dict[str, Any]:
+        return {
+            "event_name": event.event_name,
+            "event_date": event["event_date"],
+            "organizers": len(organizers),
+            "participants": len(participants),
+        }
@@ -0,0 +1,152 @@
+from __future__ import annotations
+import threading
+from typing import Any, Callable, Dict, List
+
+from interfaces.storage_interface import StorageInterface
+from managers.date_index import DateIndex
+from managers.key_index import KeyIndex
+from models.records import DECODERS
+
+
+class RecordCache:
+    """
+    Enregistrements décodés (models/records.py) d'une collection du storage.
+
+    La collection est décodée une seule fois, puis resservie tant que sa
+    version dans le storage ne change pas. Comme MemberIndex et
+    FinanceColumns, le contrôleur propriétaire reporte ses propres écritures
+    (update) et toute autre écriture provoque un nouveau décodage complet.
+
+    La liste retournée par records() est partagée : les appelants la copient
+    avant de la transmettre ou de la modifier.
+
+    Les intervalles de dates (between) sont servis par un DateIndex construit
+    à la première demande et maintenu avec le cache ; de même, les
+    recherches par clé (find) sont servies par un KeyIndex par clé déclarée
+    dans `keys` (nom -> fonction de l'enregistrement décodé).
+    """
+
+    def __init__(self, storage: StorageInterface, collection: str,
+                 keys: Dict[str, Callable[[Any], Any]] | None = None) -> None:
+        self._storage = storage
+        self._collection = collection
+        self._decode = DECODERS[collection]
+        self._keys = keys or {}
+        self._records: List[Any] | None = None
+        self._date_index: DateIndex | None = None
+        self._key_indexes: Dict[str, KeyIndex] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def records(self) -> List[Any]:
+        """Enregistrements décodés de la collection, dans l'ordre du storage"""
+        with self._lock:
+            if self._records is not None and self._version == self._storage.get_version(self._collection):
+                return self._records
+        # Décodage hors de self._lock : l'ordre des verrous reste collection -> cache
+        iterate = getattr(self._storage, f"iter_{self._collection}")
+        with self._storage.lock(self._collection):
+            version = self._storage.get_version(self._collection)
+            records = [self._decode(record) for record in iterate()]
+        with self._lock:
+            self._records, self._version = records, version
+            self._date_index = None
+            self._key_indexes = {}
+        return records
+
+    def between(self, start: Any = None, end: Any = None) -> List[Any]:
+        """Enregistrements datés entre start et end (inclus), par date croissante (voir DateIndex)"""
+        records = self.records()
+        with self._lock:
+            if self._records is not records:
+                # Cache invalidé entre-temps : index à usage unique
+                return DateIndex(records).between(start, end)
+            if self._date_index is None:
+                self._date_index = DateIndex(records)
+            return self._date_index.between(start, end)
+
+    def find(self, name: str, key: Any) -> List[Any]:
+        """Enregistrements dont la clé `name` (déclarée dans `keys`) vaut `key`, dans l'ordre du storage"""
+        records = self.records()
+        with self._lock:
+            if self._records is not records:
+                return KeyIndex(self._keys[name], records).find(key)
+            index = self._key_indexes.get(name)
+            if index is None:
+                index = self._key_indexes[name] = KeyIndex(self._keys[name], records)
+            return index.find(key)
+
+    def decode(self, records: List[Any]) -> List[Any]:
+        """Décode des enregistrements lus hors du cache (page, intervalle de dates...)"""
+        return [self._decode(record) for record in records]
+
+    def update(self, apply: Callable[[List[Any]], None] | None) -> None:
+        """
+        Reporte sur le cache une écriture que le contrôleur vient de faire.
+
+        Si d'autres écritures ont eu lieu entre-temps, ou si `apply` est None,
+        le cache est invalidé (voir MemberController._update_index).
+        """
+        with self._lock:
+            if self._records is None:
+                return
+            current = self._storage.get_version(self._collection)
+            # apply retourne False quand il ne peut pas reporter l'écriture : le cache est alors invalidé
+            if apply is not None and (current == self._version + 1 or current == self._version == 0) \
+                    and apply(self._records) is not False:
+                self._version = current
+            else:
+                self._records = None
+                self._date_index = None
+                self._key_indexes = {}
+
+    def append(self, record: Any) -> None:
+        """Reporte l'ajout d'un enregistrement en fin de collection"""
+        decoded = self._decode(record)
+
+        def apply(records: List[Any]) -> None:
+            records.append(decoded)
+            if self._date_index is not None:
+                self._date_index.add(decoded)
+            for index in self._key_indexes.values():
+                index.add(decoded)
+
+        self.update(apply)
+
+    def remove(self, predicate: Callable[[Any], bool]) -> None:
+        """Reporte la suppression des enregistrements retenus par predicate"""
+        def apply(records: List[Any]) -> None:
+            records[:] = [record for record in records if not predicate(record)]
+            if self._date_index is not None:
+                self._date_index.remove(predicate)
+            for index in self._key_indexes.values():
+                index.remove(predicate)
+
+        self.update(apply)
+
+    def replace(self, predicate: Callable[[Any], bool], replacements: List[Any]) -> List[tuple[Any, Any]]:
+        """
+        Reporte le remplacement des enregistrements retenus par predicate.
+
+        Args:
+            replacements: Nouveaux enregistrements décodés, dans l'ordre du storage
+
+        Returns:
+            Paires (ancien, nouveau) remplacées ; vide si le cache a été invalidé
+        """
+        replaced: List[tuple[Any, Any]] = []
+
+        def apply(records: List[Any]) -> bool:
+            positions = [position for position, record in enumerate(records) if predicate(record)]
+            if len(positions) != len(replacements):
+                return False
+            for position, record in zip(positions, replacements):
+                replaced.append((records[position], record))
+                records[position] = record
+            # Index dérivés reconstruits à la demande depuis la liste, sans nouveau décodage
+            self._date_index = None
+            self._key_indexes = {}
+            return True
+
+        self.update(apply)
+        return replaced
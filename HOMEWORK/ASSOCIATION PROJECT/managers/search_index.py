@@ -0,0 +1,107 @@
+from __future__ import annotations
+import re
+from array import array
+from typing import Any, Dict, Iterable, List, Sequence
+
+# Longueur des préfixes indexés ; un terme plus long est vérifié sur le texte
+PREFIX_LENGTH = 3
+
+_WORD = re.compile(r"[^\W_]+")
+_DIGITS = re.compile(r"\D+")
+
+
+class SearchIndex:
+    """
+    Recherche « au fil de la frappe » dans des enregistrements figés.
+
+    Un terme correspond à un enregistrement si un mot d'un des champs
+    indexés commence par lui (sans tenir compte de la casse) ; les termes
+    d'une requête sont combinés par ET. Sont des mots : les mots de chaque
+    champ (lettres et chiffres), chaque champ entier (ex. l'email complet)
+    et les seuls chiffres des champs numériques (téléphone "06 12" -> "0612").
+
+    Chaque préfixe de 1 à PREFIX_LENGTH caractères d'un mot donne la liste
+    (array) des positions des enregistrements qui le contiennent : un terme
+    court est résolu par cette seule liste ; un terme plus long, ou un
+    second terme, est vérifié sur les mots des seuls candidats. Une requête
+    qui prolonge la précédente (frappe d'un caractère, terme ajouté)
+    n'examine que les résultats précédents. L'index est construit une fois
+    pour une version des données ; il ne se met pas à jour.
+    """
+
+    def __init__(self, records: Iterable[Any], fields: Sequence[str]) -> None:
+        self.records: List[Any] = list(records)
+        postings: Dict[str, List[int]] = {}
+        # Mots de chaque enregistrement, précédés d'une espace : " mot1 mot2 ..."
+        self._words: List[str] = []
+        for position, record in enumerate(self.records):
+            words = _words(record, fields)
+            self._words.append(" " + " ".join(words))
+            prefixes = {word[:PREFIX_LENGTH] for word in words}
+            for length in range(1, PREFIX_LENGTH):
+                prefixes.update([word[:length] for word in words])
+            for prefix in prefixes:
+                found = postings.get(prefix)
+                if found is None:
+                    postings[prefix] = [position]
+                else:
+                    found.append(position)
+        self._prefixes: Dict[str, array] = {prefix: array("i", found) for prefix, found in postings.items()}
+        # (termes, positions retenues) de la dernière requête, remplacés d'un bloc
+        self._last: tuple[List[str], Sequence[int]] = ([], ())
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def search(self, query: str) -> Sequence[int] | None:
+        """
+        Enregistrements correspondant à la requête.
+
+        Returns:
+            Positions croissantes (dans records) des enregistrements retenus,
+            None si la requête est vide (aucun filtre)
+        """
+        terms = query.lower().split()
+        if not terms:
+            self._last = ([], ())
+            return None
+        last_terms, found = self._last
+        if _refines(terms, last_terms):
+            unchecked = [term for term in terms if term not in last_terms]
+        else:
+            # Candidats : liste de préfixe la plus courte ; exacte pour un terme court
+            lists = [(self._prefixes.get(term[:PREFIX_LENGTH], ()), term) for term in terms]
+            found, shortest = min(lists, key=lambda entry: len(entry[0]))
+            unchecked = [term for term in terms if term is not shortest or len(term) > PREFIX_LENGTH]
+        words = self._words
+        for term in unchecked:
+            check = " " + term
+            found = [position for position in found if check in words[position]]
+        self._last = (terms, found)
+        return found
+
+
+def _refines(terms: List[str], last: List[str]) -> bool:
+    """Vrai si tout résultat de terms figure dans celui de last"""
+    if not last or len(terms) < len(last):
+        return False
+    # Termes précédents prolongés (ou répétés), termes nouveaux en plus
+    return all(term.startswith(previous) for term, previous in zip(terms, last))
+
+
+def _words(record: Any, fields: Sequence[str]) -> List[str]:
+    words: List[str] = []
+    for field in fields:
+        value = record.get(field)
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            text = str(item or "").lower().strip()
+            if not text:
+                continue
+            words.extend(_WORD.findall(text))
+            if " " not in text:
+                words.append(text)
+            digits = _DIGITS.sub("", text)
+            if len(digits) > 1 and digits != text:
+                words.append(digits)
+    return words
@@ -0,0 +1,390 @@
+"""
+Enregistrements typés des collections : membres, événements, abonnements, dons.
+
+Les storages lisent et écrivent des dictionnaires JSON ; les contrôleurs les
+décodent une seule fois (decode_*) en objets à slots :
+
+- dates ISO parsées en `datetime.date` (une date invalide garde sa valeur
+  d'origine, pour ne rien perdre), et leur numéro de jour dans `ordinal`
+  (NO_DATE si la date est absente ou invalide) pour les tris et intervalles
+- valeurs par défaut normalisées (email "", statut "Pending", listes vides...)
+- champs inconnus conservés dans `extra`
+
+Chaque enregistrement reste un Mapping en lecture seule : `record["full_name"]`,
+`record.get("groupe")`, `"student_id" in record` et `dict(record)` se
+comportent comme sur le dictionnaire JSON, dates en texte ISO comprises. Les
+vues et stratégies écrites pour des dictionnaires fonctionnent donc telles
+quelles ; `to_dict()` donne le dictionnaire JSON (API) avec les seules clés
+stockées : les valeurs par défaut et champs normalisés restent internes. Les enregistrements
+sont partagés entre caches et appelants : on les remplace (`replace`) au lieu
+de les modifier.
+"""
+from __future__ import annotations
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields, replace
+from datetime import date
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, FrozenSet, Iterator, List, Tuple
+
+
+# Ordinal d'une date absente ou invalide (les ordinaux réels commencent à 1)
+NO_DATE = 0
+
+# Tuples de clés stockées partagés entre enregistrements (voir Record.stored_keys)
+_STORED_KEYS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+# Jour en tête d'une date : "YYYY-M-D" accepté comme par DateValidator (strptime
+# "%Y-%m-%d"), suivi éventuellement d'une heure ("2025-05-01 10:30", "...T10:30")
+_DAY = re.compile(r"\s*(\d{4})-(\d{1,2})-(\d{1,2})(?!\d)")
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> date | str:
+    # Cache : les mêmes dates reviennent sur des milliers d'enregistrements,
+    # qui partagent alors un seul objet date
+    if value[4] != "-" or value[7] != "-":
+        return value
+    try:
+        parsed = date.fromisoformat(value)
+    except ValueError:
+        return value
+    return parsed if parsed.isoformat() == value else value
+
+
+def parse_date(value: Any) -> date | Any:
+    """date pour un texte "YYYY-MM-DD" valide, sinon la valeur d'origine inchangée"""
+    if isinstance(value, str) and len(value) == 10:
+        return _parse_iso(value)
+    return value
+
+
+@lru_cache(maxsize=8192)
+def _day(value: str) -> date | None:
+    match = _DAY.match(value)
+    if match is None:
+        return None
+    try:
+        return date(*map(int, match.groups()))
+    except ValueError:
+        return None
+
+
+def iso_day(value: Any) -> str | None:
+    """
+    Jour "YYYY-MM-DD" (complété de zéros) d'une date, None si elle est invalide.
+
+    >>> iso_day("2022-2-11"), iso_day("2025-05-01 10:30"), iso_day("2024-02-30")
+    ('2022-02-11', '2025-05-01', None)
+    """
+    if isinstance(value, date):
+        return value.isoformat()[:10]
+    day = _day(value) if isinstance(value, str) else None
+    return None if day is None else day.isoformat()
+
+
+def day_ordinal(value: Any) -> int:
+    """
+    Numéro de jour (date.toordinal) d'une date "YYYY-MM-DD", NO_DATE si invalide.
+
+    Mois et jour peuvent ne pas être complétés de zéros ("2022-2-11"), comme
+    pour DateValidator ; une heure après le jour est ignorée.
+
+    >>> day_ordinal("2022-2-11") == day_ordinal("2022-02-11") == date(2022, 2, 11).toordinal()
+    True
+    >>> day_ordinal("2022-13-01") == NO_DATE
+    True
+    """
+    if isinstance(value, date):
+        return value.toordinal()
+    day = _day(value if isinstance(value, str) else str(value))
+    return NO_DATE if day is None else day.toordinal()
+
+
+@lru_cache(maxsize=8192)
+def _date_ordinal(value: date) -> int:
+    # Un seul objet int par jour, partagé par les enregistrements de cette date
+    return value.toordinal()
+
+
+def _derived(default: Any) -> Any:
+    """Champ calculé à la construction : hors du dictionnaire JSON et de __init__"""
+    return field(default=default, init=False, repr=False, metadata={"derived": True})
+
+
+class Record(Mapping):
+    """
+    Base des enregistrements : vue Mapping (lecture seule) sur les champs typés.
+
+    Les sous-classes sont des dataclasses à slots déclarées avec @_record ;
+    `_DATE_FIELD` nomme le champ date, parsé à la lecture et résumé dans
+    `ordinal`. `stored_keys` garde les clés du dictionnaire décodé, dans
+    leur ordre (None pour un enregistrement construit directement).
+    """
+
+    __slots__ = ()
+
+    _FIELDS: ClassVar[Tuple[str, ...]] = ()
+    _FIELD_SET: ClassVar[FrozenSet[str]] = frozenset()
+    _DATE_FIELD: ClassVar[str]
+
+    extra: Dict[str, Any] | None
+    ordinal: int
+    stored_keys: Tuple[str, ...] | None
+
+    def __post_init__(self) -> None:
+        value = getattr(self, self._DATE_FIELD)
+        self.ordinal = _date_ordinal(value) if type(value) is date else day_ordinal(value)
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> Record:
+        """Décode un dictionnaire JSON (les champs absents prennent leur valeur par défaut)"""
+        unknown = raw.keys() - cls._FIELD_SET
+        if unknown:
+            values = {key: value for key, value in raw.items() if key not in unknown}
+            extra: Dict[str, Any] | None = {key: value for key, value in raw.items() if key in unknown}
+        else:
+            values, extra = dict(raw), None
+        key = cls._DATE_FIELD
+        if key in values:
+            values[key] = parse_date(values[key])
+        cls._normalize(values, raw)
+        record = cls(**values, extra=extra)
+        keys = tuple(raw)
+        record.stored_keys = _STORED_KEYS.setdefault(keys, keys)
+        return record
+
+    @classmethod
+    def _normalize(cls, values: Dict[str, Any], raw: Mapping[str, Any]) -> None:
+        """Complète `values` avant construction (anciens noms de champs...)"""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Dictionnaire JSON de l'enregistrement (dates en texte ISO).
+
+        Seules les clés stockées sont émises, dans leur ordre : pas de valeur
+        par défaut (statut "Pending"...) ni de champ normalisé (`full_name`
+        d'un ancien "name") que le dictionnaire d'origine n'avait pas.
+        """
+        extra = self.extra or {}
+        keys = self._FIELDS + tuple(extra) if self.stored_keys is None else self.stored_keys
+        data: Dict[str, Any] = {}
+        for key in keys:
+            value = getattr(self, key) if key in self._FIELD_SET else extra[key]
+            data[key] = value.isoformat() if type(value) is date else value
+        return data
+
+    def replace(self, **changes: Any) -> Record:
+        """Copie de l'enregistrement avec les champs donnés modifiés (et désormais stockés)"""
+        record = replace(self, **changes)
+        keys = self.stored_keys
+        if keys is not None:
+            keys += tuple(key for key in changes if key not in keys)
+            keys = _STORED_KEYS.setdefault(keys, keys)
+        record.stored_keys = keys
+        return record
+
+    # ==================== Mapping ====================
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELD_SET:
+            value = getattr(self, key)
+            return value.isoformat() if type(value) is date else value
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._FIELD_SET:
+            value = getattr(self, key)
+            return value.isoformat() if type(value) is date else value
+        if self.extra is not None:
+            return self.extra.get(key, default)
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._FIELD_SET or (self.extra is not None and key in self.extra)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._FIELDS
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return len(self._FIELDS) + (len(self.extra) if self.extra else 0)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+def _record(cls: type) -> type:
+    """Déclare une sous-classe de Record : dataclass à slots et table de ses champs"""
+    cls = dataclass(slots=True, eq=False, repr=False)(cls)
+    cls._FIELDS = tuple(f.name for f in fields(cls) if f.name != "extra" and not f.metadata.get("derived"))
+    cls._FIELD_SET = frozenset(cls._FIELDS)
+    return cls
+
+
+# ==================== MEMBRES ====================
+
+class _MemberRecord(Record):
+    __slots__ = ()
+
+    _DATE_FIELD = "join_date"
+
+    @classmethod
+    def _normalize(cls, values: Dict[str, Any], raw: Mapping[str, Any]) -> None:
+        if "full_name" not in values:
+            values["full_name"] = raw.get("name", "")
+
+
+@_record
+class StudentRecord(_MemberRecord):
+    student_id: Any
+    full_name: str = ""
+    email: str = ""
+    phone: str = ""
+    address: str = ""
+    join_date: date | str = ""
+    groupe: int | None = None
+    subscription_status: str = "Pending"
+    skills: List[str] = field(default_factory=list)
+    interests: List[str] = field(default_factory=list)
+    extra: Dict[str, Any] | None = None
+    ordinal: int = _derived(NO_DATE)
+    stored_keys: Tuple[str, ...] | None = _derived(None)
+
+
+@_record
+class TeacherRecord(_MemberRecord):
+    teacher_id: Any
+    full_name: str = ""
+    email: str = ""
+    phone: str = ""
+    address: str = ""
+    join_date: date | str = ""
+    skills: List[str] = field(default_factory=list)
+    interests: List[str] = field(default_factory=list)
+    extra: Dict[str, Any] | None = None
+    ordinal: int = _derived(NO_DATE)
+    stored_keys: Tuple[str, ...] | None = _derived(None)
+
+
+MemberRecord = StudentRecord | TeacherRecord
+
+
+# ==================== ÉVÉNEMENTS ====================
+
+@_record
+class EventRecord(Record):
+    event_name: str = ""
+    description: str = ""
+    event_date: date | str = ""
+    organizer_ids: List[Any] = field(default_factory=list)
+    participant_ids: List[Any] = field(default_factory=list)
+    extra: Dict[str, Any] | None = None
+    ordinal: int = _derived(NO_DATE)
+    stored_keys: Tuple[str, ...] | None = _derived(None)
+
+    _DATE_FIELD = "event_date"
+
+    @classmethod
+    def _normalize(cls, values: Dict[str, Any], raw: Mapping[str, Any]) -> None:
+        if "event_name" not in values:
+            values["event_name"] = raw.get("name", "")
+        if not values.get("organizer_ids"):
+            values["organizer_ids"] = raw.get("organizers_ids") or []
+        if not values.get("participant_ids"):
+            values["participant_ids"] = raw.get("participants_ids") or []
+
+
+# ==================== FINANCES ====================
+
+@_record
+class SubscriptionRecord(Record):
+    student_id: Any = None
+    amount: float = 0.0
+    date: date | str = ""
+    status: str = "unpaid"
+    kind: str = "base"
+    extra: Dict[str, Any] | None = None
+    ordinal: int = _derived(NO_DATE)
+    stored_keys: Tuple[str, ...] | None = _derived(None)
+
+    _DATE_FIELD = "date"
+
+
+@_record
+class DonationRecord(Record):
+    donor_name: str = ""
+    source: str = ""
+    amount: float = 0.0
+    date: date | str = ""
+    purpose: str = ""
+    note: str = ""
+    extra: Dict[str, Any] | None = None
+    ordinal: int = _derived(NO_DATE)
+    stored_keys: Tuple[str, ...] | None = _derived(None)
+
+    _DATE_FIELD = "date"
+
+
+def amount_of(record: Mapping[str, Any]) -> float:
+    """
+    Montant d'un abonnement ou d'un don (0.0 s'il est absent).
+
+    Règle commune aux totaux (FinanceColumns), aux statistiques
+    (StatisticsEngine) et aux ajouts (FinanceController) : un montant qui
+    n'est pas un nombre lève ValueError, comme les boucles de totaux d'origine.
+
+    >>> amount_of({"amount": "12.5"}), amount_of({})
+    (12.5, 0.0)
+    """
+    value = record.get("amount", 0.0)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Montant invalide : {value!r}") from None
+
+
+# ==================== DÉCODAGE ====================
+
+def decode_member(raw: Mapping[str, Any]) -> MemberRecord | Mapping[str, Any]:
+    """
+    Décode un membre selon son type (student_id / teacher_id).
+
+    Un enregistrement déjà décodé est retourné tel quel ; un membre sans
+    student_id ni teacher_id (ancien format à "id") reste un dictionnaire.
+    """
+    if isinstance(raw, Record):
+        return raw
+    if "student_id" in raw:
+        return StudentRecord.from_dict(raw)
+    if "teacher_id" in raw:
+        return TeacherRecord.from_dict(raw)
+    return raw
+
+
+def decode_event(raw: Mapping[str, Any]) -> EventRecord:
+    return raw if isinstance(raw, EventRecord) else EventRecord.from_dict(raw)
+
+
+def decode_subscription(raw: Mapping[str, Any]) -> SubscriptionRecord:
+    return raw if isinstance(raw, SubscriptionRecord) else SubscriptionRecord.from_dict(raw)
+
+
+def decode_donation(raw: Mapping[str, Any]) -> DonationRecord:
+    return raw if isinstance(raw, DonationRecord) else DonationRecord.from_dict(raw)
+
+
+DECODERS = {
+    "members": decode_member,
+    "events": decode_event,
+    "subscriptions": decode_subscription,
+    "donations": decode_donation,
+}
+
+
+def to_dicts(records: List[Any]) -> List[Any]:
+    """Dictionnaires JSON d'une liste d'enregistrements (les autres éléments sont repris tels quels)"""
+    return [r.to_dict() if isinstance(r, Record) else r for r in records]
@@ -1,27 +1,27 @@
-from __future__ import annotations
-from abc import ABC, abstractmethod
-from typing import Any
-
-
-class Observer(ABC):
-    @abstractmethod
-    def update(self, event_type: str, data: Any = None) -> None:
-        pass
-
-
-class Subject:
-    def __init__(self) -> None:
-        self._observers: list[Observer] = []
-
-    def attach(self, observer: Observer) -> None:
-        if observer not in self._observers:
-            self._observers.append(observer)
-
-    def detach(self, observer: Observer) -> None:
-        if observer in self._observers:
-            self._observers.remove(observer)
-
-    def notify(self, event_type: str, data: Any = None) -> None:
-        for observer in self._observers:
-            observer.update(event_type, data)
-
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class Observer(ABC):
+    @abstractmethod
+    def update(self, event_type: str, data: Any = None) -> None:
+        pass
+
+
+class Subject:
+    def __init__(self) -> None:
+        self._observers: list[Observer] = []
+
+    def attach(self, observer: Observer) -> None:
+        if observer not in self._observers:
+            self._observers.append(observer)
+
+    def detach(self, observer: Observer) -> None:
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    def notify(self, event_type: str, data: Any = None) -> None:
+        for observer in self._observers:
+            observer.update(event_type, data)
+
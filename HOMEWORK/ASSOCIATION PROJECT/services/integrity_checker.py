@@ -0,0 +1,112 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Set
+
+from interfaces.storage_interface import StorageInterface
+from managers.group_index import group_key
+from managers.participation_index import member_key
+from models.records import decode_event
+
+
+class IntegrityChecker:
+    """
+    Recherche des références vers des membres qui n'existent plus.
+
+    - événements : participant_ids (étudiants) et organizer_ids (enseignants)
+    - abonnements : student_id
+    - groupes : teacher_ids
+
+    Les IDs des membres sont rassemblés dans deux ensembles (member_key),
+    puis chaque collection est lue une seule fois en flux (iter_*) : chaque
+    référence est vérifiée par une recherche dans un ensemble, sans
+    charger ni parcourir à nouveau les membres. Le contrôle est en lecture
+    seule ; AssociationController.delete_member(..., cascade=True) évite d'en
+    créer de nouvelles.
+    """
+
+    def __init__(self, storage: StorageInterface) -> None:
+        self._storage = storage
+
+    def check(self) -> Dict[str, Any]:
+        """
+        Contrôle toutes les collections.
+
+        Returns:
+            {"ok", "dangling", "events", "subscriptions", "groups"} : nombre
+            total de références pendantes et, par collection, les
+            enregistrements qui en contiennent
+        """
+        students, teachers = self._member_ids()
+        events = self._check_events(students, teachers)
+        subscriptions = self._check_subscriptions(students)
+        groups = self._check_groups(teachers)
+        dangling = (
+            sum(len(e["missing_students"]) + len(e["missing_teachers"]) for e in events)
+            + len(subscriptions)
+            + sum(len(g["missing_teachers"]) for g in groups)
+        )
+        return {
+            "ok": dangling == 0,
+            "dangling": dangling,
+            "events": events,
+            "subscriptions": subscriptions,
+            "groups": groups,
+        }
+
+    # ==================== PASSES PAR COLLECTION ====================
+
+    def _member_ids(self) -> tuple[Set[Any], Set[Any]]:
+        students: Set[Any] = set()
+        teachers: Set[Any] = set()
+        with self._storage.lock("members"):
+            for member in self._storage.iter_members():
+                if "student_id" in member:
+                    students.add(member_key(member["student_id"]))
+                if "teacher_id" in member:
+                    teachers.add(member_key(member["teacher_id"]))
+        return students, teachers
+
+    def _check_events(self, students: Set[Any], teachers: Set[Any]) -> List[Dict[str, Any]]:
+        found: List[Dict[str, Any]] = []
+        with self._storage.lock("events"):
+            for raw in self._storage.iter_events():
+                # Décodé : anciens champs ("name", "participants_ids") compris
+                event = decode_event(raw)
+                missing_students = _missing(event.participant_ids, students)
+                missing_teachers = _missing(event.organizer_ids, teachers)
+                if missing_students or missing_teachers:
+                    found.append({
+                        "event_name": event.event_name,
+                        "event_date": event["event_date"],
+                        "missing_students": missing_students,
+                        "missing_teachers": missing_teachers,
+                    })
+        return found
+
+    def _check_subscriptions(self, students: Set[Any]) -> List[Dict[str, Any]]:
+        with self._storage.lock("subscriptions"):
+            return [
+                {"student_id": s.get("student_id"), "date": s.get("date")}
+                for s in self._storage.iter_subscriptions()
+                if member_key(s.get("student_id")) not in students
+            ]
+
+    def _check_groups(self, teachers: Set[Any]) -> List[Dict[str, Any]]:
+        found: List[Dict[str, Any]] = []
+        with self._storage.lock("groups"):
+            for group in self._storage.iter_groups():
+                missing_teachers = _missing(group.get("teacher_ids"), teachers)
+                if missing_teachers:
+                    found.append({"group_id": group_key(group.get("group_id")), "missing_teachers": missing_teachers})
+        return found
+
+
+def _missing(ids: Any, known: Set[Any]) -> List[Any]:
+    """IDs de `ids` absents de `known`, chacun une fois, dans leur ordre d'apparition"""
+    missing: List[Any] = []
+    seen: Set[Any] = set()
+    for member_id in ids or ():
+        key = member_key(member_id)
+        if key not in known and key not in seen:
+            seen.add(key)
+            missing.append(member_id)
+    return missing
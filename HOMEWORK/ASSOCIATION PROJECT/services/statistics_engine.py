@@ -0,0 +1,199 @@
+from __future__ import annotations
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, Iterator
+
+from interfaces.storage_interface import StorageInterface
+from models.records import amount_of, iso_day
+from observers.data_observer import Observer
+
+
+def _month(value: Any) -> str:
+    """Mois "YYYY-MM" d'une date ISO ("2022-2-11" -> "2022-02"), ou "unknown" si la date est absente ou invalide"""
+    day = iso_day(value)
+    return "unknown" if day is None else day[:7]
+
+
+# ==================== COMPTEURS PAR COLLECTION ====================
+# Chaque collection a une fonction de création et une fonction d'ajout d'un
+# enregistrement : le calcul complet et la mise à jour incrémentale
+# partagent ainsi exactement la même logique.
+
+def _new_member_counters() -> Dict[str, Any]:
+    return {"total": 0, "students": 0, "teachers": 0,
+            "by_group": Counter(), "by_status": Counter(), "by_month": Counter()}
+
+
+def _add_member(counters: Dict[str, Any], member: Dict[str, Any]) -> None:
+    counters["total"] += 1
+    counters["by_month"][_month(member.get("join_date"))] += 1
+    if "student_id" in member:
+        counters["students"] += 1
+        group = member.get("groupe")
+        counters["by_group"]["none" if group is None else str(group)] += 1
+        counters["by_status"][str(member.get("subscription_status") or "unknown").lower()] += 1
+    if "teacher_id" in member:
+        counters["teachers"] += 1
+
+
+def _new_event_counters() -> Dict[str, Any]:
+    return {"total": 0, "by_month": Counter()}
+
+
+def _add_event(counters: Dict[str, Any], event: Dict[str, Any]) -> None:
+    counters["total"] += 1
+    counters["by_month"][_month(event.get("event_date"))] += 1
+
+
+def _new_subscription_counters() -> Dict[str, Any]:
+    return {"count": 0, "amount": 0.0, "count_by_status": Counter(),
+            "amount_by_status": Counter(), "amount_by_month": Counter()}
+
+
+def _add_subscription(counters: Dict[str, Any], subscription: Dict[str, Any]) -> None:
+    amount = amount_of(subscription)
+    status = str(subscription.get("status", "")).lower()
+    counters["count"] += 1
+    counters["amount"] += amount
+    counters["count_by_status"][status] += 1
+    counters["amount_by_status"][status] += amount
+    counters["amount_by_month"][_month(subscription.get("date"))] += amount
+
+
+def _new_donation_counters() -> Dict[str, Any]:
+    return {"count": 0, "amount": 0.0, "amount_by_month": Counter()}
+
+
+def _add_donation(counters: Dict[str, Any], donation: Dict[str, Any]) -> None:
+    amount = amount_of(donation)
+    counters["count"] += 1
+    counters["amount"] += amount
+    counters["amount_by_month"][_month(donation.get("date"))] += amount
+
+
+_COUNTERS: Dict[str, tuple[Callable[[], Dict[str, Any]], Callable[[Dict[str, Any], Dict[str, Any]], None]]] = {
+    "members": (_new_member_counters, _add_member),
+    "events": (_new_event_counters, _add_event),
+    "subscriptions": (_new_subscription_counters, _add_subscription),
+    "donations": (_new_donation_counters, _add_donation),
+}
+
+# Événements Subject.notify -> (collection, ajout incrémental possible).
+# Les suppressions et mises à jour ne transportent pas l'enregistrement
+# complet : la collection est recalculée à la prochaine lecture.
+_EVENTS: Dict[str, tuple[str, bool]] = {
+    "member_added_student": ("members", True),
+    "member_added_teacher": ("members", True),
+    "member_deleted_student": ("members", False),
+    "member_deleted_teacher": ("members", False),
+    "member_updated": ("members", False),
+    "event_added": ("events", True),
+    "event_deleted": ("events", False),
+    "event_updated": ("events", False),
+    "subscription_added": ("subscriptions", True),
+    "subscription_deleted": ("subscriptions", False),
+    "donation_added": ("donations", True),
+    "donation_deleted": ("donations", False),
+}
+
+
+class StatisticsEngine(Observer):
+    """
+    Statistiques de l'association calculées en une passe par collection.
+
+    Les compteurs de chaque collection sont conservés avec la version du
+    storage à laquelle ils correspondent. Entre deux écritures, les
+    statistiques sont servies sans relire aucun fichier. Attaché aux
+    contrôleurs (Observer), le moteur applique les ajouts de façon
+    incrémentale ; les suppressions, mises à jour et écritures d'un autre
+    processus (version inattendue) provoquent un recalcul de la seule
+    collection concernée.
+    """
+
+    def __init__(self, storage: StorageInterface) -> None:
+        self._storage = storage
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, Any]] = {}
+        self._versions: Dict[str, int] = {}
+
+    # ==================== Observer ====================
+
+    def update(self, event_type: str, data: Any = None) -> None:
+        collection, incremental = _EVENTS.get(event_type, (None, False))
+        if collection is None:
+            return
+        with self._lock:
+            if collection not in self._counters:
+                return
+            known = self._versions[collection]
+            current = self._storage.get_version(collection)
+            # Seul notre ajout a eu lieu depuis le calcul (ou storage sans versions)
+            if incremental and isinstance(data, dict) and (current == known + 1 or current == known == 0):
+                _COUNTERS[collection][1](self._counters[collection], data)
+                self._versions[collection] = current
+            else:
+                self.invalidate(collection)
+
+    # ==================== LECTURE ====================
+
+    def invalidate(self, collection: str | None = None) -> None:
+        """Oublie les compteurs d'une collection (ou de toutes) ; ils seront recalculés"""
+        if collection is None:
+            self._counters.clear()
+            self._versions.clear()
+        else:
+            self._counters.pop(collection, None)
+            self._versions.pop(collection, None)
+
+    def _collection(self, collection: str, records: Callable[[], Iterator[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Compteurs à jour d'une collection, recalculés si sa version a changé"""
+        counters = self._counters.get(collection)
+        if counters is not None and self._versions[collection] == self._storage.get_version(collection):
+            return counters
+        # Sous le verrou de la collection : version et contenu lus sont cohérents.
+        # Les enregistrements sont comptés au fil de la lecture, sans charger la collection.
+        create, add = _COUNTERS[collection]
+        counters = create()
+        with self._storage.lock(collection):
+            version = self._storage.get_version(collection)
+            for record in records():
+                add(counters, record)
+        self._counters[collection] = counters
+        self._versions[collection] = version
+        return counters
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Retourne les statistiques globales et leurs ventilations.
+
+        Returns:
+            Les totaux historiques de get_statistics (total_members, ...,
+            pending_subscriptions) et les ventilations par groupe, statut et mois
+        """
+        with self._lock:
+            members = self._collection("members", self._storage.iter_members)
+            events = self._collection("events", self._storage.iter_events)
+            subscriptions = self._collection("subscriptions", self._storage.iter_subscriptions)
+            donations = self._collection("donations", self._storage.iter_donations)
+
+            paid = subscriptions["amount_by_status"].get("paid", 0.0)
+            return {
+                "total_members": members["total"],
+                "total_students": members["students"],
+                "total_teachers": members["teachers"],
+                "total_events": events["total"],
+                "total_donations": donations["amount"],
+                "total_subscriptions": subscriptions["amount"],
+                "paid_subscriptions": paid,
+                "pending_subscriptions": subscriptions["amount"] - paid,
+                "students_by_group": dict(sorted(members["by_group"].items())),
+                "students_by_status": dict(sorted(members["by_status"].items())),
+                "members_by_month": dict(sorted(members["by_month"].items())),
+                "events_by_month": dict(sorted(events["by_month"].items())),
+                "subscriptions_by_status": {
+                    status: {"count": count, "amount": subscriptions["amount_by_status"][status]}
+                    for status, count in sorted(subscriptions["count_by_status"].items())
+                },
+                "subscriptions_by_month": dict(sorted(subscriptions["amount_by_month"].items())),
+                "donations_by_month": dict(sorted(donations["amount_by_month"].items())),
+            }
@@ -0,0 +1,104 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from storage.json_storage import DEFAULT_BACKUP_COUNT, JSONStorage
+from storage.snapshot import read_snapshot, write_snapshot
+
+# (mtime en nanosecondes, taille en octets) ; None si le fichier n'existe pas
+FileSignature = Optional[Tuple[int, int]]
+
+
+class CachedJSONStorage(JSONStorage):
+    """
+    JSONStorage avec un cache mémoire en écriture directe (write-through).
+
+    Les tableaux parsés sont conservés en mémoire et servis tant que le fichier
+    sur disque garde la même signature (mtime/taille). Chaque save_* met à jour
+    le fichier puis le cache : la lecture suivante ne reparse rien. Une
+    modification externe (autre processus, édition manuelle) change la
+    signature et provoque un rechargement.
+
+    Avec `snapshot_dir`, chaque fichier JSON est doublé d'un instantané
+    binaire (voir storage/snapshot.py) : le premier chargement lit
+    l'instantané au lieu de parser le JSON tant que celui-ci n'a pas changé.
+    L'instantané est réécrit à chaque save_* et régénéré au chargement
+    s'il est périmé.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        snapshot_dir: Path | None = None,
+    ) -> None:
+        super().__init__(base_dir, backup_count)
+        self._cache: Dict[str, Tuple[FileSignature, List[Dict[str, Any]]]] = {}
+        self._snapshot_dir = snapshot_dir
+
+    @staticmethod
+    def _file_signature(path: Path) -> FileSignature:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _signature(self, filename: str) -> FileSignature:
+        """Retourne la signature (mtime, taille) du fichier, ou None s'il est absent"""
+        return self._file_signature(self._base_dir / filename)
+
+    def _snapshot_path(self, filename: str) -> Path | None:
+        return None if self._snapshot_dir is None else self._snapshot_dir / f"{filename}.snap"
+
+    def _read_array(self, filename: str) -> List[Dict[str, Any]]:
+        """Lit le fichier JSON, ou son instantané binaire s'il est à jour"""
+        snapshot = self._snapshot_path(filename)
+        path = self._base_dir / filename
+        signature = self._file_signature(path)
+        if snapshot is None or signature is None:
+            return super()._read_array(filename)
+
+        data = read_snapshot(snapshot, signature)
+        if data is None:
+            data = super()._read_array(filename)
+            # Fichier remplacé pendant la lecture : l'instantané serait incohérent
+            if self._file_signature(path) == signature:
+                write_snapshot(snapshot, signature, data)
+        return data
+
+    def _load_array(self, filename: str) -> List[Dict[str, Any]]:
+        """
+        Retourne le tableau depuis le cache s'il est encore valide.
+
+        La liste retournée est une copie superficielle : l'appelant peut
+        l'étendre ou la filtrer sans altérer le cache, mais les dictionnaires
+        sont partagés et ne doivent être modifiés qu'en vue d'un save_*.
+        """
+        signature = self._signature(filename)
+        entry = self._cache.get(filename)
+        if entry is not None and entry[0] == signature:
+            return list(entry[1])
+
+        data = self._read_array(filename)
+        self._cache[filename] = (signature, data)
+        return list(data)
+
+    def _iter_array(self, filename: str) -> Iterator[Dict[str, Any]]:
+        """Parcourt le cache s'il est valide, sinon le fichier en flux (sans remplir le cache)"""
+        entry = self._cache.get(filename)
+        if entry is not None and entry[0] == self._signature(filename):
+            return iter(list(entry[1]))
+        return self._stream_array(filename)
+
+    def _save_array(self, filename: str, data: List[Dict[str, Any]]) -> None:
+        """Écrit le fichier puis met le cache (et l'instantané) à jour avec la nouvelle signature"""
+        super()._save_array(filename, data)
+        self._cache[filename] = (self._signature(filename), list(data))
+        snapshot = self._snapshot_path(filename)
+        if snapshot is not None:
+            write_snapshot(snapshot, self._file_signature(self._base_dir / filename), data)
+
+    def clear_cache(self) -> None:
+        """Vide le cache : la prochaine lecture de chaque fichier repassera par le disque"""
+        self._cache.clear()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+import os
+import threading
+from pathlib import Path
+from typing import Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows : verrou limité au processus courant
+    fcntl = None
+
+
+class CollectionLock:
+    """
+    Verrou d'une collection, partagé entre threads et entre processus.
+
+    - Entre threads : un RLock (réentrant, un même thread peut imbriquer les
+      sections critiques).
+    - Entre processus : un verrou consultatif `fcntl.flock` sur un fichier
+      `.<collection>.lock` du dossier de données (POSIX uniquement).
+
+    Le fichier de verrou contient aussi le numéro de version de la
+    collection, incrémenté à chaque écriture.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd: int | None = None
+
+    def __enter__(self) -> "CollectionLock":
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_EX)
+            except BaseException:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+        self._thread_lock.release()
+
+    def read_version(self) -> int:
+        """Lit la version courante (0 si la collection n'a jamais été écrite)"""
+        try:
+            raw = self._path.read_bytes()
+        except FileNotFoundError:
+            return 0
+        try:
+            return int(raw.strip() or 0)
+        except ValueError:
+            return 0
+
+    def bump_version(self) -> int:
+        """Incrémente la version ; à appeler en détenant le verrou, après l'écriture des données"""
+        if self._fd is None:
+            raise RuntimeError("bump_version() exige de détenir le verrou")
+        version = self.read_version() + 1
+        payload = str(version).encode("ascii")
+        # Les versions ne font que croître : écrire puis tronquer ne laisse
+        # jamais un lecteur voir un nombre plus court que l'ancien.
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        os.write(self._fd, payload)
+        os.ftruncate(self._fd, len(payload))
+        return version
+
+
+class VersionTracker:
+    """
+    Mémorise, par thread, la version de chaque collection vue au dernier chargement.
+
+    Une sauvegarde dont la version observée n'est plus la version courante
+    écraserait une écriture concurrente : elle est refusée (VersionConflictError).
+    """
+
+    def __init__(self) -> None:
+        self._observed = threading.local()
+
+    def _versions(self) -> Dict[str, int]:
+        versions = getattr(self._observed, "versions", None)
+        if versions is None:
+            versions = self._observed.versions = {}
+        return versions
+
+    def remember(self, collection: str, version: int) -> None:
+        self._versions()[collection] = version
+
+    def observed(self, collection: str) -> int | None:
+        return self._versions().get(collection)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from storage.cached_json_storage import CachedJSONStorage, FileSignature
+from storage.json_storage import DEFAULT_BACKUP_COUNT, file_mode
+
+# Taille du journal (en octets) au-delà de laquelle il est replié dans le fichier principal
+DEFAULT_COMPACT_THRESHOLD = 1_000_000
+
+
+class JournaledJSONStorage(CachedJSONStorage):
+    """
+    JSONStorage en mode journalisé.
+
+    Les ajouts (append_*) ne réécrivent plus le fichier complet : chaque
+    enregistrement est ajouté sur une ligne d'un journal JSON-lines placé à
+    côté du fichier (`members.journal.jsonl` pour `members.json`). La lecture
+    fusionne l'instantané JSON et le journal. Quand le journal dépasse
+    `compact_threshold` octets, il est replié dans l'instantané (compaction).
+
+    Les suppressions et mises à jour passent toujours par save_*, qui réécrit
+    l'instantané et vide le journal. L'instantané binaire optionnel
+    (`snapshot_dir`) ne couvre que le fichier JSON : le journal est relu
+    par-dessus.
+
+    Réécrire l'instantané d'une collection journalisée se fait en trois
+    étapes : le nouveau contenu complet est écrit dans `members.json.compacting`,
+    le journal est supprimé, puis ce fichier remplace `members.json`. Après
+    un arrêt brutal entre deux étapes, la lecture suivante termine la
+    réécriture (_finish_compaction) : le journal n'est jamais relu
+    par-dessus un instantané qui le contient déjà.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        snapshot_dir: Path | None = None,
+    ) -> None:
+        super().__init__(base_dir, backup_count, snapshot_dir)
+        self._compact_threshold = compact_threshold
+
+    def _journal_path(self, filename: str) -> Path:
+        return self._base_dir / f"{Path(filename).stem}.journal.jsonl"
+
+    def _compacting_path(self, filename: str) -> Path:
+        return self._base_dir / f"{filename}.compacting"
+
+    def _finish_compaction(self, filename: str) -> None:
+        """Termine une réécriture interrompue : le contenu `.compacting`, complet, remplace l'instantané"""
+        compacting = self._compacting_path(filename)
+        if not compacting.exists():
+            return
+        with self._lock_for(Path(filename).stem):
+            if compacting.exists():
+                self._journal_path(filename).unlink(missing_ok=True)
+                self._replace_file(compacting, self._base_dir / filename)
+
+    def _signature(self, filename: str) -> tuple[FileSignature, FileSignature]:
+        """Signature combinée de l'instantané et du journal"""
+        journal = self._journal_path(filename)
+        try:
+            stat = journal.stat()
+            journal_signature: FileSignature = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            journal_signature = None
+        return (super()._signature(filename), journal_signature)
+
+    def _read_journal(self, filename: str) -> List[Dict[str, Any]]:
+        """
+        Lit les enregistrements du journal.
+
+        Une fin de journal incomplète (écriture interrompue) est tronquée pour
+        que les ajouts suivants repartent sur une ligne propre.
+        """
+        journal = self._journal_path(filename)
+        if not journal.exists():
+            return []
+        records: List[Dict[str, Any]] = []
+        valid_size = 0
+        with journal.open("rb") as handle:
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+                valid_size += len(line)
+        if valid_size < journal.stat().st_size:
+            with journal.open("r+b") as handle:
+                handle.truncate(valid_size)
+        return records
+
+    def _read_array(self, filename: str) -> List[Dict[str, Any]]:
+        """Fusionne l'instantané JSON et les enregistrements du journal"""
+        self._finish_compaction(filename)
+        data = super()._read_array(filename)
+        data.extend(self._read_journal(filename))
+        return data
+
+    def _stream_array(self, filename: str) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt l'instantané puis le journal, sans les charger en entier.
+
+        Les deux fichiers sont ouverts ensemble sous le verrou de la
+        collection : une compaction concurrente ne peut ni dupliquer ni
+        perdre les enregistrements du journal.
+        """
+        path = self._base_dir / filename
+        with self._lock_for(Path(filename).stem):
+            self._finish_compaction(filename)
+            snapshot = path.open("r", encoding="utf-8") if path.exists() else None
+            journal_path = self._journal_path(filename)
+            journal = journal_path.open("rb") if journal_path.exists() else None
+        try:
+            if snapshot is not None:
+                yield from self._stream_handle(path, snapshot)
+            if journal is not None:
+                for line in journal:
+                    if not line.endswith(b"\n"):
+                        break  # fin incomplète : ignorée ici, tronquée par _read_journal
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+        finally:
+            for handle in (snapshot, journal):
+                if handle is not None:
+                    handle.close()
+
+    def _append_record(self, filename: str, record: Dict[str, Any]) -> None:
+        """Ajoute l'enregistrement au journal, sans réécrire l'instantané"""
+        entry = self._cache.get(filename)
+        if entry is None or entry[0] != self._signature(filename):
+            # Recharge le cache (et répare un journal tronqué) avant d'écrire
+            self._load_array(filename)
+            entry = self._cache[filename]
+
+        journal = self._journal_path(filename)
+        journal.parent.mkdir(parents=True, exist_ok=True)
+        with journal.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        entry[1].append(record)
+        self._cache[filename] = (self._signature(filename), entry[1])
+
+        if journal.stat().st_size > self._compact_threshold:
+            self.compact(filename)
+
+    def _save_array(self, filename: str, data: List[Dict[str, Any]]) -> None:
+        """Réécrit l'instantané, qui remplace le journal devenu redondant"""
+        with self._lock_for(Path(filename).stem):
+            self._finish_compaction(filename)
+            super()._save_array(filename, data)
+        self._cache[filename] = (self._signature(filename), list(data))
+
+    def _write_file(self, path: Path, data: List[Dict[str, Any]]) -> None:
+        """Avec un journal, passe par `<fichier>.compacting` (voir la docstring de la classe)"""
+        journal = self._journal_path(path.name)
+        if not journal.exists():
+            super()._write_file(path, data)
+            return
+        compacting = self._compacting_path(path.name)
+        super()._write_file(compacting, data)
+        os.chmod(compacting, file_mode(path))
+        journal.unlink()
+        self._replace_file(compacting, path)
+
+    def compact(self, filename: str | None = None) -> None:
+        """
+        Replie le journal dans l'instantané JSON.
+
+        Args:
+            filename: Fichier à compacter, ou None pour tous les fichiers journalisés
+        """
+        if filename is None:
+            for journal in self._base_dir.glob("*.journal.jsonl"):
+                self.compact(journal.name.replace(".journal.jsonl", ".json"))
+            return
+        with self._lock_for(Path(filename).stem):
+            if self._journal_path(filename).exists():
+                self._save_array(filename, self._load_array(filename))
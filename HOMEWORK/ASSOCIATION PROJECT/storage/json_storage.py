@@ -1,57 +1,311 @@
 from __future__ import annotations
 import json
+import logging
+import os
+import shutil
+import stat
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, TextIO
 
-from interfaces.storage_interface import StorageInterface
+from interfaces.storage_interface import StorageInterface, VersionConflictError
+from storage.collection_lock import CollectionLock, VersionTracker
+from storage.json_stream import iter_json_array
+
+logger = logging.getLogger(__name__)
+
+# Nombre de sauvegardes tournantes conservées par fichier (members.json.bak1 ... .bakN)
+DEFAULT_BACKUP_COUNT = 3
+
+
+# Masque de création des fichiers du processus, lu une seule fois à l'import
+# (os.umask ne se lit qu'en le changeant, ce qui n'est pas sûr entre threads)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+class CorruptedDataError(ValueError):
+    """Fichier de données illisible et aucune sauvegarde exploitable"""
+
+
+def file_mode(path: Path) -> int:
+    """
+    Droits à donner au fichier qui va remplacer `path`.
+
+    tempfile.mkstemp crée ses fichiers en 0600 et os.replace conserve ces
+    droits : le remplaçant reprend ceux du fichier existant, ou ceux d'un
+    fichier créé par open() (0666 moins l'umask) s'il n'existe pas encore.
+    """
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
 
 
 class JSONStorage(StorageInterface):
-    def __init__(self, base_dir: Path) -> None:
+    def __init__(self, base_dir: Path, backup_count: int = DEFAULT_BACKUP_COUNT) -> None:
         self._base_dir = base_dir
+        self._backup_count = backup_count
+        self._locks: Dict[str, CollectionLock] = {}
+        self._locks_guard = threading.Lock()
+        self._versions = VersionTracker()
 
     def _load_array(self, filename: str) -> List[Dict[str, Any]]:
-        path = self._base_dir / filename
+        return self._read_array(filename)
+
+    def _read_array(self, filename: str) -> List[Dict[str, Any]]:
+        return self._read_file(self._base_dir / filename)
+
+    def _read_file(self, path: Path) -> List[Dict[str, Any]]:
+        """
+        Lit et parse un fichier JSON depuis le disque.
+
+        Si le fichier est illisible, la sauvegarde valide la plus récente est
+        chargée à la place. Retourner une liste vide ferait effacer toute la
+        collection à la sauvegarde suivante : faute de sauvegarde exploitable,
+        CorruptedDataError est levée.
+        """
         if not path.exists():
             return []
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            if isinstance(data, list):
+            return self._parse_file(path)
+        except ValueError as exc:
+            for backup in self._backup_paths(path):
+                try:
+                    data = self._parse_file(backup)
+                except (OSError, ValueError):
+                    continue
+                logger.warning("%s illisible (%s), restauration depuis %s", path, exc, backup.name)
                 return data
-            return []
-        except Exception:
-            return []
+            raise CorruptedDataError(f"{path} est illisible et aucune sauvegarde n'est valide") from exc
+
+    def _parse_file(self, path: Path) -> List[Dict[str, Any]]:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, list):
+            raise ValueError(f"{path.name} ne contient pas un tableau JSON")
+        return data
+
+    def _iter_array(self, filename: str) -> Iterator[Dict[str, Any]]:
+        return self._stream_array(filename)
+
+    def _stream_array(self, filename: str) -> Iterator[Dict[str, Any]]:
+        """Parcourt les enregistrements d'un fichier sans charger tout le tableau"""
+        path = self._base_dir / filename
+        try:
+            handle = path.open("r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with handle:
+            yield from self._stream_handle(path, handle)
+
+    def _stream_handle(self, path: Path, handle: TextIO) -> Iterator[Dict[str, Any]]:
+        """
+        Parse en flux le tableau JSON d'un fichier ouvert.
+
+        Un fichier illisible dès le début est relu via _read_file (et donc
+        ses sauvegardes) ; une erreur au milieu du fichier, après que des
+        enregistrements ont été produits, lève CorruptedDataError.
+        """
+        produced = False
+        try:
+            for record in iter_json_array(handle):
+                produced = True
+                yield record
+        except ValueError as exc:
+            if produced:
+                raise CorruptedDataError(f"{path} est illisible") from exc
+            yield from self._read_file(path)
+
+    def _backup_paths(self, path: Path) -> List[Path]:
+        """Sauvegardes existantes, de la plus récente à la plus ancienne"""
+        candidates = (path.with_name(f"{path.name}.bak{i}") for i in range(1, self._backup_count + 1))
+        return [p for p in candidates if p.exists()]
 
     def load_members(self) -> List[Dict[str, Any]]:
-        return self._load_array("members.json")
+        return self._load("members.json")
 
     def load_events(self) -> List[Dict[str, Any]]:
-        return self._load_array("events.json")
+        return self._load("events.json")
 
     def load_subscriptions(self) -> List[Dict[str, Any]]:
-        return self._load_array("subscriptions.json")
+        return self._load("subscriptions.json")
 
     def load_donations(self) -> List[Dict[str, Any]]:
-        return self._load_array("donations.json")
+        return self._load("donations.json")
+
+    def load_groups(self) -> List[Dict[str, Any]]:
+        return self._load("groups.json")
+
+    def iter_members(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_array("members.json")
+
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_array("events.json")
+
+    def iter_subscriptions(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_array("subscriptions.json")
+
+    def iter_donations(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_array("donations.json")
+
+    def iter_groups(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_array("groups.json")
     
     def _save_array(self, filename: str, data: List[Dict[str, Any]]) -> None:
-        """Sauvegarde une liste de dictionnaires dans un fichier JSON"""
-        path = self._base_dir / filename
+        """
+        Sauvegarde une liste de dictionnaires dans un fichier JSON.
+
+        L'écriture est atomique : le contenu part dans un fichier temporaire
+        du même dossier, synchronisé sur disque, puis remplace l'original via
+        os.replace. Un arrêt brutal laisse donc l'ancien ou le nouveau
+        fichier, jamais un fichier tronqué. L'ancienne version est conservée
+        comme sauvegarde tournante.
+        """
+        self._write_file(self._base_dir / filename, data)
+
+    def _write_file(self, path: Path, data: List[Dict[str, Any]]) -> None:
+        """Écrit atomiquement `data` dans `path` (voir _save_array)"""
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        payload = json.dumps(data, indent=2, ensure_ascii=False)
+
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.chmod(tmp_name, file_mode(path))
+            self._replace_file(Path(tmp_name), path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _replace_file(self, source: Path, path: Path) -> None:
+        """Met `source`, déjà écrit et synchronisé, à la place de `path` ; l'ancienne version passe en sauvegarde"""
+        self._rotate_backups(path)
+        os.replace(source, path)
+        self._fsync_dir(path.parent)
+
+    def _rotate_backups(self, path: Path) -> None:
+        """Décale les sauvegardes (.bak1 -> .bak2 ...) et conserve la version actuelle en .bak1"""
+        if self._backup_count <= 0 or not path.exists():
+            return
+        for i in range(self._backup_count - 1, 0, -1):
+            older = path.with_name(f"{path.name}.bak{i}")
+            if older.exists():
+                os.replace(older, path.with_name(f"{path.name}.bak{i + 1}"))
+        latest = path.with_name(f"{path.name}.bak1")
+        try:
+            # Un lien physique évite de recopier le fichier : os.replace ne
+            # touche ensuite que l'entrée `path`, pas l'inode de la sauvegarde.
+            os.link(path, latest)
+        except OSError:
+            shutil.copy2(path, latest)
+
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        """Synchronise le dossier pour rendre le renommage durable (POSIX uniquement)"""
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
     
     def save_members(self, members: List[Dict[str, Any]]) -> None:
         """Sauvegarde les membres"""
-        self._save_array("members.json", members)
+        self._save("members.json", members)
     
     def save_events(self, events: List[Dict[str, Any]]) -> None:
         """Sauvegarde les événements"""
-        self._save_array("events.json", events)
+        self._save("events.json", events)
     
     def save_subscriptions(self, subscriptions: List[Dict[str, Any]]) -> None:
         """Sauvegarde les abonnements"""
-        self._save_array("subscriptions.json", subscriptions)
+        self._save("subscriptions.json", subscriptions)
     
     def save_donations(self, donations: List[Dict[str, Any]]) -> None:
         """Sauvegarde les dons"""
-        self._save_array("donations.json", donations)
\ No newline at end of file
+        self._save("donations.json", donations)
+
+    def save_groups(self, groups: List[Dict[str, Any]]) -> None:
+        """Sauvegarde les groupes"""
+        self._save("groups.json", groups)
+
+    def _append_record(self, filename: str, record: Dict[str, Any]) -> None:
+        """Ajoute un enregistrement à un fichier (réécriture complète par défaut)"""
+        data = self._load_array(filename)
+        data.append(record)
+        self._save_array(filename, data)
+
+    def append_member(self, member: Dict[str, Any]) -> None:
+        """Ajoute un membre"""
+        self._append("members.json", member)
+
+    def append_event(self, event: Dict[str, Any]) -> None:
+        """Ajoute un événement"""
+        self._append("events.json", event)
+
+    def append_subscription(self, subscription: Dict[str, Any]) -> None:
+        """Ajoute un abonnement"""
+        self._append("subscriptions.json", subscription)
+
+    def append_donation(self, donation: Dict[str, Any]) -> None:
+        """Ajoute un don"""
+        self._append("donations.json", donation)
+
+    # ==================== CONCURRENCE ====================
+
+    def _lock_for(self, collection: str) -> CollectionLock:
+        with self._locks_guard:
+            lock = self._locks.get(collection)
+            if lock is None:
+                lock = CollectionLock(self._base_dir / f".{collection}.lock")
+                self._locks[collection] = lock
+            return lock
+
+    def lock(self, collection: str) -> CollectionLock:
+        """Verrou de la collection, partagé entre threads et processus"""
+        return self._lock_for(collection)
+
+    def get_version(self, collection: str) -> int:
+        """Version courante de la collection (lue dans son fichier de verrou)"""
+        return self._lock_for(collection).read_version()
+
+    def _load(self, filename: str) -> List[Dict[str, Any]]:
+        """Charge un fichier en mémorisant la version lue par ce thread"""
+        collection = Path(filename).stem
+        self._versions.remember(collection, self._lock_for(collection).read_version())
+        return self._load_array(filename)
+
+    def _save(self, filename: str, data: List[Dict[str, Any]]) -> None:
+        """
+        Sauvegarde sous verrou, après vérification de version.
+
+        Si la collection a changé depuis le dernier chargement de ce thread,
+        la sauvegarde écraserait cette modification : VersionConflictError.
+        """
+        collection = Path(filename).stem
+        with self._lock_for(collection) as lock:
+            current = lock.read_version()
+            observed = self._versions.observed(collection)
+            if observed is not None and observed != current:
+                raise VersionConflictError(
+                    f"{collection} : version {observed} chargée, version {current} sur disque"
+                )
+            self._save_array(filename, data)
+            self._versions.remember(collection, lock.bump_version())
+
+    def _append(self, filename: str, record: Dict[str, Any]) -> None:
+        """Ajoute un enregistrement sous verrou ; un ajout n'écrase rien, pas de contrôle de version"""
+        collection = Path(filename).stem
+        with self._lock_for(collection) as lock:
+            up_to_date = self._versions.observed(collection) == lock.read_version()
+            self._append_record(filename, record)
+            version = lock.bump_version()
+            if up_to_date:
+                self._versions.remember(collection, version)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+import json
+from typing import Any, Iterator, TextIO
+
+# Taille des blocs lus dans le fichier (en caractères)
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = ",]" + _WHITESPACE
+
+
+def iter_json_array(handle: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Parse un tableau JSON élément par élément depuis un fichier texte.
+
+    Seuls le bloc courant et l'élément en cours de décodage sont en mémoire :
+    la consommation ne dépend pas de la taille du fichier. Chaque élément est
+    décodé par json.JSONDecoder.raw_decode, donc avec les mêmes règles que
+    json.loads.
+
+    Raises:
+        ValueError: Si le contenu n'est pas un tableau JSON valide (l'erreur
+            peut survenir après que des éléments ont déjà été produits)
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        """Ajoute un bloc au tampon, en abandonnant la partie déjà consommée"""
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        chunk = handle.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    def skip_whitespace() -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or not fill():
+                return
+
+    skip_whitespace()
+    if pos >= len(buffer) or buffer[pos] != "[":
+        raise ValueError("Le fichier ne contient pas un tableau JSON")
+    pos += 1
+
+    skip_whitespace()
+    if pos < len(buffer) and buffer[pos] == "]":
+        pos += 1
+    else:
+        while True:
+            skip_whitespace()
+            while True:
+                try:
+                    element, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # Élément coupé par la fin du bloc : lire la suite
+                    if fill():
+                        continue
+                    raise
+                # Un nombre coupé par la fin du bloc ("12" puis "3.5") se décode
+                # sans erreur : l'élément n'est accepté que suivi d'un délimiteur.
+                if (end == len(buffer) or buffer[end] not in _DELIMITERS) and fill():
+                    continue
+                break
+            pos = end
+            yield element
+
+            skip_whitespace()
+            if pos >= len(buffer):
+                raise ValueError("Tableau JSON non terminé")
+            separator = buffer[pos]
+            pos += 1
+            if separator == "]":
+                break
+            if separator != ",":
+                raise ValueError(f"Séparateur inattendu {separator!r} dans le tableau JSON")
+
+    skip_whitespace()
+    if pos < len(buffer):
+        raise ValueError("Données en trop après le tableau JSON")
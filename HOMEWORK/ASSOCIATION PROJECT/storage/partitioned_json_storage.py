@@ -0,0 +1,232 @@
+from __future__ import annotations
+import logging
+import os
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from interfaces.storage_interface import (
+    VersionConflictError,
+    check_in_range,
+    date_in_range,
+    replace_in_range,
+)
+from models.records import iso_day
+from storage.cached_json_storage import CachedJSONStorage
+from storage.json_storage import DEFAULT_BACKUP_COUNT
+
+logger = logging.getLogger(__name__)
+
+# Collections découpées par date ; les membres et événements restent en un fichier
+PARTITIONED_COLLECTIONS = ("subscriptions", "donations")
+
+# Partition des enregistrements sans date exploitable
+UNDATED = "undated"
+
+_KEY_LENGTHS = {"month": 7, "year": 4}
+
+
+class PartitionedJSONStorage(CachedJSONStorage):
+    """
+    CachedJSONStorage dont les abonnements et les dons sont découpés par date.
+
+    Chaque collection financière est un dossier contenant un fichier par
+    mois (`data/subscriptions/2024-03.json`) ou par année
+    (`data/donations/2024.json`). Les enregistrements sans date valide vont
+    dans `undated.json`. Un ajout ou une écriture par intervalle
+    (save_*_between) ne lit et ne réécrit que les partitions concernées ;
+    un save_* complet ne réécrit que les partitions dont le contenu change.
+
+    Les collections sont servies partition par partition, dans l'ordre des
+    dates : l'ordre d'insertion n'est conservé qu'au sein d'une partition.
+
+    Au premier démarrage, un ancien `subscriptions.json` / `donations.json`
+    est découpé en partitions puis renommé en `*.json.pre-partition`.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        granularity: str = "month",
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        snapshot_dir: Path | None = None,
+    ) -> None:
+        if granularity not in _KEY_LENGTHS:
+            raise ValueError(f"Granularité inconnue : {granularity} (month ou year)")
+        super().__init__(base_dir, backup_count, snapshot_dir)
+        self._key_length = _KEY_LENGTHS[granularity]
+        for collection in PARTITIONED_COLLECTIONS:
+            self._migrate_flat_file(collection)
+
+    # ==================== PARTITIONS ====================
+
+    def _partition_key(self, record: Dict[str, Any]) -> str:
+        """Partition d'un enregistrement : "YYYY-MM" ou "YYYY" du jour (complété de zéros)"""
+        day = iso_day(record.get("date"))
+        return UNDATED if day is None else day[:self._key_length]
+
+    @staticmethod
+    def _partition_file(collection: str, key: str) -> str:
+        return f"{collection}/{key}.json"
+
+    def _partition_keys(self, collection: str) -> List[str]:
+        """Partitions existantes, dans l'ordre des dates (undated en dernier)"""
+        directory = self._base_dir / collection
+        if not directory.is_dir():
+            return []
+        return sorted(path.stem for path in directory.glob("*.json"))
+
+    def _keys_between(self, collection: str, start: str | None, end: str | None) -> List[str]:
+        """
+        Partitions pouvant contenir des dates de [start, end].
+
+        undated.json est toujours retenue : des fichiers antérieurs y ont
+        rangé des dates valides mais non complétées de zéros ("2025-5-2") ;
+        date_in_range trie ensuite ses enregistrements.
+        """
+        if start is None and end is None:
+            return self._partition_keys(collection)
+        length = self._key_length
+        start = None if start is None else iso_day(start) or start
+        end = None if end is None else iso_day(end) or end
+        return [
+            key for key in self._partition_keys(collection)
+            if key == UNDATED
+            or ((start is None or start[:length] <= key) and (end is None or key <= end[:length]))
+        ]
+
+    def _group(self, records: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            groups.setdefault(self._partition_key(record), []).append(record)
+        return groups
+
+    def _write_partition(self, collection: str, key: str, records: List[Dict[str, Any]]) -> None:
+        """Écrit une partition, ou la supprime (après sauvegarde tournante) si elle est vide"""
+        filename = self._partition_file(collection, key)
+        if records:
+            self._save_array(filename, records)
+            return
+        path = self._base_dir / filename
+        if path.exists():
+            self._rotate_backups(path)
+            path.unlink()
+        self._cache.pop(filename, None)
+
+    def _migrate_flat_file(self, collection: str) -> None:
+        flat = self._base_dir / f"{collection}.json"
+        if not flat.exists() or (self._base_dir / collection).exists():
+            return
+        with self._lock_for(collection) as lock:
+            if not flat.exists() or (self._base_dir / collection).exists():
+                return
+            groups = self._group(self._read_file(flat))
+            for key, records in groups.items():
+                self._save_array(self._partition_file(collection, key), records)
+            (self._base_dir / collection).mkdir(exist_ok=True)
+            os.replace(flat, flat.with_name(f"{flat.name}.pre-partition"))
+            lock.bump_version()
+        logger.info("%s découpé en %d partition(s)", flat.name, len(groups))
+
+    # ==================== LECTURE / ÉCRITURE PAR PARTITIONS ====================
+
+    def _load_partitions(self, collection: str, start: str | None = None,
+                         end: str | None = None) -> List[Dict[str, Any]]:
+        """Charge les partitions de l'intervalle, sous verrou pour une vue cohérente"""
+        with self._lock_for(collection) as lock:
+            self._versions.remember(collection, lock.read_version())
+            records: List[Dict[str, Any]] = []
+            for key in self._keys_between(collection, start, end):
+                partition = self._load_array(self._partition_file(collection, key))
+                if start is None and end is None:
+                    records.extend(partition)
+                else:
+                    records.extend(r for r in partition if date_in_range(r, start, end))
+            return records
+
+    def _iter_partitions(self, collection: str) -> Iterator[Dict[str, Any]]:
+        """Parcourt les partitions une à une (chacune est lue de façon atomique)"""
+        return chain.from_iterable(
+            self._iter_array(self._partition_file(collection, key))
+            for key in self._partition_keys(collection)
+        )
+
+    def _save_partitions(self, collection: str, start: str | None, end: str | None,
+                         records: List[Dict[str, Any]]) -> None:
+        """
+        Remplace les enregistrements de [start, end] (tout si les bornes sont None).
+
+        Seules les partitions dont le contenu change sont réécrites. Même
+        contrôle de version que JSONStorage._save.
+        """
+        full = start is None and end is None
+        if not full:
+            check_in_range(records, start, end)
+        groups = self._group(records)
+        with self._lock_for(collection) as lock:
+            current = lock.read_version()
+            observed = self._versions.observed(collection)
+            if observed is not None and observed != current:
+                raise VersionConflictError(
+                    f"{collection} : version {observed} chargée, version {current} sur disque"
+                )
+            for key in sorted(set(self._keys_between(collection, start, end)) | set(groups)):
+                existing = self._load_array(self._partition_file(collection, key))
+                new = groups.get(key, [])
+                content = new if full else replace_in_range(existing, start, end, new)
+                if content != existing:
+                    self._write_partition(collection, key, content)
+            self._versions.remember(collection, lock.bump_version())
+
+    def _append_partitioned(self, collection: str, record: Dict[str, Any]) -> None:
+        """Ajoute un enregistrement à sa seule partition (voir JSONStorage._append)"""
+        with self._lock_for(collection) as lock:
+            up_to_date = self._versions.observed(collection) == lock.read_version()
+            self._append_record(self._partition_file(collection, self._partition_key(record)), record)
+            version = lock.bump_version()
+            if up_to_date:
+                self._versions.remember(collection, version)
+
+    # ==================== StorageInterface ====================
+
+    def load_subscriptions(self) -> List[Dict[str, Any]]:
+        return self._load_partitions("subscriptions")
+
+    def load_donations(self) -> List[Dict[str, Any]]:
+        return self._load_partitions("donations")
+
+    def iter_subscriptions(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_partitions("subscriptions")
+
+    def iter_donations(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_partitions("donations")
+
+    def save_subscriptions(self, subscriptions: List[Dict[str, Any]]) -> None:
+        """Sauvegarde les abonnements (partitions modifiées uniquement)"""
+        self._save_partitions("subscriptions", None, None, subscriptions)
+
+    def save_donations(self, donations: List[Dict[str, Any]]) -> None:
+        """Sauvegarde les dons (partitions modifiées uniquement)"""
+        self._save_partitions("donations", None, None, donations)
+
+    def append_subscription(self, subscription: Dict[str, Any]) -> None:
+        """Ajoute un abonnement dans la partition de sa date"""
+        self._append_partitioned("subscriptions", subscription)
+
+    def append_donation(self, donation: Dict[str, Any]) -> None:
+        """Ajoute un don dans la partition de sa date"""
+        self._append_partitioned("donations", donation)
+
+    def load_subscriptions_between(self, start: str | None = None, end: str | None = None) -> List[Dict[str, Any]]:
+        return self._load_partitions("subscriptions", start, end)
+
+    def load_donations_between(self, start: str | None = None, end: str | None = None) -> List[Dict[str, Any]]:
+        return self._load_partitions("donations", start, end)
+
+    def save_subscriptions_between(self, start: str | None, end: str | None,
+                                   subscriptions: List[Dict[str, Any]]) -> None:
+        self._save_partitions("subscriptions", start, end, subscriptions)
+
+    def save_donations_between(self, start: str | None, end: str | None,
+                               donations: List[Dict[str, Any]]) -> None:
+        self._save_partitions("donations", start, end, donations)
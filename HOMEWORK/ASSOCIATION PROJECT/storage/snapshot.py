@@ -0,0 +1,122 @@
+"""
+Instantanés binaires des collections JSON, pour un démarrage à froid rapide.
+
+Format d'un fichier `.snap` :
+
+    MAGIC | longueur de l'en-tête (uint32) | en-tête marshal | données marshal
+
+L'en-tête contient la version du format, l'interpréteur (le format marshal
+dépend de la version de Python) et la signature du fichier JSON source.
+Un instantané n'est utilisé que si ces trois valeurs correspondent : sinon
+il est ignoré et régénéré depuis le JSON.
+
+Table de chaînes : les valeurs répétées (`subscription_status`, `kind`,
+`purpose`, ...) et les clés sont ramenées à un seul objet par valeur avant
+l'écriture. marshal n'écrit alors chaque chaîne qu'une fois puis des
+références vers elle ; au chargement, tous les enregistrements partagent
+les mêmes objets chaîne.
+"""
+from __future__ import annotations
+import gc
+import logging
+import marshal
+import os
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+from storage.json_storage import file_mode
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"MDSNAP"
+FORMAT_VERSION = 1
+
+# Champs dont les valeurs passent par la table de chaînes
+STRING_TABLE_FIELDS = frozenset({"subscription_status", "status", "kind", "purpose", "source"})
+
+_HEADER_SIZE = struct.Struct("<I")
+
+
+def _header(signature: Any) -> tuple:
+    return (FORMAT_VERSION, sys.implementation.cache_tag, signature)
+
+
+def _with_string_table(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copie des enregistrements où chaque clé et valeur répétée est un objet unique"""
+    table: Dict[str, str] = {}
+    shared = table.setdefault
+    result = []
+    for record in records:
+        result.append({
+            shared(key, key): shared(value, value)
+            if key in STRING_TABLE_FIELDS and isinstance(value, str) else value
+            for key, value in record.items()
+        })
+    return result
+
+
+def write_snapshot(path: Path, signature: Any, records: List[Dict[str, Any]]) -> None:
+    """
+    Écrit l'instantané de `records`, correspondant au JSON de signature `signature`.
+
+    L'écriture passe par un fichier temporaire puis os.replace : un lecteur
+    concurrent voit l'ancien ou le nouvel instantané. Il s'agit d'un cache
+    dérivé du JSON : une erreur d'écriture est journalisée, pas propagée.
+    """
+    try:
+        header = marshal.dumps(_header(signature))
+        body = marshal.dumps(_with_string_table(records))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(MAGIC + _HEADER_SIZE.pack(len(header)) + header + body)
+            # Mêmes droits que l'instantané remplacé (mkstemp crée en 0600)
+            os.chmod(tmp_name, file_mode(path))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except (OSError, ValueError) as exc:
+        logger.warning("Instantané %s non écrit : %s", path, exc)
+
+
+def read_snapshot(path: Path, signature: Any) -> List[Dict[str, Any]] | None:
+    """
+    Charge l'instantané s'il correspond à la signature du JSON source.
+
+    Returns:
+        Les enregistrements, ou None si l'instantané est absent, périmé,
+        produit par un autre interpréteur ou illisible
+    """
+    try:
+        with path.open("rb") as handle:
+            if handle.read(len(MAGIC)) != MAGIC:
+                return None
+            (header_size,) = _HEADER_SIZE.unpack(handle.read(_HEADER_SIZE.size))
+            if marshal.loads(handle.read(header_size)) != _header(signature):
+                return None
+            body = handle.read()
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError, struct.error) as exc:
+        logger.warning("Instantané %s illisible : %s", path, exc)
+        return None
+
+    # Les données ne contiennent aucun cycle : le ramasse-miettes cyclique,
+    # déclenché des milliers de fois pendant la création des dictionnaires,
+    # est suspendu le temps du chargement.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        records = marshal.loads(body)
+    except (EOFError, ValueError, TypeError) as exc:
+        logger.warning("Instantané %s illisible : %s", path, exc)
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return records if isinstance(records, list) else None
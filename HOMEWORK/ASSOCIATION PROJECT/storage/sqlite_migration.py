@@ -0,0 +1,59 @@
+"""
+Migration ponctuelle des fichiers data/*.json vers une base SQLite.
+
+Usage: python -m storage.sqlite_migration [data_dir] [db_path]
+"""
+from __future__ import annotations
+import sys
+from pathlib import Path
+from typing import Dict
+
+from storage.json_storage import JSONStorage
+from storage.sqlite_storage import SQLiteStorage
+
+
+def migrate_json_to_sqlite(json_dir: Path, db_path: Path) -> Dict[str, int]:
+    """
+    Copie les collections JSON (membres, événements, finances, groupes) dans la base SQLite.
+
+    Les tables existantes sont remplacées, la migration peut donc être
+    relancée sans créer de doublons.
+
+    Returns:
+        Nombre d'enregistrements migrés par collection
+    """
+    source = JSONStorage(json_dir)
+    target = SQLiteStorage(db_path)
+    try:
+        members = source.load_members()
+        events = source.load_events()
+        subscriptions = source.load_subscriptions()
+        donations = source.load_donations()
+        groups = source.load_groups()
+
+        target.save_members(members)
+        target.save_events(events)
+        target.save_subscriptions(subscriptions)
+        target.save_donations(donations)
+        target.save_groups(groups)
+    finally:
+        target.close()
+
+    return {
+        "members": len(members),
+        "events": len(events),
+        "subscriptions": len(subscriptions),
+        "donations": len(donations),
+        "groups": len(groups),
+    }
+
+
+if __name__ == "__main__":
+    base_dir = Path(__file__).resolve().parent.parent
+    data_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else base_dir / "data"
+    db_file = Path(sys.argv[2]) if len(sys.argv) > 2 else data_dir / "madrassa.db"
+
+    counts = migrate_json_to_sqlite(data_dir, db_file)
+    for collection, count in counts.items():
+        print(f"{collection}: {count} enregistrement(s) migré(s)")
+    print(f"Base SQLite : {db_file}")
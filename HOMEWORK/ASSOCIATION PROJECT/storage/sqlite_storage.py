@@ -0,0 +1,439 @@
+from __future__ import annotations
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from interfaces.storage_interface import StorageInterface, VersionConflictError, check_in_range
+from interfaces.queryable_storage import QueryableStorage
+from models.records import iso_day
+from storage.collection_lock import VersionTracker
+
+
+# Chaque enregistrement est stocké tel quel (colonne `data`, JSON) ; les champs
+# utilisés pour les recherches sont recopiés dans des colonnes indexées.
+# `id` conserve l'ordre d'insertion, identique à l'ordre des fichiers JSON.
+# Les colonnes `day` / `event_day` contiennent le jour normalisé de la date
+# (iso_day : "2025-5-2" et "2025-05-02T10:30" donnent "2025-05-02"), NULL si
+# elle est invalide : les recherches par jour y sont faites comme date_in_range.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS members (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id INTEGER,
+    teacher_id INTEGER,
+    email TEXT,
+    subscription_status TEXT COLLATE NOCASE,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_members_student_id ON members(student_id);
+CREATE INDEX IF NOT EXISTS idx_members_teacher_id ON members(teacher_id);
+
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_name TEXT,
+    event_date TEXT,
+    event_day TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_event_date ON events(event_date);
+
+CREATE TABLE IF NOT EXISTS subscriptions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id INTEGER,
+    date TEXT,
+    day TEXT,
+    status TEXT COLLATE NOCASE,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_subscriptions_student_id ON subscriptions(student_id);
+CREATE INDEX IF NOT EXISTS idx_subscriptions_status ON subscriptions(status);
+CREATE INDEX IF NOT EXISTS idx_subscriptions_date ON subscriptions(date);
+
+CREATE TABLE IF NOT EXISTS donations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    donor_name TEXT,
+    date TEXT,
+    day TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_donations_date ON donations(date);
+
+CREATE TABLE IF NOT EXISTS groups (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    group_id INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_groups_group_id ON groups(group_id);
+
+CREATE TABLE IF NOT EXISTS versions (
+    collection TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+"""
+
+# Colonnes indexées de chaque table (hors `id` et `data`)
+_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "members": ("student_id", "teacher_id", "email", "subscription_status"),
+    "events": ("event_name", "event_date"),
+    "subscriptions": ("student_id", "date", "status"),
+    "donations": ("donor_name", "date"),
+    "groups": ("group_id",),
+}
+
+# Colonne du jour normalisé -> champ de date dont elle est tirée
+_DAY_COLUMNS: Dict[str, Tuple[str, str]] = {
+    "events": ("event_day", "event_date"),
+    "subscriptions": ("day", "date"),
+    "donations": ("day", "date"),
+}
+
+
+class SQLiteStorage(StorageInterface, QueryableStorage):
+    """
+    Storage SQLite (module standard `sqlite3`).
+
+    Implémente StorageInterface comme JSONStorage (chargement/sauvegarde de
+    collections complètes) et expose en plus des recherches indexées via
+    QueryableStorage : par student_id, teacher_id, date d'événement,
+    statut d'abonnement et date de don.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self._db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._collection_locks = {table: threading.RLock() for table in _COLUMNS}
+        self._versions = VersionTracker()
+        # Transactions gérées explicitement (BEGIN IMMEDIATE) dans _write_transaction
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.executescript(_SCHEMA)
+        self._add_day_columns()
+
+    def _add_day_columns(self) -> None:
+        """
+        Ajoute les colonnes de jour normalisé aux bases créées sans elles,
+        remplies depuis les dates déjà stockées, puis indexe ces colonnes.
+        """
+        self._conn.create_function("iso_day", 1, iso_day, deterministic=True)
+        with self._write_transaction() as conn:
+            for table, (column, field) in _DAY_COLUMNS.items():
+                existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+                    conn.execute(f"UPDATE {table} SET {column} = iso_day(json_extract(data, '$.{field}'))")
+                conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table}({column})")
+
+    def close(self) -> None:
+        """Ferme la connexion à la base"""
+        with self._lock:
+            self._conn.close()
+
+    # ==================== LECTURE / ÉCRITURE GÉNÉRIQUES ====================
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[Dict[str, Any]]:
+        """Exécute une requête SELECT sur la colonne `data` et décode les enregistrements"""
+        with self._lock:
+            rows = self._conn.execute(sql, tuple(params)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def _iter_table(self, table: str, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """
+        Parcourt une table par lots, sans la charger entièrement.
+
+        Le verrou de connexion n'est tenu que pendant la lecture de chaque
+        lot : un consommateur lent ne bloque pas les autres threads. Les
+        lignes ajoutées après le début du parcours sont ignorées (comme
+        pour un fichier déjà ouvert) ; une réécriture complète de la table
+        (save_*) pendant le parcours lève VersionConflictError.
+        """
+        with self._lock:
+            version = self._read_version(table)
+            last_id = 0
+            max_id = self._conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+        while last_id < max_id:
+            with self._lock:
+                if last_id and self._read_version(table) != version:
+                    # Les id AUTOINCREMENT ne sont jamais réutilisés : si la dernière
+                    # ligne lue a disparu, la table a été réécrite.
+                    if self._conn.execute(f"SELECT 1 FROM {table} WHERE id = ?", (last_id,)).fetchone() is None:
+                        raise VersionConflictError(f"{table} réécrite pendant le parcours")
+                    version = self._read_version(table)
+                rows = self._conn.execute(
+                    f"SELECT id, data FROM {table} WHERE id > ? AND id <= ? ORDER BY id LIMIT ?",
+                    (last_id, max_id, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            for _, data in rows:
+                yield json.loads(data)
+            last_id = rows[-1][0]
+
+    def _load_table(self, table: str) -> List[Dict[str, Any]]:
+        """Charge une table en mémorisant la version lue par ce thread"""
+        with self._lock:
+            self._versions.remember(table, self._read_version(table))
+            return self._query(f"SELECT data FROM {table} ORDER BY id")
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Transaction d'écriture : BEGIN IMMEDIATE réserve le verrou d'écriture
+        de la base dès le début, y compris vis-à-vis des autres processus.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _read_version(self, table: str) -> int:
+        row = self._conn.execute("SELECT version FROM versions WHERE collection = ?", (table,)).fetchone()
+        return row[0] if row else 0
+
+    def _bump_version(self, table: str) -> int:
+        self._conn.execute(
+            "INSERT INTO versions (collection, version) VALUES (?, 1) "
+            "ON CONFLICT(collection) DO UPDATE SET version = version + 1",
+            (table,),
+        )
+        return self._read_version(table)
+
+    def _row_values(self, table: str, record: Dict[str, Any]) -> Tuple[Any, ...]:
+        values = tuple(record.get(column) for column in _COLUMNS[table])
+        if table in _DAY_COLUMNS:
+            values += (iso_day(record.get(_DAY_COLUMNS[table][1])),)
+        return values + (json.dumps(record, ensure_ascii=False),)
+
+    def _insert_sql(self, table: str) -> str:
+        columns = _COLUMNS[table] + _DAY_COLUMNS.get(table, ())[:1] + ("data",)
+        placeholders = ", ".join("?" for _ in columns)
+        return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+    def _insert(self, table: str, record: Dict[str, Any]) -> None:
+        """Insère un seul enregistrement en fin de table"""
+        with self._write_transaction() as conn:
+            up_to_date = self._versions.observed(table) == self._read_version(table)
+            conn.execute(self._insert_sql(table), self._row_values(table, record))
+            version = self._bump_version(table)
+        if up_to_date:
+            self._versions.remember(table, version)
+
+    def _save_table(self, table: str, records: List[Dict[str, Any]]) -> None:
+        """
+        Remplace tout le contenu d'une table dans une seule transaction.
+
+        Lève VersionConflictError si la table a changé depuis le dernier
+        chargement de ce thread.
+        """
+        self._save_tables({table: records})
+
+    def _save_tables(self, tables: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Remplace le contenu de plusieurs tables dans une seule transaction (voir _save_table)"""
+        for table in tables:
+            if table not in _COLUMNS:
+                raise ValueError(f"Collection inconnue : {table}")
+        versions: Dict[str, int] = {}
+        with self._write_transaction() as conn:
+            for table, records in tables.items():
+                current = self._read_version(table)
+                observed = self._versions.observed(table)
+                if observed is not None and observed != current:
+                    raise VersionConflictError(f"{table} : version {observed} chargée, version {current} en base")
+                conn.execute(f"DELETE FROM {table}")
+                conn.executemany(self._insert_sql(table), (self._row_values(table, r) for r in records))
+                versions[table] = self._bump_version(table)
+        for table, version in versions.items():
+            self._versions.remember(table, version)
+
+    @staticmethod
+    def _date_clause(start: str | None, end: str | None) -> Tuple[str, Tuple[str, ...]]:
+        """
+        Condition SQL équivalente à date_in_range (comparaison sur le jour
+        normalisé `day`, bornes incluses) ; une date invalide n'est dans
+        aucun intervalle borné.
+        """
+        conditions, params = [], []
+        if start is not None:
+            conditions.append("day >= ?")
+            params.append(iso_day(start) or start)
+        if end is not None:
+            conditions.append("day <= ?")
+            params.append(iso_day(end) or end)
+        return (" AND ".join(conditions) or "1"), tuple(params)
+
+    def _load_between(self, table: str, start: str | None, end: str | None) -> List[Dict[str, Any]]:
+        clause, params = self._date_clause(start, end)
+        with self._lock:
+            self._versions.remember(table, self._read_version(table))
+            return self._query(f"SELECT data FROM {table} WHERE {clause} ORDER BY id", params)
+
+    def _save_between(self, table: str, start: str | None, end: str | None, records: List[Dict[str, Any]]) -> None:
+        """
+        Remplace les lignes de l'intervalle dans une seule transaction.
+
+        Les lignes remplacées reçoivent de nouveaux `id` : elles passent en
+        fin d'ordre d'insertion. Même contrôle de version que _save_table.
+        """
+        check_in_range(records, start, end)
+        clause, params = self._date_clause(start, end)
+        with self._write_transaction() as conn:
+            current = self._read_version(table)
+            observed = self._versions.observed(table)
+            if observed is not None and observed != current:
+                raise VersionConflictError(f"{table} : version {observed} chargée, version {current} en base")
+            conn.execute(f"DELETE FROM {table} WHERE {clause}", params)
+            conn.executemany(self._insert_sql(table), (self._row_values(table, r) for r in records))
+            version = self._bump_version(table)
+        self._versions.remember(table, version)
+
+    # ==================== StorageInterface ====================
+
+    def load_members(self) -> List[Dict[str, Any]]:
+        return self._load_table("members")
+
+    def load_events(self) -> List[Dict[str, Any]]:
+        return self._load_table("events")
+
+    def load_subscriptions(self) -> List[Dict[str, Any]]:
+        return self._load_table("subscriptions")
+
+    def load_donations(self) -> List[Dict[str, Any]]:
+        return self._load_table("donations")
+
+    def load_groups(self) -> List[Dict[str, Any]]:
+        return self._load_table("groups")
+
+    def iter_members(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_table("members")
+
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_table("events")
+
+    def iter_subscriptions(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_table("subscriptions")
+
+    def iter_donations(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_table("donations")
+
+    def iter_groups(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_table("groups")
+
+    def save_members(self, members: List[Dict[str, Any]]) -> None:
+        """Sauvegarde les membres"""
+        self._save_table("members", members)
+
+    def save_events(self, events: List[Dict[str, Any]]) -> None:
+        """Sauvegarde les événements"""
+        self._save_table("events", events)
+
+    def save_subscriptions(self, subscriptions: List[Dict[str, Any]]) -> None:
+        """Sauvegarde les abonnements"""
+        self._save_table("subscriptions", subscriptions)
+
+    def save_donations(self, donations: List[Dict[str, Any]]) -> None:
+        """Sauvegarde les dons"""
+        self._save_table("donations", donations)
+
+    def save_groups(self, groups: List[Dict[str, Any]]) -> None:
+        """Sauvegarde les groupes"""
+        self._save_table("groups", groups)
+
+    def append_member(self, member: Dict[str, Any]) -> None:
+        """Ajoute un membre"""
+        self._insert("members", member)
+
+    def append_event(self, event: Dict[str, Any]) -> None:
+        """Ajoute un événement"""
+        self._insert("events", event)
+
+    def append_subscription(self, subscription: Dict[str, Any]) -> None:
+        """Ajoute un abonnement"""
+        self._insert("subscriptions", subscription)
+
+    def append_donation(self, donation: Dict[str, Any]) -> None:
+        """Ajoute un don"""
+        self._insert("donations", donation)
+
+    def load_subscriptions_between(self, start: str | None = None, end: str | None = None) -> List[Dict[str, Any]]:
+        return self._load_between("subscriptions", start, end)
+
+    def load_donations_between(self, start: str | None = None, end: str | None = None) -> List[Dict[str, Any]]:
+        return self._load_between("donations", start, end)
+
+    def save_subscriptions_between(self, start: str | None, end: str | None,
+                                   subscriptions: List[Dict[str, Any]]) -> None:
+        self._save_between("subscriptions", start, end, subscriptions)
+
+    def save_donations_between(self, start: str | None, end: str | None,
+                               donations: List[Dict[str, Any]]) -> None:
+        self._save_between("donations", start, end, donations)
+
+    def save_collections(self, changes: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Écrit plusieurs collections dans une seule transaction SQLite"""
+        self._save_tables(changes)
+
+    def load_page(self, collection: str, offset: int = 0, limit: int | None = None) -> List[Dict[str, Any]]:
+        """Lit uniquement la tranche demandée (LIMIT/OFFSET ; -1 = sans limite)"""
+        if collection not in _COLUMNS:
+            raise ValueError(f"Collection inconnue : {collection}")
+        return self._query(
+            f"SELECT data FROM {collection} ORDER BY id LIMIT ? OFFSET ?",
+            (-1 if limit is None else limit, offset),
+        )
+
+    def lock(self, collection: str) -> threading.RLock:
+        """Verrou de la collection pour ce processus ; entre processus, les conflits sont détectés par version"""
+        return self._collection_locks[collection]
+
+    def get_version(self, collection: str) -> int:
+        """Version courante de la collection"""
+        with self._lock:
+            return self._read_version(collection)
+
+    # ==================== QueryableStorage ====================
+
+    def find_member_by_id(self, member_id: int, member_type: str = "student") -> Dict[str, Any] | None:
+        """Récupère un membre par son ID via l'index student_id / teacher_id"""
+        if member_type not in ("student", "teacher"):
+            for member in self.load_members():
+                if member.get("id") == member_id:
+                    return member
+            return None
+        rows = self._query(
+            f"SELECT data FROM members WHERE {member_type}_id = ? ORDER BY id LIMIT 1",
+            (member_id,),
+        )
+        return rows[0] if rows else None
+
+    def find_subscriptions_by_student(self, student_id: int) -> List[Dict[str, Any]]:
+        """Récupère les abonnements d'un étudiant"""
+        return self._query(
+            "SELECT data FROM subscriptions WHERE student_id = ? ORDER BY id",
+            (student_id,),
+        )
+
+    def find_subscriptions_by_status(self, status: str) -> List[Dict[str, Any]]:
+        """Récupère les abonnements par statut (insensible à la casse)"""
+        return self._query(
+            "SELECT data FROM subscriptions WHERE status = ? ORDER BY id",
+            (status,),
+        )
+
+    def find_events_by_date(self, event_date: str) -> List[Dict[str, Any]]:
+        """Récupère les événements d'un jour donné (heure ignorée, comme date_in_range)"""
+        return self._query(
+            "SELECT data FROM events WHERE event_day = ? ORDER BY id",
+            (iso_day(event_date),),
+        )
+
+    def find_donations_by_date(self, date: str) -> List[Dict[str, Any]]:
+        """Récupère les dons d'un jour donné (heure ignorée, comme date_in_range)"""
+        return self._query(
+            "SELECT data FROM donations WHERE day = ? ORDER BY id",
+            (iso_day(date),),
+        )
@@ -0,0 +1,134 @@
+from __future__ import annotations
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List
+
+from interfaces.storage_interface import StorageInterface
+
+COLLECTIONS = ("members", "events", "subscriptions", "donations", "groups")
+
+
+class UnitOfWork:
+    """
+    Regroupe des modifications sur plusieurs collections et les écrit d'un bloc.
+
+    Utilisation :
+
+        with UnitOfWork(storage, "members", "events") as uow:
+            uow.update("members", lambda m: m.get("groupe") == 3, {"groupe": 4})
+            uow.append("events", event)
+
+    Les collections sont déclarées à l'ouverture et leurs verrous pris dans
+    un ordre fixe (alphabétique), ce qui exclut tout interblocage entre
+    deux unités de travail. Chaque collection est chargée au plus une fois ;
+    à la sortie du bloc, les collections modifiées sont écrites en une
+    seule sauvegarde chacune via StorageInterface.save_collections (tout ou
+    rien). Une exception dans le bloc annule tout : rien n'est écrit.
+
+    Les enregistrements chargés peuvent être partagés avec un cache : on les
+    remplace (update) au lieu de les modifier en place.
+    """
+
+    def __init__(self, storage: StorageInterface, *collections: str) -> None:
+        unknown = [c for c in collections if c not in COLLECTIONS]
+        if unknown or not collections:
+            raise ValueError(f"Collections invalides : {unknown or 'aucune'}")
+        self._storage = storage
+        self._collections = sorted(set(collections))
+        self._locks: ExitStack | None = None
+        self._records: Dict[str, List[Dict[str, Any]]] = {}
+        self._dirty: set[str] = set()
+        self._on_commit: List[Callable[[], None]] = []
+
+    def __enter__(self) -> UnitOfWork:
+        locks = ExitStack()
+        try:
+            for collection in self._collections:
+                locks.enter_context(self._storage.lock(collection))
+        except BaseException:
+            locks.close()
+            raise
+        self._locks = locks
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        callbacks: List[Callable[[], None]] = []
+        try:
+            if exc_type is None:
+                callbacks = self._flush()
+            else:
+                self.rollback()
+        finally:
+            if self._locks is not None:
+                self._locks.close()
+                self._locks = None
+        # Hors des verrous, comme les notifications des contrôleurs après run_locked
+        for callback in callbacks:
+            callback()
+
+    # ==================== MODIFICATIONS ====================
+
+    def records(self, collection: str) -> List[Dict[str, Any]]:
+        """Liste de travail de la collection (chargée au premier accès)"""
+        if collection not in self._collections:
+            raise ValueError(f"{collection} n'a pas été déclarée dans cette unité de travail")
+        if collection not in self._records:
+            self._records[collection] = self._storage.load_collection(collection)
+        return self._records[collection]
+
+    def append(self, collection: str, record: Dict[str, Any]) -> None:
+        self.records(collection).append(record)
+        self._dirty.add(collection)
+
+    def update(self, collection: str, predicate: Callable[[Dict[str, Any]], bool],
+               changes: Dict[str, Any] | Callable[[Dict[str, Any]], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Remplace chaque enregistrement retenu par une copie modifiée.
+
+        Args:
+            changes: Champs à modifier, ou fonction qui les calcule pour
+                chaque enregistrement retenu
+
+        Returns:
+            Les nouveaux enregistrements (vide si aucun ne correspond)
+        """
+        records = self.records(collection)
+        updated: List[Dict[str, Any]] = []
+        for index, record in enumerate(records):
+            if predicate(record):
+                records[index] = {**record, **(changes(record) if callable(changes) else changes)}
+                updated.append(records[index])
+        if updated:
+            self._dirty.add(collection)
+        return updated
+
+    def remove(self, collection: str, predicate: Callable[[Dict[str, Any]], bool]) -> int:
+        """Retire les enregistrements retenus ; retourne leur nombre"""
+        records = self.records(collection)
+        kept = [r for r in records if not predicate(r)]
+        removed = len(records) - len(kept)
+        if removed:
+            records[:] = kept
+            self._dirty.add(collection)
+        return removed
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Action à exécuter après une écriture réussie (mise à jour de caches, notifications)"""
+        self._on_commit.append(callback)
+
+    # ==================== VALIDATION / ANNULATION ====================
+
+    def _flush(self) -> List[Callable[[], None]]:
+        if self._dirty:
+            self._storage.save_collections({c: self._records[c] for c in sorted(self._dirty)})
+        callbacks = self._on_commit if self._dirty else []
+        self._reset()
+        return callbacks
+
+    def rollback(self) -> None:
+        """Abandonne les modifications en attente"""
+        self._reset()
+
+    def _reset(self) -> None:
+        self._records.clear()
+        self._dirty.clear()
+        self._on_commit = []
@@ -1,20 +1,20 @@
-"""Strategy pattern pour les stratégies de tri des membres"""
-
-from .sort_strategy import SortStrategy
-from .sort_by_name_strategy import SortByNameStrategy
-from .sort_by_id_strategy import SortByIdStrategy
-from .sort_by_date_strategy import SortByDateStrategy
-from .sort_by_group_strategy import SortByGroupStrategy
-from .sort_by_status_strategy import SortByStatusStrategy
-from .member_sorter import MemberSorter
-
-__all__ = [
-    "SortStrategy",
-    "SortByNameStrategy",
-    "SortByIdStrategy",
-    "SortByDateStrategy",
-    "SortByGroupStrategy",
-    "SortByStatusStrategy",
-    "MemberSorter",
-]
-
+"""Strategy pattern pour les stratégies de tri des membres"""
+
+from .sort_strategy import SortStrategy
+from .sort_by_name_strategy import SortByNameStrategy
+from .sort_by_id_strategy import SortByIdStrategy
+from .sort_by_date_strategy import SortByDateStrategy
+from .sort_by_group_strategy import SortByGroupStrategy
+from .sort_by_status_strategy import SortByStatusStrategy
+from .member_sorter import MemberSorter
+
+__all__ = [
+    "SortStrategy",
+    "SortByNameStrategy",
+    "SortByIdStrategy",
+    "SortByDateStrategy",
+    "SortByGroupStrategy",
+    "SortByStatusStrategy",
+    "MemberSorter",
+]
+
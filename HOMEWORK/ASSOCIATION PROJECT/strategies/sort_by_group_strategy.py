@@ -1,50 +1,57 @@
-"""Stratégie de tri par groupe"""
-
-from __future__ import annotations
-from typing import Any, Dict, List
-from .sort_strategy import SortStrategy
-
-
-class SortByGroupStrategy(SortStrategy):
-    """
-    Stratégie de tri des étudiants par groupe.
-    Les membres sans groupe sont placés à la fin.
-    """
-    
-    def sort(self, members: List[Dict[str, Any]], reverse: bool = False) -> List[Dict[str, Any]]:
-        """
-        Trie les membres par groupe.
-        
-        Args:
-            members: Liste des membres à trier
-            reverse: Si True, trie du groupe le plus élevé au plus bas
-            
-        Returns:
-            Liste des membres triés par groupe
-        """
-        def get_group(member: Dict[str, Any]) -> int:
-            """Extrait le numéro de groupe, retourne -1 si absent"""
-            groupe = member.get("groupe")
-            if groupe is None:
-                return -1
-            try:
-                return int(groupe)
-            except (ValueError, TypeError):
-                return -1
-        
-        sorted_members = sorted(
-            members,
-            key=get_group,
-            reverse=reverse
-        )
-        
-        # Placer les membres sans groupe à la fin
-        with_group = [m for m in sorted_members if get_group(m) != -1]
-        without_group = [m for m in sorted_members if get_group(m) == -1]
-        
-        return with_group + without_group
-    
-    def get_name(self) -> str:
-        """Retourne le nom de la stratégie"""
-        return "Par groupe"
-
+"""Stratégie de tri par groupe"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Tuple
+from .sort_strategy import SortStrategy
+
+
+def _get_group(member: Dict[str, Any]) -> int:
+    """Extrait le numéro de groupe, retourne -1 si absent"""
+    groupe = member.get("groupe")
+    if groupe is None:
+        return -1
+    try:
+        return int(groupe)
+    except (ValueError, TypeError):
+        return -1
+
+
+class SortByGroupStrategy(SortStrategy):
+    """
+    Stratégie de tri des étudiants par groupe.
+    Les membres sans groupe sont placés à la fin.
+    """
+    
+    def sort(self, members: List[Dict[str, Any]], reverse: bool = False) -> List[Dict[str, Any]]:
+        """
+        Trie les membres par groupe.
+        
+        Args:
+            members: Liste des membres à trier
+            reverse: Si True, trie du groupe le plus élevé au plus bas
+            
+        Returns:
+            Liste des membres triés par groupe
+        """
+        return sorted(
+            members,
+            key=self.sort_key(reverse),
+            reverse=reverse
+        )
+    
+    def sort_key(self, reverse: bool = False) -> Callable[[Dict[str, Any]], Tuple[bool, int]]:
+        """
+        Clé composite (a un groupe, numéro de groupe).
+        
+        Le premier élément place les membres sans groupe à la fin dans les
+        deux sens de tri : il vaut "sans groupe" en croissant et "avec groupe"
+        en décroissant.
+        """
+        if reverse:
+            return lambda m: (_get_group(m) != -1, _get_group(m))
+        return lambda m: (_get_group(m) == -1, _get_group(m))
+    
+    def get_name(self) -> str:
+        """Retourne le nom de la stratégie"""
+        return "Par groupe"
+
@@ -0,0 +1,47 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import pytest
+
+from interfaces.storage_interface import StorageInterface
+from storage.cached_json_storage import CachedJSONStorage
+from storage.journaled_json_storage import JournaledJSONStorage
+from storage.json_storage import JSONStorage
+from storage.partitioned_json_storage import PartitionedJSONStorage
+from storage.sqlite_storage import SQLiteStorage
+
+# Backends de StorageFactory, construits sur un dossier de données
+BACKENDS: Dict[str, Callable[[Path], StorageInterface]] = {
+    "json": lambda data_dir: JSONStorage(data_dir),
+    "cached": lambda data_dir: CachedJSONStorage(data_dir, snapshot_dir=data_dir / ".snapshots"),
+    "journal": lambda data_dir: JournaledJSONStorage(data_dir, snapshot_dir=data_dir / ".snapshots"),
+    "partitioned": lambda data_dir: PartitionedJSONStorage(data_dir, snapshot_dir=data_dir / ".snapshots"),
+    "sqlite": lambda data_dir: SQLiteStorage(data_dir / "madrassa.db"),
+}
+
+
+@pytest.fixture(params=sorted(BACKENDS))
+def open_storage(request: pytest.FixtureRequest, tmp_path: Path) -> Callable[[], StorageInterface]:
+    """
+    Ouvre le backend testé sur un même dossier temporaire.
+
+    Chaque appel retourne une nouvelle instance (autre « processus ») qui
+    voit les données écrites par les précédentes.
+    """
+    opened: List[StorageInterface] = []
+
+    def open_() -> StorageInterface:
+        storage = BACKENDS[request.param](tmp_path)
+        opened.append(storage)
+        return storage
+
+    yield open_
+    for storage in opened:
+        if isinstance(storage, SQLiteStorage):
+            storage.close()
+
+
+@pytest.fixture
+def storage(open_storage: Callable[[], StorageInterface]) -> StorageInterface:
+    return open_storage()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+from typing import Any, Dict, List
+
+from interfaces.storage_interface import StorageInterface
+
+
+def seed(storage: StorageInterface, **collections: List[Dict[str, Any]]) -> None:
+    """Remplace le contenu des collections données (members=[...], events=[...]...)"""
+    for collection, records in collections.items():
+        getattr(storage, f"save_{collection}")(records)
+
+
+def student(student_id: int, **fields: Any) -> Dict[str, Any]:
+    record = {
+        "student_id": student_id,
+        "full_name": f"Etudiant {student_id}",
+        "email": f"etudiant{student_id}@example.com",
+        "join_date": "2025-01-10",
+        "groupe": 1,
+        "subscription_status": "Paid",
+    }
+    record.update(fields)
+    return record
+
+
+def teacher(teacher_id: int, **fields: Any) -> Dict[str, Any]:
+    record = {
+        "teacher_id": teacher_id,
+        "full_name": f"Enseignant {teacher_id}",
+        "email": f"enseignant{teacher_id}@example.com",
+        "join_date": "2024-09-01",
+    }
+    record.update(fields)
+    return record
@@ -0,0 +1,73 @@
+"""Recherches par date : même résultat sur tous les backends (dates complétées de zéros ou non, avec heure)"""
+from __future__ import annotations
+
+import pytest
+
+from facades.association_facade import AssociationFacade
+from tests.helpers import seed
+
+DONATIONS = [
+    {"donor_name": "Horodaté", "amount": 10.0, "date": "2025-11-18T10:30"},
+    {"donor_name": "Court", "amount": 5.0, "date": "2025-5-2"},
+    {"donor_name": "Fin de mois", "amount": 1.0, "date": "2025-05-31"},
+    {"donor_name": "Juin", "amount": 2.0, "date": "2025-06-01"},
+    {"donor_name": "Sans date", "amount": 3.0, "date": ""},
+]
+SUBSCRIPTIONS = [
+    {"student_id": 1, "amount": 30.0, "date": "2025-5-2", "status": "Paid"},
+    {"student_id": 2, "amount": 30.0, "date": "2025-04-30 08:00", "status": "Pending"},
+]
+EVENTS = [
+    {"event_name": "Soirée", "event_date": "2025-12-09T18:00", "organizer_ids": [], "participant_ids": []},
+    {"event_name": "Cours", "event_date": "2025-12-09", "organizer_ids": [], "participant_ids": []},
+    {"event_name": "Lendemain", "event_date": "2025-12-10", "organizer_ids": [], "participant_ids": []},
+]
+
+
+@pytest.fixture
+def facade(storage):
+    seed(storage, members=[], events=EVENTS, subscriptions=SUBSCRIPTIONS, donations=DONATIONS)
+    return AssociationFacade(storage)
+
+
+def _donors(records):
+    return [record["donor_name"] for record in records]
+
+
+def test_day_lookup_ignores_time(facade):
+    assert _donors(facade.get_donations_by_date("2025-11-18")) == ["Horodaté"]
+    assert [e["event_name"] for e in facade.get_events_by_date("2025-12-09")] == ["Soirée", "Cours"]
+
+
+def test_day_lookup_accepts_non_padded_dates(facade):
+    assert _donors(facade.get_donations_by_date("2025-5-2")) == ["Court"]
+    assert _donors(facade.get_donations_by_date("2025-05-02")) == ["Court"]
+
+
+def test_ranges_compare_parsed_days(facade):
+    assert _donors(facade.get_donations_between("2025-05-01", "2025-05-31")) == ["Court", "Fin de mois"]
+    assert _donors(facade.get_donations_between("2025-5-1", "2025-6-1")) == ["Court", "Fin de mois", "Juin"]
+    assert [s["student_id"] for s in facade.get_subscriptions_between("2025-04-30", "2025-05-02")] == [2, 1]
+    assert _donors(facade.get_donations_between("2025-11-18", None)) == ["Horodaté"]
+
+
+def test_undated_records_are_in_no_bounded_range(facade):
+    assert "Sans date" not in _donors(facade.get_donations_between("2000-01-01", "2100-01-01"))
+
+
+@pytest.mark.parametrize("donor, date, amount", [
+    ("Horodaté", "2025-11-18T10:30", 10.0),
+    ("Court", "2025-5-2", 5.0),
+    ("Fin de mois", "2025-05-31", 1.0),
+])
+def test_delete_matches_stored_date_exactly(facade, storage, donor, date, amount):
+    assert not facade.delete_donation(donor, "2025-01-01", amount)
+    assert facade.delete_donation(donor, date, amount)
+    remaining = _donors(storage.load_donations())
+    assert donor not in remaining
+    assert len(remaining) == len(DONATIONS) - 1
+
+
+def test_delete_subscription_with_non_padded_date(facade, storage):
+    assert facade.delete_subscription(1, "2025-5-2")
+    assert [s["student_id"] for s in storage.load_subscriptions()] == [2]
@@ -0,0 +1,37 @@
+"""Ajouts d'abonnements et de dons : un montant invalide n'est jamais écrit"""
+from __future__ import annotations
+
+import pytest
+
+from facades.association_facade import AssociationFacade
+from tests.helpers import seed
+
+
+@pytest.fixture
+def facade(storage):
+    seed(storage, members=[], donations=[{"donor_name": "A", "amount": 10.0, "date": "2025-06-01"}],
+         subscriptions=[{"student_id": 1, "amount": 30.0, "date": "2025-06-01", "status": "Paid"}])
+    return AssociationFacade(storage)
+
+
+def test_invalid_amount_is_rejected_before_writing(facade, storage):
+    statistics = facade.get_statistics()
+    with pytest.raises(ValueError):
+        facade.add_donation({"donor_name": "B", "amount": "abc", "date": "2025-06-02"})
+    with pytest.raises(ValueError):
+        facade.add_subscription({"student_id": 2, "amount": None, "date": "2025-06-02", "status": "Paid"})
+
+    assert len(storage.load_donations()) == 1
+    assert len(storage.load_subscriptions()) == 1
+    assert facade.calculate_total_donations() == 10.0
+    assert facade.get_statistics() == statistics
+
+
+def test_valid_additions_update_totals_and_statistics(facade):
+    facade.add_donation({"donor_name": "B", "amount": "5", "date": "2025-6-2"})
+    facade.add_subscription({"student_id": 2, "amount": 20, "date": "2025-07-01", "status": "Pending"})
+    assert facade.calculate_total_donations() == 15.0
+    assert facade.calculate_total_subscriptions("pending") == 20.0
+    statistics = facade.get_statistics()
+    assert statistics["donations_by_month"] == {"2025-06": 15.0}
+    assert statistics["subscriptions_by_month"] == {"2025-06": 30.0, "2025-07": 20.0}
@@ -0,0 +1,118 @@
+"""
+Index, caches et statistiques tenus à jour écriture par écriture : après une
+série d'écritures, chaque lecture doit donner le même résultat qu'une
+reconstruction complète depuis le storage.
+"""
+from __future__ import annotations
+from typing import Any, Dict
+
+from facades.association_facade import AssociationFacade
+from models.records import Record
+from tests.helpers import seed, student, teacher
+
+SORTS = ("name", "date", "group", "status")
+STUDENT_IDS = range(1, 7)
+TEACHER_IDS = (10, 11, 12)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
+
+
+def _reads(facade: AssociationFacade) -> Dict[str, Any]:
+    """Toutes les lectures servies par les index et caches"""
+    reads: Dict[str, Any] = {
+        "members": facade.get_all_members(),
+        "teachers": facade.get_teachers(),
+        "groups": facade.get_groups(),
+        "events": facade.get_all_events(),
+        "attendance": facade.get_attendance_counts(),
+        "subscriptions": facade.get_all_subscriptions(),
+        "paid": facade.get_subscriptions_by_status("paid"),
+        "donations": facade.get_all_donations(),
+        "donations_2025": facade.get_donations_between("2025-01-01", "2025-12-31"),
+        "total_donations": facade.calculate_total_donations(),
+        "total_subscriptions": facade.calculate_total_subscriptions(),
+        "total_paid": facade.calculate_total_subscriptions("Paid"),
+        "statistics": facade.get_statistics(),
+    }
+    for sort_by in SORTS:
+        for reverse in (False, True):
+            reads[f"students/{sort_by}/{reverse}"] = facade.get_students(sort_by, reverse)
+    for student_id in STUDENT_IDS:
+        reads[f"student/{student_id}"] = facade.get_member_by_id(student_id, "student")
+        reads[f"student/{student_id}/events"] = facade.get_member_events(student_id, "student")
+        reads[f"student/{student_id}/subscriptions"] = facade.get_subscriptions_by_student(student_id)
+    for teacher_id in TEACHER_IDS:
+        reads[f"teacher/{teacher_id}"] = facade.get_member_by_id(teacher_id, "teacher")
+        reads[f"teacher/{teacher_id}/events"] = facade.get_member_events(teacher_id, "teacher")
+    return _plain(reads)
+
+
+def _seed(storage) -> None:
+    seed(
+        storage,
+        members=[
+            student(1, full_name="Yasmine", join_date="2024-2-11"),
+            student(2, full_name="Bilal", groupe=2, subscription_status="Pending"),
+            student(3, full_name="Amine", groupe=2, join_date="2023-09-01"),
+            student(4, full_name="Sara", groupe=None),
+            teacher(10),
+            teacher(11),
+        ],
+        events=[
+            {"event_name": "Rentrée", "event_date": "2025-09-01", "organizer_ids": [10], "participant_ids": [1, 2]},
+            {"event_name": "Concours", "event_date": "2025-10-05", "organizer_ids": [11], "participant_ids": [2, 3]},
+        ],
+        groups=[{"group_id": 1, "teacher_ids": [10]}, {"group_id": 2, "teacher_ids": [11]}],
+        subscriptions=[
+            {"student_id": 1, "amount": 30.0, "date": "2025-01-15", "status": "Paid"},
+            {"student_id": 2, "amount": 30.0, "date": "2025-2-1", "status": "Pending"},
+        ],
+        donations=[{"donor_name": "Famille A", "amount": 100.0, "date": "2025-03-01"}],
+    )
+
+
+def test_incremental_updates_match_a_full_rebuild(storage, open_storage):
+    _seed(storage)
+    facade = AssociationFacade(storage)
+    _reads(facade)  # construit index, caches et compteurs avant les écritures
+
+    facade.add_member(student(5, full_name="Nour", groupe=2, join_date="2025-03-03"))
+    facade.add_member(teacher(12))
+    facade.add_member(student(6, full_name="Ilyes", subscription_status="Unpaid"))
+    facade.regroup_students([1], 3)
+    facade.link_teacher_to_group(3, 12)
+    facade.unlink_teacher_from_group(1, 10)
+    facade.move_group(2, 4)
+    facade.add_event({"event_name": "Sortie", "event_date": "2025-11-20T09:00",
+                      "organizer_ids": [12], "participant_ids": [5, 1]})
+    facade.delete_event("Rentrée")
+    facade.add_subscription({"student_id": 5, "amount": 45.5, "date": "2025-03-10", "status": "Paid"})
+    facade.delete_subscription(2, "2025-2-1")
+    facade.add_donation({"donor_name": "Famille B", "amount": 20.0, "date": "2025-4-2"})
+    facade.delete_donation("Famille A", "2025-03-01", 100.0)
+    facade.delete_member(3, "student", cascade=True)
+
+    incremental = _reads(facade)
+    rebuilt = _reads(AssociationFacade(open_storage()))
+    # Les écritures ont bien eu lieu
+    assert [m.get("student_id", m.get("teacher_id")) for m in rebuilt["members"]] == [1, 2, 4, 10, 11, 5, 12, 6]
+    assert [(g["group_id"], g["teacher_ids"]) for g in rebuilt["groups"]] == [(1, []), (3, [12]), (4, [11])]
+    assert [e["event_name"] for e in rebuilt["student/1/events"]] == ["Sortie"]
+    assert (rebuilt["total_donations"], rebuilt["total_subscriptions"]) == (20.0, 75.5)
+    for key in rebuilt:
+        assert incremental[key] == rebuilt[key], key
+
+
+def test_statistics_months_use_parsed_days(storage):
+    _seed(storage)
+    statistics = AssociationFacade(storage).get_statistics()
+    assert statistics["members_by_month"] == {"2023-09": 1, "2024-02": 1, "2024-09": 2, "2025-01": 2}
+    assert statistics["subscriptions_by_month"] == {"2025-01": 30.0, "2025-02": 30.0}
@@ -0,0 +1,109 @@
+"""Journal d'ajouts : fusion à la lecture, compaction, reprise après un arrêt brutal"""
+from __future__ import annotations
+from pathlib import Path
+
+import pytest
+
+from storage.journaled_json_storage import JournaledJSONStorage
+from storage.json_storage import JSONStorage
+
+
+def _donation(name: str) -> dict:
+    return {"donor_name": name, "amount": 1.0, "date": "2025-01-01"}
+
+
+def _names(records) -> list:
+    return [record["donor_name"] for record in records]
+
+
+@pytest.fixture
+def journaled(tmp_path: Path) -> JournaledJSONStorage:
+    """Instantané avec A, journal avec B et C"""
+    storage = JournaledJSONStorage(tmp_path, snapshot_dir=tmp_path / ".snapshots")
+    storage.save_donations([_donation("A")])
+    storage.append_donation(_donation("B"))
+    storage.append_donation(_donation("C"))
+    return storage
+
+
+def _reopen(tmp_path: Path) -> JournaledJSONStorage:
+    return JournaledJSONStorage(tmp_path, snapshot_dir=tmp_path / ".snapshots")
+
+
+class _Crash(Exception):
+    pass
+
+
+def test_appends_go_to_the_journal(journaled, tmp_path):
+    assert _names(JSONStorage(tmp_path).load_donations()) == ["A"]
+    assert (tmp_path / "donations.journal.jsonl").exists()
+    assert _names(_reopen(tmp_path).load_donations()) == ["A", "B", "C"]
+    assert _names(_reopen(tmp_path).iter_donations()) == ["A", "B", "C"]
+
+
+def test_compaction_folds_the_journal_into_the_snapshot(journaled, tmp_path):
+    journaled.compact()
+    assert not (tmp_path / "donations.journal.jsonl").exists()
+    assert _names(JSONStorage(tmp_path).load_donations()) == ["A", "B", "C"]
+    assert _names(_reopen(tmp_path).load_donations()) == ["A", "B", "C"]
+
+
+def test_threshold_triggers_compaction(tmp_path):
+    storage = JournaledJSONStorage(tmp_path, compact_threshold=1)
+    storage.save_donations([])
+    storage.append_donation(_donation("A"))
+    assert not (tmp_path / "donations.journal.jsonl").exists()
+    assert _names(JSONStorage(tmp_path).load_donations()) == ["A"]
+
+
+def test_truncated_journal_tail_is_dropped(journaled, tmp_path):
+    with (tmp_path / "donations.journal.jsonl").open("ab") as handle:
+        handle.write(b'{"donor_name": "interrompu"')
+    storage = _reopen(tmp_path)
+    assert _names(storage.load_donations()) == ["A", "B", "C"]
+    storage.append_donation(_donation("D"))
+    assert _names(_reopen(tmp_path).load_donations()) == ["A", "B", "C", "D"]
+
+
+@pytest.mark.parametrize("crash_at", ["journal_removal", "snapshot_replacement"])
+@pytest.mark.parametrize("operation", ["compact", "delete"])
+def test_interrupted_rewrite_never_duplicates_the_journal(journaled, tmp_path, monkeypatch, crash_at, operation):
+    if crash_at == "journal_removal":
+        unlink = Path.unlink
+
+        def failing_unlink(path, *args, **kwargs):
+            if path.name.endswith(".journal.jsonl"):
+                raise _Crash()
+            return unlink(path, *args, **kwargs)
+        monkeypatch.setattr(Path, "unlink", failing_unlink)
+    else:
+        replace_file = journaled._replace_file
+
+        def failing_replace(source, path):
+            if source.name.endswith(".compacting"):
+                raise _Crash()
+            return replace_file(source, path)
+        monkeypatch.setattr(journaled, "_replace_file", failing_replace)
+
+    with pytest.raises(_Crash):
+        if operation == "compact":
+            journaled.compact("donations.json")
+        else:
+            journaled.save_donations([d for d in journaled.load_donations() if d["donor_name"] != "B"])
+    monkeypatch.undo()
+
+    expected = ["A", "B", "C"] if operation == "compact" else ["A", "C"]
+    storage = _reopen(tmp_path)
+    assert _names(storage.iter_donations()) == expected
+    assert _names(storage.load_donations()) == expected
+    assert not (tmp_path / "donations.json.compacting").exists()
+    assert not (tmp_path / "donations.journal.jsonl").exists()
+    storage.append_donation(_donation("Z"))
+    assert _names(_reopen(tmp_path).load_donations()) == expected + ["Z"]
+
+
+def test_rewrite_keeps_file_permissions(journaled, tmp_path):
+    path = tmp_path / "donations.json"
+    path.chmod(0o640)
+    journaled.compact("donations.json")
+    assert path.stat().st_mode & 0o777 == 0o640
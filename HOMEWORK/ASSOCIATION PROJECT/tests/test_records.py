@@ -0,0 +1,43 @@
+"""Enregistrements typés : forme JSON publique et montants"""
+from __future__ import annotations
+
+import pytest
+
+from models.records import EventRecord, StudentRecord, SubscriptionRecord, amount_of, decode_member
+
+
+def test_to_dict_emits_only_stored_keys():
+    raw = {"student_id": 1, "name": "Ancien format", "join_date": "2022-2-11"}
+    record = decode_member(raw)
+    assert record.to_dict() == raw
+    assert list(record.to_dict()) == list(raw)
+    # Valeurs normalisées et par défaut, pour l'usage interne
+    assert record["full_name"] == "Ancien format"
+    assert record["subscription_status"] == "Pending"
+
+
+def test_replace_adds_changed_fields_to_stored_keys():
+    record = StudentRecord.from_dict({"student_id": 1, "full_name": "A"})
+    moved = record.replace(groupe=3)
+    assert moved.to_dict() == {"student_id": 1, "full_name": "A", "groupe": 3}
+    assert record.to_dict() == {"student_id": 1, "full_name": "A"}
+
+
+def test_unknown_fields_keep_their_place():
+    raw = {"name": "Sortie", "lieu": "Parc", "event_date": "2025-05-01T10:00"}
+    assert list(EventRecord.from_dict(raw).to_dict().items()) == list(raw.items())
+
+
+def test_record_built_in_code_emits_every_field():
+    assert SubscriptionRecord(student_id=2, amount=5.0).to_dict()["kind"] == "base"
+
+
+@pytest.mark.parametrize("amount", ["abc", None, [1]])
+def test_invalid_amount_raises(amount):
+    with pytest.raises(ValueError):
+        amount_of({"amount": amount})
+
+
+def test_missing_amount_is_zero():
+    assert amount_of({}) == 0.0
+    assert amount_of({"amount": "12.5"}) == 12.5
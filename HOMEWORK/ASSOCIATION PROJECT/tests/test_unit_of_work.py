@@ -0,0 +1,63 @@
+"""UnitOfWork : écriture groupée de plusieurs collections, tout ou rien"""
+from __future__ import annotations
+
+import pytest
+
+from storage.unit_of_work import UnitOfWork
+from tests.helpers import seed, student
+
+
+class _Abort(Exception):
+    pass
+
+
+@pytest.fixture
+def seeded(storage):
+    seed(storage, members=[student(1), student(2, groupe=2)], groups=[{"group_id": 1, "teacher_ids": [7]}])
+    return storage
+
+
+def test_commit_writes_every_modified_collection(seeded, open_storage):
+    committed = []
+    with UnitOfWork(seeded, "members", "groups") as uow:
+        uow.update("members", lambda m: m["groupe"] == 1, {"groupe": 3})
+        uow.append("groups", {"group_id": 3, "teacher_ids": []})
+        uow.on_commit(lambda: committed.append(True))
+        assert not committed
+
+    assert committed == [True]
+    other = open_storage()
+    assert [m["groupe"] for m in other.load_members()] == [3, 2]
+    assert [g["group_id"] for g in other.load_groups()] == [1, 3]
+
+
+def test_exception_rolls_everything_back(seeded, open_storage):
+    versions = {c: seeded.get_version(c) for c in ("members", "groups")}
+    committed = []
+    with pytest.raises(_Abort):
+        with UnitOfWork(seeded, "members", "groups") as uow:
+            uow.remove("members", lambda m: True)
+            uow.append("groups", {"group_id": 9, "teacher_ids": []})
+            uow.on_commit(lambda: committed.append(True))
+            raise _Abort()
+
+    assert not committed
+    assert {c: seeded.get_version(c) for c in ("members", "groups")} == versions
+    other = open_storage()
+    assert [m["student_id"] for m in other.load_members()] == [1, 2]
+    assert [g["group_id"] for g in other.load_groups()] == [1]
+
+
+def test_untouched_unit_writes_nothing(seeded):
+    version = seeded.get_version("members")
+    with UnitOfWork(seeded, "members") as uow:
+        uow.records("members")
+    assert seeded.get_version("members") == version
+
+
+def test_undeclared_collection_is_rejected(seeded):
+    with pytest.raises(ValueError):
+        UnitOfWork(seeded, "unknown")
+    with UnitOfWork(seeded, "members") as uow:
+        with pytest.raises(ValueError):
+            uow.records("groups")
@@ -0,0 +1,40 @@
+"""Versions des collections : une sauvegarde fondée sur une lecture périmée est refusée"""
+from __future__ import annotations
+
+import pytest
+
+from interfaces.storage_interface import VersionConflictError
+from tests.helpers import seed, student
+
+
+def test_stale_save_raises_version_conflict(storage, open_storage):
+    seed(storage, members=[student(1)])
+    first, second = open_storage(), open_storage()
+    members = first.load_members()
+    second.save_members(second.load_members() + [student(2)])
+
+    with pytest.raises(VersionConflictError):
+        first.save_members(members + [student(3)])
+    assert [m["student_id"] for m in open_storage().load_members()] == [1, 2]
+
+    # Après relecture, la sauvegarde part de la dernière version
+    first.save_members(first.load_members() + [student(3)])
+    assert [m["student_id"] for m in open_storage().load_members()] == [1, 2, 3]
+
+
+def test_appends_do_not_conflict(storage, open_storage):
+    seed(storage, members=[student(1)])
+    first, second = open_storage(), open_storage()
+    first.load_members()
+    second.append_member(student(2))
+    first.append_member(student(3))
+    assert sorted(m["student_id"] for m in open_storage().load_members()) == [1, 2, 3]
+
+
+def test_every_write_bumps_the_version(storage):
+    seed(storage, members=[])
+    version = storage.get_version("members")
+    storage.append_member(student(1))
+    assert storage.get_version("members") == version + 1
+    storage.save_members(storage.load_members())
+    assert storage.get_version("members") == version + 2
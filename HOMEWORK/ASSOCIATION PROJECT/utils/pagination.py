@@ -0,0 +1,30 @@
+from __future__ import annotations
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from models.records import Record
+
+
+def paginate(records: Iterable[Dict[str, Any]], offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Retourne la tranche [offset, offset + limit) d'une séquence d'enregistrements.
+
+    `records` peut être un générateur : seuls les éléments de la page sont
+    matérialisés dans la liste retournée.
+    """
+    stop = None if limit is None else offset + limit
+    return list(islice(records, offset, stop))
+
+
+def project(records: List[Dict[str, Any]], fields: Optional[Sequence[str]]) -> List[Dict[str, Any]]:
+    """
+    Ne garde que les champs demandés de chaque enregistrement (tous si `fields` est vide).
+
+    Pour un enregistrement décodé, seuls ses champs stockés comptent (voir Record.to_dict).
+    """
+    if not fields:
+        return records
+    projected = []
+    for record in records:
+        data = record.to_dict() if isinstance(record, Record) else record
+        projected.append({field: data[field] for field in fields if field in data})
+    return projected
@@ -1,2 +1,2 @@
-# Views package
-
+# Views package
+
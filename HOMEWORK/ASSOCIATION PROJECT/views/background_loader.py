@@ -0,0 +1,130 @@
+"""
+Travaux de la GUI exécutés hors du thread Tk.
+
+Un seul thread de travail exécute les travaux (chargements du storage,
+mises à jour du modèle de vue, tri et formatage des lignes) dans l'ordre
+de soumission : les travaux n'ont donc jamais besoin de se synchroniser
+entre eux. Leurs résultats reviennent par une file lue périodiquement
+(root.after) : les callbacks s'exécutent toujours sur le thread Tk, le
+seul autorisé à toucher aux widgets.
+"""
+from __future__ import annotations
+import logging
+import queue
+import threading
+import tkinter as tk
+from typing import Any, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+# Intervalle de lecture de la file des résultats (ms)
+POLL_MS = 30
+
+
+class BackgroundLoader:
+    """
+    File de travaux d'un thread de travail, résultats rendus au thread Tk.
+
+    Un travail peut porter une clé (ex. le nom d'un onglet) : soumettre un
+    nouveau travail pour la même clé, ou appeler cancel(key), rend le
+    précédent obsolète. Un travail obsolète qui n'a pas commencé n'est pas
+    exécuté ; s'il est en cours, son résultat est ignoré.
+    """
+
+    def __init__(self, root: tk.Misc, poll_ms: int = POLL_MS) -> None:
+        self._root = root
+        self._poll_ms = poll_ms
+        self._jobs: queue.Queue = queue.Queue()
+        self._results: queue.Queue = queue.Queue()
+        # Dernier ticket de chaque clé ; lu par le thread de travail
+        self._latest: Dict[Hashable, int] = {}
+        self._latest_lock = threading.Lock()
+        self._tickets = 0
+        self._outstanding = 0
+        self._polling = False
+        self._worker = threading.Thread(target=self._run, name="gui-loader", daemon=True)
+        self._worker.start()
+
+    # ==================== THREAD TK ====================
+
+    def submit(self, work: Callable[[], Any], on_done: Callable[[Any], None] | None = None,
+               key: Hashable | None = None, on_error: Callable[[BaseException], None] | None = None) -> int:
+        """
+        Soumet un travail ; on_done(résultat) ou on_error(exception) sera appelé sur le thread Tk.
+
+        Returns:
+            Ticket du travail
+        """
+        self._tickets += 1
+        ticket = self._tickets
+        if key is not None:
+            with self._latest_lock:
+                self._latest[key] = ticket
+        self._outstanding += 1
+        self._jobs.put((ticket, key, work, on_done, on_error))
+        if not self._polling:
+            self._polling = True
+            self._root.after(self._poll_ms, self._poll)
+        return ticket
+
+    def cancel(self, key: Hashable) -> None:
+        """Rend obsolète le travail en attente ou en cours pour cette clé"""
+        with self._latest_lock:
+            self._latest.pop(key, None)
+
+    def pending(self, key: Hashable) -> bool:
+        """Vrai si un travail de cette clé attend ou s'exécute encore"""
+        with self._latest_lock:
+            return key in self._latest
+
+    def close(self) -> None:
+        """Arrête le thread de travail après les travaux en file"""
+        self._jobs.put(None)
+
+    def _poll(self) -> None:
+        while True:
+            try:
+                ticket, key, on_done, on_error, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            if key is not None:
+                with self._latest_lock:
+                    if self._latest.get(key) != ticket:
+                        continue
+                    del self._latest[key]
+            if error is not None:
+                if on_error is not None:
+                    on_error(error)
+                else:
+                    logger.error("Travail en arrière-plan échoué", exc_info=error)
+            elif on_done is not None:
+                on_done(result)
+        if self._outstanding:
+            self._root.after(self._poll_ms, self._poll)
+        else:
+            self._polling = False
+
+    # ==================== THREAD DE TRAVAIL ====================
+
+    def _is_stale(self, ticket: int, key: Hashable | None) -> bool:
+        if key is None:
+            return False
+        with self._latest_lock:
+            return self._latest.get(key) != ticket
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            ticket, key, work, on_done, on_error = job
+            result: Any = None
+            error: BaseException | None = None
+            if not self._is_stale(ticket, key):
+                try:
+                    result = work()
+                except Exception as exc:
+                    error = exc
+            # Toujours rendu (même obsolète) : le thread Tk tient le compte des travaux en cours
+            self._results.put((ticket, key, on_done, on_error, result, error))
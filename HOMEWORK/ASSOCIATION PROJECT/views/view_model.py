@@ -0,0 +1,285 @@
+"""
+Modèle de vue de la GUI : données affichées et lignes des tableaux.
+
+Chargé une fois depuis le tableau de bord (load), il est ensuite tenu à
+jour par les notifications des contrôleurs (apply) : l'enregistrement
+ajouté ou supprimé est reporté dans la seule liste concernée, sans relire
+les autres collections. Les dépendances entre onglets (noms des membres
+dans les événements, groupes, abonnements) sont trouvées par les index des
+contrôleurs (participation, groupes, abonnements par étudiant).
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Set
+
+from managers.group_index import group_key
+from managers.participation_index import member_key
+from managers.search_index import SearchIndex
+from models.records import decode_donation, decode_member, decode_subscription
+from views.web_view import _build_member_maps, _parse_events, _parse_groups, _split_members
+
+TABS = ("students", "teachers", "groups", "events", "subscriptions", "donations")
+
+# Champs cherchés par la recherche des onglets de membres
+SEARCH_FIELDS = ("full_name", "email", "phone", "skills")
+
+
+class DashboardViewModel:
+    """
+    Listes affichées par GUIView et lignes de leurs tableaux.
+
+    apply(event_type, data) reporte une notification et retourne les
+    onglets à redessiner. Les lignes (rows) sont mémorisées par
+    enregistrement : après un delta, seules celles des enregistrements
+    nouveaux ou remplacés sont formatées. Les événements et groupes à
+    relire (noms des membres) ne sont relus qu'à leur prochaine lecture.
+    Les listes des membres ont une version, incrémentée à chaque
+    changement : l'index de recherche d'un onglet est construit une fois
+    par version.
+    """
+
+    def __init__(self, controller: Any = None) -> None:
+        self._controller = controller
+        self.students: List[Any] = []
+        self.teachers: List[Any] = []
+        self._events: List[Dict[str, Any]] = []
+        self._groups: List[Dict[str, Any]] = []
+        # Listes à relire depuis les contrôleurs à leur prochaine lecture ("events", "groups")
+        self._stale: Set[str] = set()
+        self.subs: List[Any] = []
+        self.donations: List[Any] = []
+        self._student_names: Dict[int, str] = {}
+        self._teacher_names: Dict[int, str] = {}
+        # Onglet -> id(enregistrement) -> (enregistrement, ligne formatée)
+        self._rows: Dict[str, Dict[int, tuple[Any, List[str]]]] = {tab: {} for tab in TABS}
+        # Versions des listes des membres et index de recherche : onglet -> (version, index)
+        self._versions: Dict[str, int] = {"students": 0, "teachers": 0}
+        self._search: Dict[str, tuple[int, SearchIndex]] = {}
+
+    # ==================== CHARGEMENT ====================
+
+    def load(self, project: Dict[str, Any]) -> None:
+        """Charge toutes les listes depuis le tableau de bord (get_dashboard_data)"""
+        self.students, self.teachers = _split_members(project.get("members", []))
+        self._student_names, self._teacher_names = _build_member_maps(self.students, self.teachers)
+        self._events = _parse_events(project.get("events", []), self._student_names, self._teacher_names)
+        self._groups = _parse_groups(project.get("groups", []), self._student_names, self._teacher_names)
+        self._stale.clear()
+        self.subs = list(project.get("subscriptions", []))
+        self.donations = list(project.get("donations", []))
+        for rows in self._rows.values():
+            rows.clear()
+        self._changed("students", "teachers")
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        if "events" in self._stale:
+            # Événements du cache du contrôleur (aucune relecture du storage s'il est à jour)
+            self._stale.discard("events")
+            records = self._controller.get_event_controller().get_all_events()
+            self._events = _parse_events(records, self._student_names, self._teacher_names)
+        return self._events
+
+    @property
+    def groups(self) -> List[Dict[str, Any]]:
+        if "groups" in self._stale:
+            # Groupes servis par les index des groupes et des membres
+            self._stale.discard("groups")
+            records = self._controller.get_group_controller().get_groups()
+            self._groups = _parse_groups(records, self._student_names, self._teacher_names)
+        return self._groups
+
+    # ==================== NOTIFICATIONS ====================
+
+    def apply(self, event_type: str, data: Any = None) -> Set[str]:
+        """
+        Reporte une notification d'un contrôleur.
+
+        Returns:
+            Onglets dont le contenu a changé
+        """
+        if self._controller is None:
+            return set()
+        if event_type.startswith(("member_added_", "member_deleted_")):
+            member_type = event_type.rsplit("_", 1)[-1]
+            if member_type not in ("student", "teacher"):
+                return set()
+            if event_type.startswith("member_added_"):
+                return self._member_added(member_type, data)
+            return self._member_deleted(member_type, data.get("id"))
+        if event_type == "member_updated":
+            return self._students_updated(data)
+        if event_type == "event_added":
+            # Liste à relire : elle contiendra déjà l'événement
+            if "events" not in self._stale:
+                self._events.extend(_parse_events([data], self._student_names, self._teacher_names))
+            return {"events"}
+        if event_type == "event_deleted":
+            if "events" not in self._stale:
+                self._events = [e for e in self._events if e["event_name"] != data.get("event_name")]
+            return {"events"}
+        if event_type == "event_updated":
+            return self._reload_events()
+        if event_type == "group_updated":
+            return self._reload_groups()
+        if event_type == "subscription_added":
+            self.subs.append(decode_subscription(data))
+            return {"subscriptions"}
+        if event_type == "subscription_deleted":
+            return self._subscriptions_deleted(data)
+        if event_type == "donation_added":
+            self.donations.append(decode_donation(data))
+            return {"donations"}
+        if event_type == "donation_deleted":
+            return self._donations_deleted(data)
+        return set()
+
+    def _member_added(self, member_type: str, member: Dict[str, Any]) -> Set[str]:
+        record = decode_member(member)
+        if member_type == "student":
+            self.students.append(record)
+        else:
+            self.teachers.append(record)
+        self._changed(f"{member_type}s")
+        self._rename(member_type, record.get(f"{member_type}_id"), record.get("full_name", ""))
+        changed = {f"{member_type}s"} | self._dependents(member_type, record.get(f"{member_type}_id"))
+        if member_type == "student" and group_key(record.get("groupe")) is not None:
+            changed |= self._reload_groups()
+        return changed
+
+    def _member_deleted(self, member_type: str, member_id: Any) -> Set[str]:
+        key = member_key(member_id)
+        id_field = f"{member_type}_id"
+        members = self.students if member_type == "student" else self.teachers
+        removed = [m for m in members if member_key(m.get(id_field)) == key]
+        kept = [m for m in members if member_key(m.get(id_field)) != key]
+        if member_type == "student":
+            self.students = kept
+        else:
+            self.teachers = kept
+        self._changed(f"{member_type}s")
+        self._rename(member_type, member_id, None)
+        changed = {f"{member_type}s"} | self._dependents(member_type, member_id)
+        # Un étudiant supprimé quitte aussi la liste des élèves de son groupe
+        if any(group_key(m.get("groupe")) is not None for m in removed if member_type == "student"):
+            changed |= self._reload_groups()
+        return changed
+
+    def _students_updated(self, data: Dict[str, Any]) -> Set[str]:
+        """Changement de groupe (update_student_group, regroup_students) : étudiants relus par l'index"""
+        ids = data.get("student_ids") or [data.get("student_id")]
+        keys = {member_key(student_id) for student_id in ids}
+        members = self._controller.get_member_controller()
+        self.students = [
+            (members.get_member_by_id(s.get("student_id"), "student") or s)
+            if member_key(s.get("student_id")) in keys else s
+            for s in self.students
+        ]
+        self._changed("students")
+        return {"students"} | self._reload_groups()
+
+    def _subscriptions_deleted(self, data: Dict[str, Any]) -> Set[str]:
+        # Sans date : tous les abonnements de l'étudiant (suppression en cascade)
+        key, date = member_key(data.get("student_id")), data.get("date")
+        self.subs = [
+            s for s in self.subs
+            if not (member_key(s.get("student_id")) == key and (date is None or str(s.get("date")) == str(date)))
+        ]
+        return {"subscriptions"}
+
+    def _donations_deleted(self, data: Dict[str, Any]) -> Set[str]:
+        # Mêmes critères que FinanceController.delete_donation
+        def deleted(d: Any) -> bool:
+            try:
+                amount = float(d.get("amount", 0))
+            except (TypeError, ValueError):
+                return False
+            return (d.get("donor_name") == data.get("donor_name") and str(d.get("date")) == str(data.get("date"))
+                    and amount == data.get("amount"))
+
+        self.donations = [d for d in self.donations if not deleted(d)]
+        return {"donations"}
+
+    def student_name(self, student_id: Any) -> str | None:
+        """Nom d'un étudiant affiché, None s'il est inconnu"""
+        try:
+            return self._student_names.get(int(student_id))
+        except (TypeError, ValueError):
+            return None
+
+    # ==================== DÉPENDANCES ENTRE ONGLETS ====================
+
+    def _rename(self, member_type: str, member_id: Any, name: str | None) -> None:
+        names = self._student_names if member_type == "student" else self._teacher_names
+        try:
+            key = int(member_id)
+        except (TypeError, ValueError):
+            return
+        if name is None:
+            names.pop(key, None)
+        else:
+            names[key] = name
+
+    def _dependents(self, member_type: str, member_id: Any) -> Set[str]:
+        """Onglets qui affichent le nom de ce membre (trouvés par les index des contrôleurs)"""
+        changed: Set[str] = set()
+        events = self._controller.get_event_controller()
+        cited = (events.get_events_for_student(member_id, limit=1) if member_type == "student"
+                 else events.get_events_for_teacher(member_id, limit=1))
+        if cited:
+            changed |= self._reload_events()
+        if member_type == "student":
+            if self._controller.get_finance_controller().get_subscriptions_by_student(member_id):
+                # Nom de l'étudiant affiché dans chaque ligne : lignes à reformater
+                self._rows["subscriptions"].clear()
+                changed.add("subscriptions")
+        elif self._controller.get_group_controller().get_groups_of_teacher(member_id):
+            changed |= self._reload_groups()
+        return changed
+
+    def _reload_events(self) -> Set[str]:
+        self._stale.add("events")
+        return {"events"}
+
+    def _reload_groups(self) -> Set[str]:
+        self._stale.add("groups")
+        return {"groups"}
+
+    # ==================== RECHERCHE ====================
+
+    def _changed(self, *tabs: str) -> None:
+        for tab in tabs:
+            self._versions[tab] += 1
+
+    def version(self, tab: str) -> int:
+        """Version de la liste des membres d'un onglet ("students" / "teachers")"""
+        return self._versions[tab]
+
+    def search_index(self, tab: str) -> SearchIndex:
+        """Index de recherche de la version courante d'un onglet de membres (construit au besoin)"""
+        version = self._versions[tab]
+        cached = self._search.get(tab)
+        if cached is None or cached[0] != version:
+            members = self.students if tab == "students" else self.teachers
+            cached = self._search[tab] = (version, SearchIndex(members, SEARCH_FIELDS))
+        return cached[1]
+
+    # ==================== LIGNES DES TABLEAUX ====================
+
+    def rows(self, tab: str, records: List[Any], format_row: Callable[[Any], List[str]]) -> List[List[str]]:
+        """
+        Lignes d'un onglet, dans l'ordre de `records`.
+
+        Seuls les enregistrements absents de la mémoire de l'onglet sont
+        formatés ; les lignes des enregistrements disparus sont oubliées.
+        """
+        known = self._rows[tab]
+        current: Dict[int, tuple[Any, List[str]]] = {}
+        rows: List[List[str]] = []
+        for record in records:
+            entry = known.get(id(record))
+            if entry is None or entry[0] is not record:
+                entry = (record, format_row(record))
+            current[id(record)] = entry
+            rows.append(entry[1])
+        self._rows[tab] = current
+        return rows
@@ -0,0 +1,235 @@
+"""
+Tableau virtualisé pour la GUI Tkinter.
+
+Seules les lignes visibles existent : un Canvas garde un petit ensemble de
+lignes (un rectangle de fond et un texte par colonne), réutilisées au
+défilement en changeant leurs textes et couleurs. Afficher ou faire défiler
+un tableau de 5 000 ou de 50 lignes coûte donc le même nombre d'objets
+graphiques, au lieu d'un tk.Label (et de deux bindings) par cellule.
+"""
+from __future__ import annotations
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Colonnes dont la valeur est un statut d'abonnement coloré
+STATUS_COLUMNS = ("subscription", "status")
+
+_FONT_FAMILY = "Segoe UI"
+# Marges intérieures des cellules (comme padx=12 / pady=8 des anciens tk.Label)
+_PAD_X = 12
+_PAD_Y = 8
+
+
+def status_color(column: str, text: str, colors: Dict[str, str]) -> str | None:
+    """Couleur d'un statut (paid / pending / unpaid, overdue) dans une colonne de statut, sinon None"""
+    if column.lower() not in STATUS_COLUMNS:
+        return None
+    status = str(text).lower()
+    if status == "paid":
+        return colors["success"]
+    if status == "pending":
+        return colors["warning"]
+    if status in ("unpaid", "overdue"):
+        return colors["danger"]
+    return None
+
+
+class RowWindow:
+    """
+    Fenêtre de lignes visibles : première ligne affichée et défilement.
+
+    Indépendante de Tk, elle traduit les commandes de la barre de défilement
+    (moveto, scroll) en première ligne et donne la position du curseur.
+    `visible` compte les lignes entièrement visibles ; la ligne coupée par
+    le bas de la zone est affichée en plus.
+    """
+
+    def __init__(self, total: int = 0, visible: int = 1) -> None:
+        self.total = total
+        self.visible = max(1, visible)
+        self.top = 0
+
+    def resize(self, total: int | None = None, visible: int | None = None) -> None:
+        if total is not None:
+            self.total = total
+        if visible is not None:
+            self.visible = max(1, visible)
+        self.top = self._clamp(self.top)
+
+    def moveto(self, fraction: float) -> None:
+        self.top = self._clamp(round(fraction * self.total))
+
+    def scroll(self, count: int, what: str = "units") -> None:
+        step = self.visible - 1 if what == "pages" else 1
+        self.top = self._clamp(self.top + count * max(1, step))
+
+    def rows(self) -> range:
+        """Index des lignes à afficher"""
+        return range(self.top, min(self.total, self.top + self.visible + 1))
+
+    def fractions(self) -> Tuple[float, float]:
+        """(début, fin) visibles, pour ttk.Scrollbar.set"""
+        if not self.total:
+            return 0.0, 1.0
+        return self.top / self.total, min(1.0, (self.top + self.visible) / self.total)
+
+    def _clamp(self, top: int) -> int:
+        return max(0, min(top, self.total - self.visible))
+
+
+class VirtualTable(tk.Frame):
+    """
+    Tableau à en-tête fixe dont seules les lignes visibles sont dessinées.
+
+    Args:
+        columns: (titre, largeur en caractères) de chaque colonne
+        rows: Lignes de textes (une valeur par colonne)
+        colors: Thème de la GUI (COLORS de views/gui_view.py)
+    """
+
+    def __init__(self, parent: tk.Widget, columns: List[Tuple[str, int]],
+                 rows: Sequence[Sequence[str]], colors: Dict[str, str]) -> None:
+        super().__init__(parent, bg=colors["bg_main"])
+        self._columns = columns
+        self._rows: Sequence[Sequence[str]] = rows
+        self._colors = colors
+        self._font = tkfont.Font(self, family=_FONT_FAMILY, size=10)
+        self._bold = tkfont.Font(self, family=_FONT_FAMILY, size=10, weight="bold")
+        self._row_height = self._font.metrics("linespace") + 2 * _PAD_Y
+        # Abscisse et largeur de chaque colonne (largeur en caractères "0", comme tk.Label)
+        char = self._font.measure("0")
+        self._x: List[int] = []
+        self._widths: List[int] = []
+        x = 0
+        for _, width in columns:
+            self._x.append(x)
+            self._widths.append(width * char + 2 * _PAD_X)
+            x += self._widths[-1]
+        self._table_width = x
+        self._window = RowWindow(len(rows))
+        # Lignes graphiques réutilisées : (rectangle de fond, textes des cellules)
+        self._pool: List[Tuple[int, List[int]]] = []
+        self._hover: int | None = None
+
+        self._header = tk.Canvas(self, bg=colors["bg_header"], height=self._row_height + 4,
+                                 highlightthickness=0, borderwidth=0)
+        self._canvas = tk.Canvas(self, bg=colors["bg_table"], highlightthickness=0, borderwidth=0)
+        self._scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._yview)
+        self._draw_header()
+
+        self._header.pack(side=tk.TOP, fill=tk.X)
+        self._scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self._canvas.bind("<Configure>", self._on_configure)
+        self._canvas.bind("<Motion>", self._on_motion)
+        self._canvas.bind("<Leave>", self._on_leave)
+        # Molette : Windows / macOS (<MouseWheel>) et X11 (<Button-4/5>)
+        for widget in (self._canvas, self._header):
+            widget.bind("<MouseWheel>", self._on_mousewheel)
+            widget.bind("<Button-4>", lambda e: self._scroll(-1))
+            widget.bind("<Button-5>", lambda e: self._scroll(1))
+
+    # ==================== DONNÉES ====================
+
+    def set_rows(self, rows: Sequence[Sequence[str]]) -> None:
+        """Remplace les lignes affichées (la position de défilement est conservée si possible)"""
+        self._rows = rows
+        self._window.resize(total=len(rows))
+        self._render()
+
+    # ==================== DESSIN ====================
+
+    def _draw_header(self) -> None:
+        for (title, _), x in zip(self._columns, self._x):
+            self._header.create_text(x + _PAD_X, self._row_height // 2 + 2, text=title, anchor=tk.W,
+                                     font=self._bold, fill=self._colors["text_muted"])
+
+    def _on_configure(self, event: Any) -> None:
+        visible = max(1, event.height // self._row_height)
+        self._window.resize(visible=visible)
+        while len(self._pool) < visible + 1:
+            self._pool.append(self._create_row(len(self._pool)))
+        # Fonds de ligne sur toute la largeur (pour le survol)
+        right = max(self._table_width, event.width)
+        for slot, (background, _) in enumerate(self._pool):
+            y = slot * self._row_height
+            self._canvas.coords(background, 0, y, right, y + self._row_height)
+        self._render()
+
+    def _create_row(self, slot: int) -> Tuple[int, List[int]]:
+        y = slot * self._row_height
+        background = self._canvas.create_rectangle(0, y, self._table_width, y + self._row_height, width=0)
+        texts = [
+            self._canvas.create_text(x + _PAD_X, y + self._row_height // 2, anchor=tk.W, font=self._font)
+            for x in self._x
+        ]
+        return background, texts
+
+    def _render(self) -> None:
+        """Redessine les lignes visibles en réutilisant les lignes graphiques"""
+        canvas = self._canvas
+        rows = self._window.rows()
+        for slot, (background, texts) in enumerate(self._pool):
+            index = rows.start + slot
+            if index >= rows.stop:
+                canvas.itemconfigure(background, state=tk.HIDDEN)
+                for text in texts:
+                    canvas.itemconfigure(text, state=tk.HIDDEN)
+                continue
+            row = self._rows[index]
+            canvas.itemconfigure(background, state=tk.NORMAL, fill=self._background(slot, index))
+            for column, (text, (title, width)) in enumerate(zip(texts, self._columns)):
+                value = str(row[column]) if column < len(row) else ""
+                color = status_color(title, value, self._colors)
+                canvas.itemconfigure(
+                    text,
+                    state=tk.NORMAL,
+                    text=value if len(value) <= width else value[:max(1, width - 1)] + "…",
+                    fill=color or self._colors["text_main"],
+                    font=self._bold if color else self._font,
+                )
+        self._scrollbar.set(*self._window.fractions())
+
+    def _background(self, slot: int, index: int) -> str:
+        if slot == self._hover:
+            return self._colors["bg_table_hover"]
+        return self._colors["bg_table_alt"] if index % 2 == 0 else self._colors["bg_table"]
+
+    # ==================== DÉFILEMENT ET SURVOL ====================
+
+    def _yview(self, *args: Any) -> None:
+        """Commande de la barre de défilement ("moveto", f) ou ("scroll", n, "units" | "pages")"""
+        if args and args[0] == "moveto":
+            self._window.moveto(float(args[1]))
+        elif args and args[0] == "scroll":
+            self._window.scroll(int(args[1]), args[2])
+        self._render()
+
+    def _on_mousewheel(self, event: Any) -> None:
+        # Windows : multiples de 120 ; macOS : petits deltas
+        self._scroll(int(-1 * (event.delta / 120)) or (-1 if event.delta > 0 else 1))
+
+    def _scroll(self, count: int) -> None:
+        top = self._window.top
+        self._window.scroll(count)
+        if self._window.top != top:
+            self._render()
+
+    def _on_motion(self, event: Any) -> None:
+        slot = int(event.y // self._row_height)
+        self._set_hover(slot if slot < len(self._window.rows()) else None)
+
+    def _on_leave(self, event: Any) -> None:
+        self._set_hover(None)
+
+    def _set_hover(self, slot: int | None) -> None:
+        if slot == self._hover:
+            return
+        previous, self._hover = self._hover, slot
+        for changed in (previous, slot):
+            if changed is not None and changed < len(self._pool):
+                index = self._window.top + changed
+                self._canvas.itemconfigure(self._pool[changed][0], fill=self._background(changed, index))